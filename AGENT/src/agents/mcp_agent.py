@@ -1,12 +1,13 @@
 import os
+import time
 import asyncio
-from typing import TypedDict, List, Annotated, Sequence
+from typing import TypedDict, List, Annotated, Sequence, Dict, Any, Optional
 from operator import add
 import json
 import re
+import ast
 
 from dotenv import load_dotenv
-from langchain_google_vertexai import ChatVertexAI
 from langchain.agents import create_react_agent
 from langchain_core.messages import HumanMessage, AIMessage, BaseMessage, ToolMessage, SystemMessage
 from langgraph.graph import StateGraph, END
@@ -18,27 +19,17 @@ from langchain_core.exceptions import OutputParserException
 # MCP imports
 from langchain_mcp_adapters.client import MultiServerMCPClient
 
+from utils.metrics import MCP_TOOL_DURATION, CRM_AGENT_RUNS, record_request_timing
+from utils.mcp_session import MCPSessionManager, MCP_PERSISTENT_SESSION
+from utils.mcp_inprocess import load_inprocess_tools, MCP_TRANSPORT
+from utils.model_registry import get_chat_model, GCP_PROJECT_ID, GOOGLE_LOCATION
+from utils.gcp_auth import configure_gcp_credentials
+
 # --- 1. Load environment variables (from .env file) ---
 load_dotenv()
 
 # --- 2. Set the GOOGLE_APPLICATION_CREDENTIALS environment variable in code ---
-try:
-    # It's generally better to let dotenv handle this if the path is in .env,
-    # but if it must be hardcoded for deployment or specific setups, this is fine.
-    # Ensure this path is correct for your environment.
-    service_account_key_path = r"C:\Users\Admin\Downloads\geminimcp-464809-eee97d96077e.json"
-    if not os.path.exists(service_account_key_path):
-        raise FileNotFoundError(f"Service account key file not found at: {service_account_key_path}")
-    os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = service_account_key_path
-    print(f"[Agent Setup] GOOGLE_APPLICATION_CREDENTIALS set to: {service_account_key_path}")
-except FileNotFoundError as e:
-    print(f"[Fatal Error] {e}")
-    print("Please ensure the service account JSON key file exists at the specified path.")
-    raise
-
-# Set your GCP Project ID and Location from .env or default
-GCP_PROJECT_ID = os.getenv("GCP_PROJECT_ID", "geminimcp-464809")
-GOOGLE_LOCATION = os.getenv("GOOGLE_LOCATION", "us-central1")
+configure_gcp_credentials("Agent")
 
 # IMPORTANT: This MCP_CORE_PATH now points to your *separate* MCP Server (defaulting to 8001)
 # Ensure your CRM MCP server is running on this port.
@@ -48,6 +39,7 @@ MCP_CORE_PATH = os.getenv("MCP_CORE_PATH", "http://127.0.0.1:8001/mcp")
 llm = None
 mcp_tools = None
 mcp_client = None
+mcp_session = None  # MCPSessionManager when MCP_PERSISTENT_SESSION is on
 langgraph_app = None
 agent_prompt = None
 
@@ -57,17 +49,109 @@ class AgentState(TypedDict):
     chat_history: List[BaseMessage]
     agent_outcome: Annotated[Sequence[BaseMessage], add] # This is what LangGraph updates
 
+# --- Agent Result ---
+class CRMAgentResult:
+    """
+    Outcome of one CRM agent run, judged from what happened during the run rather than
+    from the wording of the answer:
+    - success: the agent gave a final answer and got data from at least one tool (or used
+      none and tools were not required)
+    - no_data: every tool call came back empty (e.g. the record does not exist), or tools were
+      required and the agent answered without calling any
+    - tool_error: no tool call returned data and at least one failed
+    - agent_error: the agent itself failed or finished without a final answer
+    """
+    SUCCESS = "success"
+    NO_DATA = "no_data"
+    TOOL_ERROR = "tool_error"
+    AGENT_ERROR = "agent_error"
+
+    def __init__(self, status: str, final_text: str, tools_used: Optional[List[str]] = None,
+                 tool_errors: Optional[List[Dict[str, str]]] = None, iterations: int = 0,
+                 timings: Optional[Dict[str, float]] = None):
+        self.status = status
+        self.final_text = final_text
+        self.tools_used = tools_used or []        # tool names in call order
+        self.tool_errors = tool_errors or []      # {"tool": name, "error": observation}
+        self.iterations = iterations              # LLM reasoning steps
+        self.timings = timings or {}              # total / llm / tools seconds
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status == self.SUCCESS
+
+    @classmethod
+    def status_for(cls, tool_outcomes: List[str], require_tools: bool = False) -> str:
+        """
+        Status of a run that ended with a final answer, from the outcome of each tool call
+        ("error", "empty" or "data", see _classify_observation). With `require_tools`, an
+        answer given without calling any tool counts as no data.
+        """
+        if not tool_outcomes:
+            return cls.NO_DATA if require_tools else cls.SUCCESS
+        if "data" in tool_outcomes:
+            return cls.SUCCESS
+        return cls.TOOL_ERROR if "error" in tool_outcomes else cls.NO_DATA
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "final_text": self.final_text,
+            "tools_used": self.tools_used,
+            "tool_errors": self.tool_errors,
+            "iterations": self.iterations,
+            "timings": self.timings,
+        }
+
+    def __repr__(self) -> str:
+        return (f"CRMAgentResult(status={self.status!r}, tools_used={self.tools_used}, "
+                f"tool_errors={len(self.tool_errors)}, iterations={self.iterations})")
+
+def _parse_observation(observation: Any) -> Any:
+    """The tool's return value from its observation text (JSON or a Python literal); other text as is."""
+    if not isinstance(observation, str):
+        return observation
+    text = observation.strip()
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        return text
+
+def _classify_observation(observation: Any) -> str:
+    """
+    "error", "empty" or "data" for a tool observation. Tools that catch their own failures
+    return {"error": ...}; batch tools return {"results": {...}, "errors": {...}} and only
+    count as data when at least one ID resolved. None (a missing record) and empty
+    results carry no data.
+    """
+    value = _parse_observation(observation)
+    if isinstance(value, dict):
+        if value.get("error") is not None:
+            return "error"
+        if "results" in value and "errors" in value:
+            if value["results"]:
+                return "data"
+            return "error" if value["errors"] else "empty"
+    if value is None or value in ("", "None") or (isinstance(value, (list, dict)) and not value):
+        return "empty"
+    return "data"
+
 # --- Initialize Agent Components (async function) ---
+def _set_mcp_tools(tools):
+    """Swaps in the tools of a new MCP session (after a reconnect or a tool list change)."""
+    global mcp_tools
+    mcp_tools = tools
+
 async def _initialize_agent_components():
-    global llm, mcp_tools, mcp_client, agent_prompt
+    global llm, mcp_tools, mcp_client, mcp_session, agent_prompt
 
     print(f"[Agent Setup] Initializing Gemini LLM with project: {GCP_PROJECT_ID}, location: {GOOGLE_LOCATION}")
-    llm = ChatVertexAI(
-        model_name="gemini-2.5-pro", # Or "gemini-1.5-pro" or "gemini-1.0-pro" based on availability/preference
-        temperature=0,
-        project=GCP_PROJECT_ID,
-        location=GOOGLE_LOCATION
-    )
+    # The "crm_agent" role's model from the model registry (pro tier by default)
+    llm = get_chat_model("crm_agent")
     try:
         test_response = await llm.ainvoke([HumanMessage(content="Hello Gemini! Are you awake?")])
         print(f"[Agent Setup] Gemini test response: {test_response.content[:50]}...")
@@ -78,17 +162,26 @@ async def _initialize_agent_components():
 
     print(f"[Agent] Using Vertex AI Gemini model: {llm.model_name}")
 
-    print(f"[Agent] Connecting to MCP Core at: {MCP_CORE_PATH}")
+    print(f"[Agent] Connecting to MCP Core at: {MCP_CORE_PATH if MCP_TRANSPORT != 'inprocess' else 'in-process'}")
     mcp_servers_config = {
         "crm": { # The key "crm" here corresponds to the 'context' you set in your FastMCP server
             "transport": "streamable_http",
             "url": MCP_CORE_PATH
         }
     }
-    mcp_client = MultiServerMCPClient(mcp_servers_config)
 
     try:
-        mcp_tools = await mcp_client.get_tools()
+        if MCP_TRANSPORT == "inprocess":
+            # Same host: call the FastMCP tool functions directly instead of going over HTTP
+            mcp_tools = await load_inprocess_tools()
+        elif MCP_PERSISTENT_SESSION:
+            # One long-lived session shared by all tool calls instead of a handshake per call
+            if mcp_session is None:
+                mcp_session = MCPSessionManager("crm", mcp_servers_config["crm"], on_tools=_set_mcp_tools)
+            mcp_tools = await mcp_session.start()
+        else:
+            mcp_client = MultiServerMCPClient(mcp_servers_config)
+            mcp_tools = await mcp_client.get_tools()
     except Exception as e:
         raise ValueError(
             f"Failed to load tools from MCP Core. Ensure your MCP server is running correctly at {MCP_CORE_PATH}. Error: {e}"
@@ -106,6 +199,40 @@ async def _initialize_agent_components():
     print("[Agent Setup] Using base 'hwchase17/react-chat' prompt from LangChain Hub.")
 
 
+# Batch CRM tools and the name of the list parameter each one takes.
+BATCH_TOOL_LIST_PARAMS = {
+    "get_leads_info_batch": "ids",
+    "get_sales_opportunities_by_ids": "opportunityIds",
+    "get_opportunities_by_ids_with_items": "ids_or_opportunity_ids",
+}
+
+def _extract_id_list(tool_input_from_llm, list_key: str) -> list:
+    """
+    Extracts a list of IDs for a batch tool from whatever the LLM produced:
+    a dict (optionally nested under 'input'), a JSON string, or a plain
+    comma-separated string such as "OPP00001, OPP00002".
+    """
+    parsed = tool_input_from_llm
+    if isinstance(parsed, str):
+        try:
+            parsed = json.loads(parsed)
+        except json.JSONDecodeError:
+            return [part.strip().strip("'\"") for part in parsed.strip("[] ").split(",") if part.strip()]
+
+    if isinstance(parsed, dict):
+        if list_key in parsed:
+            parsed = parsed[list_key]
+        elif isinstance(parsed.get("input"), dict) and list_key in parsed["input"]:
+            parsed = parsed["input"][list_key]
+        else:
+            return []
+
+    if isinstance(parsed, list):
+        return parsed
+    if isinstance(parsed, (str, int)):
+        return [parsed]
+    return []
+
 # --- Graph Nodes ---
 async def call_agent(state: AgentState) -> dict:
     global llm, mcp_tools, agent_prompt 
@@ -142,7 +269,8 @@ async def call_agent(state: AgentState) -> dict:
         return {"agent_outcome": [AIMessage(content=raw_output)]}
     except Exception as e:
         print(f"[Agent] General error during agent_runnable.ainvoke: {e}")
-        return {"agent_outcome": [AIMessage(content=f"An error occurred while the AI was thinking: {e}")]}
+        return {"agent_outcome": [AIMessage(content=f"An error occurred while the AI was thinking: {e}",
+                                            additional_kwargs={"agent_error": type(e).__name__})]}
 
     # Ensure the output is always a list of BaseMessage for Annotated[Sequence[BaseMessage], add]
     if isinstance(agent_output, AgentFinish):
@@ -295,6 +423,37 @@ async def execute_tools(state: AgentState) -> dict:
                     
                     final_tool_argument_for_mcp = {"input": {"id_or_opportunity_id": str(param_value_extracted)}}
 
+                elif tool_name == "list_sales_leads":
+                    # Expects an object of optional filters; unwrap it if the LLM nested it under 'input'
+                    filters = tool_input_from_llm
+                    if isinstance(filters, str):
+                        try:
+                            filters = json.loads(filters) if filters.strip() else {}
+                        except json.JSONDecodeError:
+                            raise ValueError(f"Could not parse filters for '{tool_name}' from input: {tool_input_from_llm}")
+                    if not isinstance(filters, dict):
+                        filters = {}
+                    if isinstance(filters.get("input"), dict):
+                        filters = filters["input"]
+                    final_tool_argument_for_mcp = {"input": filters}
+
+                elif tool_name in BATCH_TOOL_LIST_PARAMS:
+                    # Batch tools expect a list of IDs under a tool-specific key
+                    list_key = BATCH_TOOL_LIST_PARAMS[tool_name]
+                    id_values = _extract_id_list(tool_input_from_llm, list_key)
+                    if not id_values:
+                        raise ValueError(f"Could not extract a list '{list_key}' for '{tool_name}' from input: {tool_input_from_llm}")
+
+                    if tool_name == "get_leads_info_batch":
+                        try:
+                            id_values = [int(value) for value in id_values]
+                        except ValueError:
+                            raise ValueError(f"Lead IDs {id_values} could not be converted to integers for '{tool_name}'.")
+                    else:
+                        id_values = [str(value) for value in id_values]
+
+                    final_tool_argument_for_mcp = {"input": {list_key: id_values}}
+
                 else:
                     # Fallback for any other tools or if LLM sends direct JSON
                     print(f"[Agent] Warning: Unrecognized or unhandled tool '{tool_name}'. Attempting generic input handling.")
@@ -309,20 +468,37 @@ async def execute_tools(state: AgentState) -> dict:
                             final_tool_argument_for_mcp = {"input": tool_input_from_llm}
 
                 print(f"[Agent] Calling tool: {tool_name} with processed input: {final_tool_argument_for_mcp}")
-                observation = await found_tool.ainvoke(final_tool_argument_for_mcp)
+                tool_start = time.perf_counter()
+                tool_status = "error"
+                try:
+                    if mcp_session is not None:
+                        observation = await mcp_session.call_tool(tool_name, final_tool_argument_for_mcp)
+                    else:
+                        observation = await found_tool.ainvoke(final_tool_argument_for_mcp)
+                    tool_status = "success"
+                finally:
+                    tool_elapsed = time.perf_counter() - tool_start
+                    MCP_TOOL_DURATION.observe(tool_elapsed, tool=tool_name, status=tool_status)
+                    record_request_timing(f"mcp_tool.{tool_name}", tool_elapsed)
                 
                 # Use getattr for tool_call_id for broader compatibility
                 tool_call_id_val = getattr(action, 'tool_call_id', str(id(action))) 
-                tool_messages.append(ToolMessage(content=str(observation), tool_call_id=tool_call_id_val))
+                observation_text = str(observation)
+                tool_messages.append(ToolMessage(
+                    content=observation_text, tool_call_id=tool_call_id_val, name=tool_name,
+                    status="error" if _classify_observation(observation) == "error" else "success"
+                ))
 
             except Exception as e:
                 error_msg = f"Error executing tool '{tool_name}': {type(e).__name__}: {e}"
                 print(f"[Agent Error] {error_msg}")
-                tool_messages.append(ToolMessage(content=error_msg, tool_call_id=getattr(action, 'tool_call_id', str(id(action)))))
+                tool_messages.append(ToolMessage(content=error_msg, tool_call_id=getattr(action, 'tool_call_id', str(id(action))),
+                                             name=tool_name, status="error"))
         else:
             error_msg = f"Tool '{tool_name}' not found in MCP client's loaded tools."
             print(f"[Agent Error] {error_msg}")
-            tool_messages.append(ToolMessage(content=error_msg, tool_call_id=getattr(action, 'tool_call_id', str(id(action)))))
+            tool_messages.append(ToolMessage(content=error_msg, tool_call_id=getattr(action, 'tool_call_id', str(id(action))),
+                                             name=tool_name, status="error"))
 
     return {"agent_outcome": tool_messages}
 
@@ -388,10 +564,21 @@ async def setup_agent_for_ui():
         _build_langgraph_app()
     return langgraph_app, mcp_tools
 
-async def invoke_agent_with_history(agent_app_instance, user_question: str, chat_history: List[BaseMessage]) -> str:
+async def shutdown_agent():
+    """Closes the persistent MCP session, if one was opened."""
+    global mcp_session
+    if mcp_session is not None:
+        await mcp_session.stop()
+        mcp_session = None
+
+async def invoke_agent_with_history(agent_app_instance, user_question: str, chat_history: List[BaseMessage],
+                                    require_tools: bool = False) -> CRMAgentResult:
     """
     Invokes the LangGraph agent with a new user question and previous chat history.
-    Returns the final string response from the agent.
+    Returns a CRMAgentResult: the final answer text plus the run's status, the tools it
+    called, their errors, the number of reasoning steps and where the time went.
+    Set `require_tools` when the caller has somewhere better to go (e.g. a SQL fallback) than
+    an answer the agent gave without looking anything up.
     """
     if agent_app_instance is None:
         raise RuntimeError("LangGraph agent_app is not initialized. Call setup_agent_for_ui first.")
@@ -403,18 +590,45 @@ async def invoke_agent_with_history(agent_app_instance, user_question: str, chat
     }
 
     final_result_message = None 
+    tools_used: List[str] = []
+    tool_errors: List[Dict[str, str]] = []
+    tool_outcomes: List[str] = []  # "error" / "empty" / "data" per tool call
+    iterations = 0
+    timings = {"llm": 0.0, "tools": 0.0}
+    run_start = step_start = time.perf_counter()
+
+    def tool_outcome_status() -> str:
+        # A final answer only counts as a success if the tools it relied on returned something
+        return CRMAgentResult.status_for(tool_outcomes, require_tools)
+
+    def build_result(status: str, final_text: str) -> CRMAgentResult:
+        timings["total"] = time.perf_counter() - run_start
+        result = CRMAgentResult(
+            status, final_text, tools_used, tool_errors, iterations,
+            {stage: round(seconds, 6) for stage, seconds in timings.items()}
+        )
+        CRM_AGENT_RUNS.inc(status=status)
+        print(f"[UI Backend Chat] CRM agent run finished: {result}")
+        return result
 
     try:
         print(f"[UI Backend Chat] Starting agent stream with user question: '{user_question}'")
         
         async for state_update in agent_app_instance.astream(initial_state):
             print(f"[UI Backend Chat] Received state_update in stream: {state_update}")
+            step_end = time.perf_counter()
+            step_elapsed, step_start = step_end - step_start, step_end
             
             # Identify which node just executed and extract its specific output
             if state_update: 
                 # state_update will have a single key representing the node name
                 node_name = list(state_update.keys())[0] 
                 node_output = state_update[node_name]
+                if node_name == "agent":
+                    iterations += 1
+                    timings["llm"] += step_elapsed
+                elif node_name == "tools":
+                    timings["tools"] += step_elapsed
                 
                 # Check the 'agent_outcome' sequence that was appended by the node
                 if "agent_outcome" in node_output and node_output["agent_outcome"]:
@@ -424,9 +638,16 @@ async def invoke_agent_with_history(agent_app_instance, user_question: str, chat
                         elif isinstance(msg, ToolMessage):
                             # Ensure content is string for printing
                             content_to_print = str(msg.content)
+                            tool_name = msg.name or "unknown"
+                            tools_used.append(tool_name)
+                            if msg.status == "error":
+                                tool_outcomes.append("error")
+                                tool_errors.append({"tool": tool_name, "error": content_to_print[:500]})
+                            else:
+                                tool_outcomes.append(_classify_observation(content_to_print))
                             if len(content_to_print) > 200:
                                 content_to_print = content_to_print[:200] + "..."
-                            print(f"[Trace] Tool Observation: {content_to_print}")
+                            print(f"[Trace] Tool Observation ({msg.status}): {content_to_print}")
                         elif isinstance(msg, AIMessage):
                             print(f"[Trace] AI Message (from LLM): {msg.content}")
                             final_result_message = msg 
@@ -447,23 +668,31 @@ async def invoke_agent_with_history(agent_app_instance, user_question: str, chat
         if raw_output_match:
             final_response = raw_output_match.group(1).strip()
             print(f"[UI Backend] Recovered partial LLM output: {final_response[:100]}...")
-        else:
-            final_response = f"An internal parsing error occurred: {type(e).__name__}: {e}. Please try again or contact support."
-        return final_response
+            return build_result(tool_outcome_status(), final_response)
+        final_response = f"An internal parsing error occurred: {type(e).__name__}: {e}. Please try again or contact support."
+        return build_result(CRMAgentResult.AGENT_ERROR, final_response)
         
     except Exception as e:
         print(f"[UI Backend] General error during agent invocation (LangGraph stream): {e}")
         import traceback
         traceback.print_exc() 
-        return f"An internal error occurred during processing: {type(e).__name__}: {e}. Please try again or contact support."
+        return build_result(
+            CRMAgentResult.AGENT_ERROR,
+            f"An internal error occurred during processing: {type(e).__name__}: {e}. Please try again or contact support."
+        )
 
     final_response = "No response from agent."
+    status = CRMAgentResult.AGENT_ERROR
     if final_result_message:
         if isinstance(final_result_message, AgentFinish):
             final_response = final_result_message.return_values.get("output", "Agent finished with no output.")
+            status = tool_outcome_status()
             print(f"[UI Backend Chat] Final AgentFinish output: {final_response}")
         elif isinstance(final_result_message, AIMessage):
             final_response = final_result_message.content
+            # call_agent turns its own failures into an AIMessage marked with the error type
+            if "agent_error" not in final_result_message.additional_kwargs:
+                status = tool_outcome_status()
             print(f"[UI Backend Chat] Final AIMessage content: {final_response}")
         elif isinstance(final_result_message, ToolMessage): # Should typically be an AIMessage or AgentFinish
             final_response = final_result_message.content
@@ -475,5 +704,4 @@ async def invoke_agent_with_history(agent_app_instance, user_question: str, chat
         print(f"[UI Backend Chat] No final result message (AgentFinish/AIMessage) was captured from the stream.")
         final_response = "The agent completed its process, but no final message or tool output was generated. This might indicate an issue with the LLM's final response generation or a state where it didn't explicitly finish."
 
-    return final_response
-
+    return build_result(status, final_response)
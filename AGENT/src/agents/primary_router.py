@@ -1,22 +1,19 @@
 import json
-import os
 from typing import Dict, Any, List, Optional
-from dotenv import load_dotenv
 import logging
 
-from langchain_google_vertexai import ChatVertexAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.messages import BaseMessage
 
+from utils.model_registry import get_chat_model, EscalatingChain, confidence_check
+from utils.crm_health import crm_health_monitor, CRM_HEALTH_ROUTING, CRM_ROUTED_TO_SQL
+
 # Import CRM tools for dynamic tool definitions
 from agents.mcp_agent import mcp_tools
 
-# --- Load environment variables ---
-load_dotenv(dotenv_path=os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../config/.env'))
-
-GCP_PROJECT_ID = os.getenv("GCP_PROJECT_ID", "geminimcp-464809")
-GOOGLE_LOCATION = os.getenv("GOOGLE_LOCATION", "us-central1")
+# Primary tools the workflow can dispatch to (see primary_route_decision in main.py).
+ROUTABLE_TOOLS = {"CONTINUE_CONVERSATION", "CRM_AGENT", "CLARIFY_QUERY", "SQL_ROUTER_AGENT", "GENERAL_QUERY"}
 
 def get_crm_tool_definitions() -> List[Dict[str, str]]:
     """Dynamically gets the names and descriptions of available CRM tools."""
@@ -33,14 +30,10 @@ class PrimaryRouterAgent:
     """
     Enhanced router agent that handles visualization requests and routes queries to appropriate sub-agents.
     """
-    def __init__(self, model_name: str = "gemini-2.5-pro"):
-        self.llm = ChatVertexAI(
-            model_name=model_name,
-            temperature=0.0,
-            project=GCP_PROJECT_ID,
-            location=GOOGLE_LOCATION,
-            max_output_tokens=2048
-        )
+    def __init__(self, model_name: Optional[str] = None):
+        # The "primary_router" role's model from the registry unless `model_name` pins one.
+        self.model_name = model_name
+        self.llm = get_chat_model("primary_router", model_name, max_output_tokens=2048)
         self.parser = JsonOutputParser()
         self.visualization_keywords = ["chart", "graph", "plot", "visualize", "pie", "bar", "line"]
 
@@ -116,6 +109,7 @@ class PrimaryRouterAgent:
              * CRM_AGENT and SQL_ROUTER_AGENT Fallback:
                - If a query seems to be for a CRM agent but is a general query (e.g., "list all opportunities" instead of "show me opportunity OPP001"), consider `SQL_ROUTER_AGENT` as the primary tool.
                - If a query is for a specific CRM record by ID, but there's a chance the record might not exist or the CRM tool might fail, you can suggest `SQL_ROUTER_AGENT` as a `fallback_tool`.
+               - Lead listings filtered only by zone, territory, status, score, lead type or customer name (e.g., "open leads in zone South with hot score") should use `CRM_AGENT`, which has a dedicated lead listing tool, with `SQL_ROUTER_AGENT` as the `fallback_tool`.
 
              * Visualization requests (terms like {visualization_keywords}):
                - If the primary tool is a data tool (CRM or SQL), add `VISUALIZATION_AGENT` as a `secondary_tool`.
@@ -128,6 +122,7 @@ class PrimaryRouterAgent:
              - secondary_tool: Optional tool (for visualization)
              - fallback_tool: Optional tool to use if the primary tool fails.
              - reasoning: Explanation of decision
+             - confidence: How sure you are of the primary tool, from 0 to 1
              """
             ),
             # Add the conversation history and current query to the prompt
@@ -137,7 +132,32 @@ class PrimaryRouterAgent:
             visualization_keywords=", ".join(f"'{kw}'" for kw in self.visualization_keywords)
         )
 
-        self.routing_chain = self.prompt | self.llm | self.parser
+        # Re-run on the escalation tier if the fast model's JSON is unusable or unsure.
+        self.routing_chain = EscalatingChain(
+            "primary_router", self.prompt, self.parser, check=self._check_routing_decision,
+            model_name=self.model_name, max_output_tokens=2048
+        )
+
+    @staticmethod
+    def _check_routing_decision(routing_decision: Any) -> Optional[str]:
+        if not isinstance(routing_decision, dict) or routing_decision.get("tool_name") not in ROUTABLE_TOOLS:
+            return "invalid_output"
+        return confidence_check(routing_decision)
+
+    @staticmethod
+    def _prefer_sql_while_crm_unhealthy(routing_decision: Dict[str, Any]) -> Dict[str, Any]:
+        """Sends CRM_AGENT decisions to the SQL path while the CRM API's circuit breakers are open."""
+        if (routing_decision.get("tool_name") != "CRM_AGENT" or not CRM_HEALTH_ROUTING
+                or crm_health_monitor.is_healthy()):
+            return routing_decision
+        CRM_ROUTED_TO_SQL.inc()
+        logging.warning("Primary router: CRM API unhealthy; routing the CRM question to SQL_ROUTER_AGENT.")
+        return {
+            **routing_decision,
+            "tool_name": "SQL_ROUTER_AGENT",
+            "fallback_tool": None,
+            "reasoning": f"{routing_decision.get('reasoning', '')} (The CRM API is currently unavailable, so the database is queried instead.)".strip()
+        }
 
     async def route_query(self, user_query: str, chat_history: List[BaseMessage]) -> Dict[str, Any]:
         """
@@ -166,7 +186,7 @@ class PrimaryRouterAgent:
             # instructed to handle the secondary tool.
             # I am removing this section of code now.
             
-            return routing_decision
+            return self._prefer_sql_while_crm_unhealthy(routing_decision)
             
         except Exception as e:
             logging.error(f"Error during primary routing: {e}", exc_info=True)
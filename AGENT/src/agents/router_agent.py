@@ -2,57 +2,38 @@
 # This file is now a specialized SQL router, not a general router.
 
 import json
-import os
-from dotenv import load_dotenv
+from typing import Any, Optional
 
-from langchain_google_vertexai import ChatVertexAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 
-from database.Schema_map import SCHEMA_MAP 
-
-# --- Load Environment Variables ---
-load_dotenv(dotenv_path=os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../config/.env'))
+from utils.schema_map_store import schema_map_store
+from utils.model_registry import get_chat_model, EscalatingChain, confidence_check
+from utils.gcp_auth import configure_gcp_credentials
 
 # --- Service Account Key Authentication Setup ---
-try:
-    service_account_key_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS_PATH", r"C:\Users\Admin\Downloads\geminimcp-464809-eee97d96077e.json")
-    
-    if not os.path.exists(service_account_key_path):
-        raise FileNotFoundError(f"Service account key file not found at: {service_account_key_path}")
-    
-    os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = service_account_key_path
-    print(f"[SQLRouterAgent Setup] GOOGLE_APPLICATION_CREDENTIALS set to: {service_account_key_path}")
-
-except FileNotFoundError as e:
-    print(f"[SQLRouterAgent Fatal Error] {e}")
-    print("Please ensure the service account JSON key file exists at the specified path.")
-    raise
-except Exception as e:
-    print(f"[SQLRouterAgent Error] An unexpected error occurred during service account setup: {e}")
-    raise
-
-GCP_PROJECT_ID = os.getenv("GCP_PROJECT_ID", "geminimcp-464809")
-GOOGLE_LOCATION = os.getenv("GOOGLE_LOCATION", "us-central1") 
+configure_gcp_credentials("SQLRouterAgent")
 
 
 class SQLRouterAgent:
-    def __init__(self, model_name: str = "gemini-2.5-pro"):
+    def __init__(self, model_name: Optional[str] = None, schema_map: dict = None):
         """
-        Initializes the SQL Router Agent with a LangChain-compatible LLM
-        from Google Vertex AI.
+        Initializes the SQL Router Agent with the "sql_router" role's model from the model
+        registry (or `model_name`). Uses the schema map store's current map unless `schema_map` is given.
         """
-        self.llm = ChatVertexAI(
-            model_name=model_name,
-            temperature=0.0,
-            project=GCP_PROJECT_ID,
-            location=GOOGLE_LOCATION
-        )
+        self.model_name = model_name
+        self.llm = get_chat_model("sql_router", model_name)
         
         self.parser = JsonOutputParser()
-        self.schema_map = SCHEMA_MAP
-        
-        self.prompt = ChatPromptTemplate.from_messages(
+        self.set_schema_map(schema_map if schema_map is not None else schema_map_store.current)
+
+    def set_schema_map(self, schema_map: dict):
+        """
+        Rebuilds the routing prompt for a new schema map. The chain is replaced in one
+        assignment, so in-flight requests keep using the previous one.
+        """
+        self.schema_map = schema_map
+        prompt = ChatPromptTemplate.from_messages(
             [
                 ("system", 
                  """
@@ -73,7 +54,8 @@ class SQLRouterAgent:
                      "tool": "SQL_AGENT", // This is fixed, as the primary router already decided this.
                      "relevant_tables": ["table1", "table2", ...],
                      "relevant_columns": ["column1", "column2", ...],
-                     "reasoning": "Brief explanation for the table and column selection."
+                     "reasoning": "Brief explanation for the table and column selection.",
+                     "confidence": 0.9 // How sure you are that these tables answer the question, from 0 to 1.
                  }}
                  
                  Ensure 'relevant_tables' and 'relevant_columns' are arrays of strings.
@@ -84,10 +66,28 @@ class SQLRouterAgent:
                 ("user", "{user_query}")
             ]
         ).partial(
-            schema_map=json.dumps(self.schema_map, indent=2)
+            schema_map=json.dumps(schema_map, indent=2)
         )
-        
-        self.routing_chain = self.prompt | self.llm | self.parser
+
+        self.prompt = prompt
+        self.known_tables = {
+            value["table"].upper() for value in schema_map.values()
+            if isinstance(value, dict) and isinstance(value.get("table"), str)
+        }
+        # Re-run on the escalation tier if the fast model's JSON is unusable, names unknown tables or is unsure.
+        self.routing_chain = EscalatingChain(
+            "sql_router", prompt, self.parser, check=self._check_routing_decision, model_name=self.model_name
+        )
+
+    def _check_routing_decision(self, routing_decision: Any) -> Optional[str]:
+        if not isinstance(routing_decision, dict):
+            return "invalid_output"
+        tables = routing_decision.get("relevant_tables")
+        if not isinstance(tables, list) or not tables or not isinstance(routing_decision.get("relevant_columns"), list):
+            return "invalid_output"
+        if self.known_tables and any(str(table).upper() not in self.known_tables for table in tables):
+            return "invalid_output"
+        return confidence_check(routing_decision)
 
     async def route_query(self, user_query: str) -> dict:
         """
@@ -1,18 +1,22 @@
 # src/agents/sql_agent.py
 
+import time
+import asyncio
+from typing import List, Dict, Any, Tuple, Optional
+
 import pandas as pd
-from typing import List, Dict, Any, Tuple
 import logging
 import os
 from dotenv import load_dotenv
 
-from langchain_google_vertexai import ChatVertexAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
 from database.db_connector import DatabaseConnector
-from database.Schema_full import fetch_full_schema_dataframe
-from utils.schema_comparer import get_refined_schema_for_llm 
+from database.Schema_full import fetch_full_schema_dataframe, fetch_tables_schema_dataframe, fetch_table_names
+from utils.schema_graph import SchemaGraph, SchemaSelection, get_schema_graph, merge_schema_tables
+from utils.model_registry import get_chat_model
+from utils.gcp_auth import configure_gcp_credentials
 
 
 # Setup logging
@@ -22,42 +26,34 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../config/.env'))
 
 # --- Service Account Key Authentication Setup ---
-try:
-    service_account_key_path = r"C:\Users\Admin\Downloads\geminimcp-464809-eee97d96077e.json"
-    
-    if not os.path.exists(service_account_key_path):
-        raise FileNotFoundError(f"Service account key file not found at: {service_account_key_path}")
-    
-    os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = service_account_key_path
-    print(f"[RouterAgent Setup] GOOGLE_APPLICATION_CREDENTIALS set to: {service_account_key_path}")
-
-except FileNotFoundError as e:
-    print(f"[RouterAgent Fatal Error] {e}")
-    print("Please ensure the service account JSON key file exists at the specified path.")
-    raise
-except Exception as e:
-    print(f"[RouterAgent Error] An unexpected error occurred during service account setup: {e}")
-    raise
-
-# These global variables will be used directly in ChatVertexAI init
-GCP_PROJECT_ID = os.getenv("GCP_PROJECT_ID", "geminimcp-464809")
-GOOGLE_LOCATION = os.getenv("GOOGLE_LOCATION", "us-central1") 
+configure_gcp_credentials("SQLAgent")
+
+
+# How long a loaded schema snapshot (and its precomputed prompt fragments) is reused before re-fetching.
+# Not applied while a schema change watcher is listening (see utils/schema_watcher.py).
+SCHEMA_SNAPSHOT_TTL_SECONDS = float(os.getenv("SCHEMA_SNAPSHOT_TTL_SECONDS", 300))
+# Column-level pruning of the schema context sent to the SQL LLM (see SchemaGraph.prune_selection).
+SQL_SCHEMA_PRUNING = os.getenv("SQL_SCHEMA_PRUNING", "true").lower() in ("1", "true", "yes")
+SQL_SCHEMA_TOKEN_BUDGET = int(os.getenv("SQL_SCHEMA_TOKEN_BUDGET", 1200))
+SQL_SCHEMA_MIN_COLUMNS_PER_TABLE = int(os.getenv("SQL_SCHEMA_MIN_COLUMNS_PER_TABLE", 5))
 
 
 class SQLAgent:
     def __init__(self, db_connector: DatabaseConnector):
         """
-        Initializes the SQL Agent with a database connector and LangChain-compatible LLM.
-        The LLM parameters (model, project, location) are hardcoded internally.
+        Initializes the SQL Agent with a database connector and the "sql_agent" role's model
+        from the model registry (pro tier by default).
         """
         self.db_connector = db_connector
-        self.llm = ChatVertexAI(
-            model_name="gemini-2.5-pro", # Hardcoded model name
-            temperature=0.0,
-            project="geminimcp-464809", # Hardcoded project ID
-            location="us-central1" # Hardcoded location
-        )
+        self.llm = get_chat_model("sql_agent")
         self.parser = StrOutputParser()
+        # Current schema snapshot (FK graph + prompt fragments), loaded lazily by load_schema_snapshot()
+        self.schema_graph: Optional[SchemaGraph] = None
+        self.full_schema_df: Optional[pd.DataFrame] = None
+        self._schema_loaded_at = 0.0
+        self._schema_lock = asyncio.Lock()
+        # True while DDL notifications keep the snapshot current; the TTL reload is then skipped.
+        self.schema_change_feed_active = False
 
         self.prompt_template = ChatPromptTemplate.from_messages(
             [
@@ -92,75 +88,115 @@ class SQLAgent:
         )
         self.sql_chain = self.prompt_template | self.llm | self.parser
 
-    def _prune_and_format_schema_for_llm(self, relevant_schema_df: pd.DataFrame) -> str:
+    async def load_schema_snapshot(self, force: bool = False) -> Optional[SchemaGraph]:
+        """
+        Returns the SchemaGraph for the current schema snapshot, fetching the schema from the
+        database only on first use, after SCHEMA_SNAPSHOT_TTL_SECONDS, or when `force` is set.
+        """
+        if self._schema_is_fresh() and not force:
+            return self.schema_graph
+
+        async with self._schema_lock:
+            # Another request may have refreshed the snapshot while we waited for the lock.
+            if not force and self._schema_is_fresh():
+                return self.schema_graph
+            full_schema_df = await fetch_full_schema_dataframe(self.db_connector)
+            if full_schema_df.empty:
+                # Keep serving the last good snapshot if the refresh failed.
+                return self.schema_graph
+            self._publish_schema_snapshot(full_schema_df)
+            return self.schema_graph
+
+    def _schema_is_fresh(self) -> bool:
+        if self.schema_graph is None or self._schema_loaded_at == 0.0:
+            return False
+        return (self.schema_change_feed_active
+                or time.monotonic() - self._schema_loaded_at < SCHEMA_SNAPSHOT_TTL_SECONDS)
+
+    def _publish_schema_snapshot(self, full_schema_df: pd.DataFrame):
+        """Swaps in a new snapshot; get_schema_graph rebuilds the graph only if the fingerprint changed."""
+        self.schema_graph = get_schema_graph(full_schema_df)
+        self.full_schema_df = full_schema_df
+        self._schema_loaded_at = time.monotonic()
+
+    def set_schema_change_feed(self, active: bool):
+        """Called by the schema change watcher when it starts or stops receiving DDL notifications."""
+        self.schema_change_feed_active = active
+
+    async def refresh_schema_tables(self, table_names: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        """
+        Re-introspects only `table_names` (plus tables whose FKs point at them) and merges them
+        into the current snapshot, or reloads the whole schema when `table_names` is None or no
+        snapshot is loaded yet. Returns the new full schema DataFrame, or None if the refresh
+        failed (the previous snapshot is kept).
+        """
+        async with self._schema_lock:
+            try:
+                if table_names is None or self.full_schema_df is None or self.schema_graph is None:
+                    full_schema_df = await fetch_full_schema_dataframe(self.db_connector)
+                    if full_schema_df.empty:
+                        return None
+                else:
+                    affected = {name.upper() for name in table_names}
+                    affected |= self.schema_graph.referencing_tables(affected)
+                    tables_df = await fetch_tables_schema_dataframe(self.db_connector, sorted(affected))
+                    live_table_names = set(await fetch_table_names(self.db_connector))
+                    full_schema_df = merge_schema_tables(self.full_schema_df, affected, tables_df, live_table_names)
+                    logging.info(f"SQLAgent: re-introspected {len(affected)} table(s) after a schema change: {sorted(affected)}")
+            except Exception as e:
+                logging.error(f"SQLAgent: schema refresh failed, keeping the current snapshot: {e}", exc_info=True)
+                return None
+            self._publish_schema_snapshot(full_schema_df)
+            return full_schema_df
+
+    def _prune_and_format_schema_for_llm(self, schema_selection: SchemaSelection) -> str:
         """
-        Formates the relevant schema DataFrame into a concise string for the LLM,
+        Formats the selected tables (and optional column subsets) into a concise string for the LLM,
         including table names, columns with types/keys, and explicit FK relationships.
-        This is the "Prune and Format Schema for LLM" step.
+        This is the "Prune and Format Schema for LLM" step; the per-table text is precomputed
+        on the schema snapshot, so this only concatenates cached fragments.
         """
-        if relevant_schema_df.empty:
+        if not schema_selection or self.schema_graph is None:
             return "No relevant schema information found for SQL generation."
+        return self.schema_graph.format_schema(schema_selection)
 
-        formatted_output = []
-        for table_name in relevant_schema_df['TABLE_NAME'].unique():
-            table_df = relevant_schema_df[relevant_schema_df['TABLE_NAME'] == table_name]
-            
-            formatted_output.append(f"Table: {table_name}")
-            
-            columns_info = []
-            for _, row in table_df.iterrows():
-                col_name = row['COLUMN_NAME']
-                data_type = row['DATA_TYPE']
-                column_key = row['COLUMN_KEY'] # 'PRI', 'MUL', or ''
-
-                col_detail = f"{col_name} ({data_type}"
-                if column_key:
-                    col_detail += f", {column_key}"
-                col_detail += ")"
-                columns_info.append(col_detail)
-            
-            formatted_output.append(f"Columns: {', '.join(columns_info)}")
-
-            fks_from_this_table = table_df[table_df['COLUMN_KEY'] == 'MUL']
-            if not fks_from_this_table.empty:
-                fk_lines = []
-                for _, fk_row in fks_from_this_table.drop_duplicates(subset=['COLUMN_NAME', 'REFERENCED_TABLE_NAME', 'REFERENCED_COLUMN_NAME']).iterrows():
-                    if fk_row['REFERENCED_TABLE_NAME'] and fk_row['REFERENCED_COLUMN_NAME']:
-                        fk_lines.append(
-                            f"  FOREIGN KEY ({fk_row['COLUMN_NAME']}) REFERENCES "
-                            f"{fk_row['REFERENCED_TABLE_NAME']}({fk_row['REFERENCED_COLUMN_NAME']})"
-                        )
-                if fk_lines:
-                    formatted_output.append("Relationships (from this table):")
-                    formatted_output.extend(fk_lines)
-            
-            formatted_output.append("")
-
-        return "\n".join(formatted_output).strip()
-
-
-    async def generate_sql_query(self, user_query: str, relevant_tables: List[str], relevant_columns: List[str]) -> Tuple[str, pd.DataFrame]:
+    async def generate_sql_query(self, user_query: str, relevant_tables: List[str], relevant_columns: List[str],
+                                 widen_schema: bool = False) -> Tuple[str, SchemaSelection, bool]:
         """
         Generates a SQL query based on the user's question and relevant schema hints.
+        Unless `widen_schema` is set (e.g. retrying after the pruned SQL failed), wide tables are
+        pruned to the columns the question is likely to need within SQL_SCHEMA_TOKEN_BUDGET.
+
+        Returns:
+            (SQL, the schema selection given to the LLM, whether any columns were pruned)
         """
         logging.info(f"SQLAgent received query: '{user_query}'")
         logging.info(f"RouterAgent hints - Relevant Tables: {relevant_tables}, Relevant Columns: {relevant_columns}")
         
         try:
-            full_schema_df = await fetch_full_schema_dataframe(self.db_connector)
-            if full_schema_df.empty:
+            schema_graph = await self.load_schema_snapshot()
+            if schema_graph is None:
                 logging.error("Failed to fetch full schema from database. Cannot generate SQL.")
-                return "Error: Could not retrieve database schema.", pd.DataFrame()
+                return "Error: Could not retrieve database schema.", {}, False
 
-            relevant_and_refined_schema_df = await get_refined_schema_for_llm(
-                full_schema_df, relevant_tables, relevant_columns
-            )
+            schema_selection = schema_graph.select_schema([table.upper() for table in relevant_tables])
             
-            if relevant_and_refined_schema_df.empty:
-                logging.warning("No relevant schema information found after refinement. Cannot generate meaningful SQL.")
-                return "Error: No relevant schema found for your query. Please rephrase or check database configuration.", pd.DataFrame()
-
-            formatted_schema_for_llm = self._prune_and_format_schema_for_llm(relevant_and_refined_schema_df)
+            if not schema_selection:
+                logging.warning(f"No relevant schema information found for tables {relevant_tables}. Cannot generate meaningful SQL.")
+                return "Error: No relevant schema found for your query. Please rephrase or check database configuration.", {}, False
+
+            schema_pruned = False
+            if SQL_SCHEMA_PRUNING and not widen_schema:
+                full_selection = schema_selection
+                schema_selection = schema_graph.prune_selection(
+                    full_selection, user_query, relevant_columns,
+                    SQL_SCHEMA_TOKEN_BUDGET, SQL_SCHEMA_MIN_COLUMNS_PER_TABLE
+                )
+                schema_pruned = schema_selection != full_selection
+            elif widen_schema:
+                logging.info("SQLAgent: using the full schema context for the selected tables (widened after a failure).")
+
+            formatted_schema_for_llm = self._prune_and_format_schema_for_llm(schema_selection)
             logging.info(f"Formatted schema sent to LLM:\n---\n{formatted_schema_for_llm}\n---")
 
             sql_query = await self.sql_chain.ainvoke({
@@ -171,11 +207,11 @@ class SQLAgent:
             sql_query = sql_query.replace("```sql", "").replace("```", "").strip()
 
             logging.info(f"Generated SQL Query: \n{sql_query}")
-            return sql_query, relevant_and_refined_schema_df
+            return sql_query, schema_selection, schema_pruned
 
         except Exception as e:
             logging.error(f"Error in SQLAgent.generate_sql_query: {e}", exc_info=True)
-            return f"Error generating SQL query: {e}", pd.DataFrame()
+            return f"Error generating SQL query: {e}", {}, False
 
 # --- Test block for SQLAgent.py ---
 # if __name__ == "__main__":
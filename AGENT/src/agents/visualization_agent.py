@@ -1,12 +1,14 @@
 # src/agents/visualization_agent.py
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
 import pandas as pd
 import matplotlib.pyplot as plt
 import base64
 from io import BytesIO
 
+from database.result_set import ResultSet
+
 class VisualizationAgent:
     """
     Agent that generates visualizations from data using matplotlib.
@@ -14,7 +16,7 @@ class VisualizationAgent:
     def __init__(self):
         pass
     
-    async def generate_visualization(self, user_query: str, data: List[Dict[str, Any]]) -> Dict[str, str]:
+    async def generate_visualization(self, user_query: str, data: Union[ResultSet, List[Dict[str, Any]]]) -> Dict[str, str]:
         """
         Generates a visualization based on the data and user query.
         Returns a dict with:
@@ -23,8 +25,8 @@ class VisualizationAgent:
         - explanation: text explanation of the visualization
         """
         try:
-            # Convert data to pandas DataFrame for easier processing
-            df = pd.DataFrame(data)
+            # SQL results carry their DataFrame (built once, numeric columns as floats)
+            df = data.to_dataframe() if isinstance(data, ResultSet) else pd.DataFrame(data)
             
             if len(df) == 0:
                 return {"error": "No data available for visualization"}
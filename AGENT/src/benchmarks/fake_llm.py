@@ -0,0 +1,115 @@
+# src/benchmarks/fake_llm.py
+
+import sys
+import json
+import types
+import asyncio
+import time
+from typing import Dict, Any, List, Optional
+
+from pydantic import ConfigDict
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage, AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+# Markers identifying which agent's prompt the fake model is answering.
+# Checked in order; the first marker found in the prompt wins.
+PROMPT_KIND_MARKERS = [
+    ("sql_router", "expert SQL routing agent"),
+    ("primary_router", "expert routing agent that determines"),
+    ("sql_agent", "expert PostgreSQL SQL query generator"),
+    ("summarize_history", "running summary of a conversation"),
+    ("clarify", "ask clarifying questions"),
+]
+
+class ScriptedResponses:
+    """
+    Canned answers for each benchmark question, keyed by the question text.
+    Each entry is a corpus item: route, secondary_tool, relevant_tables,
+    relevant_columns, sql and answer (see benchmarks/corpus.json).
+    """
+    def __init__(self, corpus: List[Dict[str, Any]]):
+        # Longest questions first so a question that contains another one still matches itself.
+        self.entries = sorted(corpus, key=lambda entry: len(entry["question"]), reverse=True)
+
+    def find_entry(self, prompt_text: str) -> Optional[Dict[str, Any]]:
+        return next((entry for entry in self.entries if entry["question"] in prompt_text), None)
+
+    def respond(self, prompt_text: str) -> str:
+        kind = next((kind for kind, marker in PROMPT_KIND_MARKERS if marker in prompt_text), "answer")
+        entry = self.find_entry(prompt_text) or {}
+
+        if kind == "primary_router":
+            decision = {"tool_name": entry.get("route", "GENERAL_QUERY"), "reasoning": "Scripted benchmark route."}
+            if entry.get("secondary_tool"):
+                decision["secondary_tool"] = entry["secondary_tool"]
+            return json.dumps(decision)
+        if kind == "sql_router":
+            return json.dumps({
+                "tool": "SQL_AGENT",
+                "relevant_tables": entry.get("relevant_tables", []),
+                "relevant_columns": entry.get("relevant_columns", []),
+                "reasoning": "Scripted benchmark table selection."
+            })
+        if kind == "sql_agent":
+            return entry.get("sql", "SELECT 1")
+        if kind == "summarize_history":
+            return "Scripted summary of the earlier conversation."
+        if kind == "clarify":
+            return "Could you provide more details?"
+        return entry.get("answer", "Scripted benchmark answer.")
+
+class FakeChatModel(BaseChatModel):
+    """
+    Drop-in stand-in for ChatVertexAI that answers from a ScriptedResponses table
+    after a configurable delay, so the rest of the pipeline runs unchanged.
+    Accepts (and ignores) ChatVertexAI's constructor arguments.
+    """
+    model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
+
+    model_name: str = "fake-chat-model"
+    latency_seconds: float = 0.0
+    script: Any = None
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-scripted-chat"
+
+    def _build_result(self, messages: List[BaseMessage]) -> ChatResult:
+        prompt_text = "\n".join(str(message.content) for message in messages)
+        content = self.script.respond(prompt_text) if self.script else "Scripted benchmark answer."
+        message = AIMessage(
+            content=content,
+            usage_metadata={
+                "input_tokens": max(1, len(prompt_text) // 4),
+                "output_tokens": max(1, len(content) // 4),
+                "total_tokens": max(1, len(prompt_text) // 4) + max(1, len(content) // 4),
+            },
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs) -> ChatResult:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        return self._build_result(messages)
+
+    async def _agenerate(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs) -> ChatResult:
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        return self._build_result(messages)
+
+def install_fake_vertexai(script: ScriptedResponses, latency_seconds: float = 0.0):
+    """
+    Replaces `langchain_google_vertexai.ChatVertexAI` with a FakeChatModel bound to `script`.
+    Must be called before importing `main` or any module under `agents`.
+    """
+    class ScriptedChatVertexAI(FakeChatModel):
+        def __init__(self, **kwargs):
+            kwargs.setdefault("latency_seconds", latency_seconds)
+            kwargs.setdefault("script", script)
+            super().__init__(**kwargs)
+
+    fake_module = types.ModuleType("langchain_google_vertexai")
+    fake_module.ChatVertexAI = ScriptedChatVertexAI
+    sys.modules["langchain_google_vertexai"] = fake_module
+    return ScriptedChatVertexAI
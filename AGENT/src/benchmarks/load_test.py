@@ -0,0 +1,358 @@
+# src/benchmarks/load_test.py
+"""
+Concurrent load generator for the agent API (/query) and the CRM MCP server.
+
+`--target api` runs N concurrent simulated conversations against /query. Each
+conversation sends several turns drawn from a weighted mix of routing paths
+(sql, crm, visualization, general) and carries the growing chat_history (or a
+session_id with --use-sessions), then starts over with a fresh conversation.
+
+`--target mcp` calls the MCP server's tools directly over streamable HTTP with
+N concurrent client sessions. Start benchmarks/stub_crm_api.py on port 5104 to
+run it without the ERP.API backend.
+
+The report has per-path latency percentiles, error rates and throughput, the
+load generator's own event-loop lag (to confirm the client is not the
+bottleneck), and the server's event-loop lag and DB connection counts scraped
+from /metrics and, with --pg-dsn, pg_stat_activity.
+
+Usage (from AGENT/src):
+    python benchmarks/load_test.py --target api --concurrency 20 --duration 60 --turns 4
+    python benchmarks/load_test.py --target mcp --mcp-url http://127.0.0.1:8001/mcp --concurrency 50
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import statistics
+from typing import Dict, Any, List, Optional, Tuple
+
+import httpx
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from benchmarks.run_benchmark import percentile
+
+# --- Traffic mix ---
+# Questions per routing path for /query load. {n} is replaced with a random record number.
+API_SCENARIOS: Dict[str, List[str]] = {
+    "sql": [
+        "How many active sales leads are there in each status?",
+        "Show the 20 most recently created hot leads in the South area",
+        "What is the count of sales opportunities by status?",
+        "List opportunities together with the territory of their originating lead",
+    ],
+    "crm": [
+        "Get me the details of lead {n}",
+        "What are the details for sales opportunity OPP{n:05d}?",
+        "Show me the opportunity dashboard numbers",
+    ],
+    "visualization": [
+        "Plot the number of leads created per month",
+        "Show a bar chart of opportunities by status",
+    ],
+    "general": [
+        "What can you help me with?",
+        "Thanks, that's helpful",
+    ],
+}
+DEFAULT_API_MIX = "sql=0.5,crm=0.25,visualization=0.15,general=0.1"
+
+def _mcp_tool_calls(rng: random.Random) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+    """Tool name and arguments for each MCP scenario."""
+    return {
+        "get_lead_info": ("get_lead_info", {"input": {"id": rng.randint(1, 5000)}}),
+        "get_sales_opportunity_by_id": ("get_sales_opportunity_by_id",
+                                        {"input": {"opportunityId": f"OPP{rng.randint(1, 2000):05d}"}}),
+        "get_sales_opportunity_card_counts": ("get_sales_opportunity_card_counts", {"input": {}}),
+        "get_leads_info_batch": ("get_leads_info_batch",
+                                 {"input": {"ids": [rng.randint(1, 5000) for _ in range(10)]}}),
+        "list_sales_leads": ("list_sales_leads", {"input": {"page_size": 20}}),
+    }
+DEFAULT_MCP_MIX = "get_lead_info=0.35,get_sales_opportunity_by_id=0.25,get_sales_opportunity_card_counts=0.15,get_leads_info_batch=0.15,list_sales_leads=0.1"
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """Parses 'name=weight,name2=weight2' into a dict."""
+    weights = {}
+    for part in mix.split(","):
+        if "=" in part:
+            name, weight = part.split("=", 1)
+            weights[name.strip()] = float(weight)
+    return weights
+
+class LoadResults:
+    """Collects per-scenario latencies and errors during a run."""
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.error_examples: List[str] = []
+
+    def record(self, scenario: str, seconds: float, error: Optional[str] = None):
+        self.latencies.setdefault(scenario, []).append(seconds)
+        if error:
+            self.errors[scenario] = self.errors.get(scenario, 0) + 1
+            if len(self.error_examples) < 10:
+                self.error_examples.append(f"{scenario}: {error}")
+
+    def summary(self, wall_seconds: float) -> Dict[str, Any]:
+        scenarios = {}
+        all_latencies: List[float] = []
+        for scenario, values in sorted(self.latencies.items()):
+            all_latencies.extend(values)
+            scenarios[scenario] = _latency_stats(values, self.errors.get(scenario, 0))
+        total = _latency_stats(all_latencies, sum(self.errors.values()))
+        total["throughput_rps"] = round(len(all_latencies) / wall_seconds, 2) if wall_seconds else 0.0
+        return {"scenarios": scenarios, "total": total, "error_examples": self.error_examples}
+
+def _latency_stats(values: List[float], errors: int) -> Dict[str, Any]:
+    return {
+        "requests": len(values),
+        "errors": errors,
+        "error_rate": round(errors / len(values), 4) if values else 0.0,
+        "p50_ms": round(percentile(values, 50) * 1000, 1),
+        "p95_ms": round(percentile(values, 95) * 1000, 1),
+        "p99_ms": round(percentile(values, 99) * 1000, 1),
+        "max_ms": round(max(values) * 1000, 1) if values else 0.0,
+        "mean_ms": round(statistics.fmean(values) * 1000, 1) if values else 0.0,
+    }
+
+# --- /query traffic ---
+async def run_conversation_worker(client: httpx.AsyncClient, api_url: str, mix: Dict[str, float], turns: int,
+                                  use_sessions: bool, deadline: float, results: LoadResults, rng: random.Random):
+    """Runs back-to-back simulated conversations of `turns` turns until the deadline."""
+    scenario_names, scenario_weights = list(mix), list(mix.values())
+    while time.monotonic() < deadline:
+        chat_history: List[Dict[str, str]] = []
+        session_id = f"load-{rng.getrandbits(64):016x}" if use_sessions else None
+        for _ in range(turns):
+            if time.monotonic() >= deadline:
+                return
+            scenario = rng.choices(scenario_names, scenario_weights)[0]
+            question = rng.choice(API_SCENARIOS[scenario]).format(n=rng.randint(1, 2000))
+            payload: Dict[str, Any] = {"query": question, "include_visualization": scenario == "visualization"}
+            if use_sessions:
+                payload["session_id"] = session_id
+            else:
+                payload["chat_history"] = chat_history
+
+            start = time.perf_counter()
+            error = None
+            try:
+                response = await client.post(f"{api_url}/query", json=payload)
+                if response.status_code != 200:
+                    error = f"HTTP {response.status_code}: {response.text[:200]}"
+                else:
+                    body = response.json()
+                    if not body.get("success", False):
+                        error = f"success=false: {str(body.get('error'))[:200]}"
+                    if not use_sessions:
+                        chat_history = body.get("chat_history", chat_history)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            results.record(scenario, time.perf_counter() - start, error)
+
+# --- MCP traffic ---
+async def run_mcp_worker(mcp_url: str, mix: Dict[str, float], deadline: float, results: LoadResults, rng: random.Random):
+    """Opens one MCP client session and calls tools from the mix until the deadline."""
+    from mcp import ClientSession
+    from mcp.client.streamable_http import streamablehttp_client
+
+    scenario_names, scenario_weights = list(mix), list(mix.values())
+    try:
+        async with streamablehttp_client(mcp_url) as (read_stream, write_stream, _):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                while time.monotonic() < deadline:
+                    scenario = rng.choices(scenario_names, scenario_weights)[0]
+                    tool_name, arguments = _mcp_tool_calls(rng)[scenario]
+                    start = time.perf_counter()
+                    error = None
+                    try:
+                        result = await session.call_tool(tool_name, arguments)
+                        if result.isError:
+                            error = str(result.content[0].text if result.content else "tool error")[:200]
+                    except Exception as e:
+                        error = f"{type(e).__name__}: {e}"
+                    results.record(scenario, time.perf_counter() - start, error)
+    except Exception as e:
+        results.record("session", 0.0, f"{type(e).__name__}: {e}")
+
+# --- Samplers ---
+async def sample_client_loop_lag(stop: asyncio.Event, lags: List[float], interval: float = 0.1):
+    """Event-loop lag of the load generator itself; high values mean the client is saturated."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, time.perf_counter() - start - interval))
+
+def parse_prometheus_text(text: str) -> Dict[str, float]:
+    """Parses Prometheus text exposition into {'name{labels}': value}."""
+    samples = {}
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        key, _, value = line.rpartition(" ")
+        try:
+            samples[key] = float(value)
+        except ValueError:
+            continue
+    return samples
+
+async def scrape_metrics(client: httpx.AsyncClient, api_url: str) -> Optional[Dict[str, float]]:
+    try:
+        response = await client.get(f"{api_url}/metrics")
+        return parse_prometheus_text(response.text) if response.status_code == 200 else None
+    except Exception:
+        return None
+
+async def sample_server_gauges(client: httpx.AsyncClient, api_url: str, pg_dsn: Optional[str],
+                               stop: asyncio.Event, samples: Dict[str, List[float]], interval: float = 1.0):
+    """Periodically records server DB connections and loop lag (from /metrics) and Postgres backends."""
+    pg_conn = None
+    if pg_dsn:
+        try:
+            import asyncpg
+            pg_conn = await asyncpg.connect(pg_dsn)
+        except Exception as e:
+            print(f"[Load Test] Could not connect to Postgres for pg_stat_activity sampling: {e}")
+    try:
+        while not stop.is_set():
+            metrics = await scrape_metrics(client, api_url)
+            if metrics:
+                samples.setdefault("db_connections_open", []).append(metrics.get("db_connections_open", 0.0))
+                samples.setdefault("event_loop_lag_last_seconds", []).append(metrics.get("event_loop_lag_last_seconds", 0.0))
+            if pg_conn is not None:
+                count = await pg_conn.fetchval(
+                    "SELECT count(*) FROM pg_stat_activity WHERE datname = current_database() AND pid <> pg_backend_pid()")
+                samples.setdefault("pg_backends", []).append(float(count))
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        if pg_conn is not None:
+            await pg_conn.close()
+
+def _histogram_delta_quantile(before: Dict[str, float], after: Dict[str, float], name: str, quantile: float) -> Optional[float]:
+    """Upper bucket bound containing `quantile` of the observations made between two scrapes."""
+    buckets = []
+    for key, value in after.items():
+        if key.startswith(f"{name}_bucket{{") and 'le="' in key:
+            upper = key.split('le="', 1)[1].split('"', 1)[0]
+            buckets.append((float("inf") if upper == "+Inf" else float(upper), value - before.get(key, 0.0)))
+    buckets.sort()
+    total = buckets[-1][1] if buckets else 0.0
+    if total <= 0:
+        return None
+    return next((upper for upper, cumulative in buckets if cumulative >= quantile * total), None)
+
+def server_report(before: Optional[Dict[str, float]], after: Optional[Dict[str, float]],
+                  gauge_samples: Dict[str, List[float]]) -> Dict[str, Any]:
+    report: Dict[str, Any] = {}
+    if before is not None and after is not None:
+        lag_count = after.get("event_loop_lag_seconds_count", 0.0) - before.get("event_loop_lag_seconds_count", 0.0)
+        lag_sum = after.get("event_loop_lag_seconds_sum", 0.0) - before.get("event_loop_lag_seconds_sum", 0.0)
+        report["event_loop_lag_mean_ms"] = round(lag_sum / lag_count * 1000, 2) if lag_count else None
+        p99 = _histogram_delta_quantile(before, after, "event_loop_lag_seconds", 0.99)
+        # "+Inf" means some probes were later than the largest bucket bound.
+        report["event_loop_lag_p99_bucket_ms"] = "+Inf" if p99 == float("inf") else (round(p99 * 1000, 2) if p99 is not None else None)
+        report["db_connections_opened"] = after.get("db_connections_opened_total", 0.0) - before.get("db_connections_opened_total", 0.0)
+    for name, values in gauge_samples.items():
+        if values:
+            report[f"{name}_max"] = max(values)
+            report[f"{name}_mean"] = round(statistics.fmean(values), 3)
+    return report
+
+# --- Runner ---
+async def run_load(args) -> Dict[str, Any]:
+    results = LoadResults()
+    stop = asyncio.Event()
+    client_lags: List[float] = []
+    gauge_samples: Dict[str, List[float]] = {}
+    rng = random.Random(args.seed)
+
+    limits = httpx.Limits(max_connections=args.concurrency + 5, max_keepalive_connections=args.concurrency + 5)
+    async with httpx.AsyncClient(timeout=args.request_timeout, limits=limits) as client:
+        before = await scrape_metrics(client, args.api_url)
+        samplers = [asyncio.create_task(sample_client_loop_lag(stop, client_lags))]
+        if before is not None or args.pg_dsn:
+            samplers.append(asyncio.create_task(
+                sample_server_gauges(client, args.api_url, args.pg_dsn, stop, gauge_samples)))
+
+        deadline = time.monotonic() + args.duration
+        wall_start = time.perf_counter()
+        if args.target == "api":
+            mix = parse_mix(args.mix or DEFAULT_API_MIX)
+            workers = [
+                run_conversation_worker(client, args.api_url, mix, args.turns, args.use_sessions, deadline,
+                                        results, random.Random(rng.random()))
+                for _ in range(args.concurrency)
+            ]
+        else:
+            mix = parse_mix(args.mix or DEFAULT_MCP_MIX)
+            workers = [
+                run_mcp_worker(args.mcp_url, mix, deadline, results, random.Random(rng.random()))
+                for _ in range(args.concurrency)
+            ]
+        await asyncio.gather(*workers)
+        wall_seconds = time.perf_counter() - wall_start
+
+        stop.set()
+        await asyncio.gather(*samplers, return_exceptions=True)
+        after = await scrape_metrics(client, args.api_url)
+
+    report = results.summary(wall_seconds)
+    report.update({
+        "target": args.target,
+        "concurrency": args.concurrency,
+        "duration_seconds": round(wall_seconds, 2),
+        "client_loop_lag_max_ms": round(max(client_lags) * 1000, 2) if client_lags else 0.0,
+        "server": server_report(before, after, gauge_samples),
+    })
+    return report
+
+def print_report(report: Dict[str, Any]):
+    print(f"\nTarget: {report['target']}  concurrency: {report['concurrency']}  duration: {report['duration_seconds']}s")
+    print(f"{'scenario':<36}{'reqs':>7}{'err %':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for scenario, stats in list(report["scenarios"].items()) + [("TOTAL", report["total"])]:
+        print(f"{scenario:<36}{stats['requests']:>7}{stats['error_rate'] * 100:>8.2f}"
+              f"{stats['p50_ms']:>10}{stats['p95_ms']:>10}{stats['p99_ms']:>10}{stats['max_ms']:>10}")
+    print(f"Throughput: {report['total']['throughput_rps']} req/s  "
+          f"client loop lag max: {report['client_loop_lag_max_ms']} ms")
+    if report["server"]:
+        print("Server: " + "  ".join(f"{key}={value}" for key, value in report["server"].items()))
+    for example in report["error_examples"]:
+        print(f"  error: {example}")
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Concurrent load generator for /query and the CRM MCP server.")
+    parser.add_argument("--target", choices=["api", "mcp"], default="api")
+    parser.add_argument("--api-url", default=os.getenv("LOAD_TEST_API_URL", "http://localhost:8004"),
+                        help="Agent API base URL (also scraped for /metrics in both modes).")
+    parser.add_argument("--mcp-url", default=os.getenv("MCP_CORE_PATH", "http://127.0.0.1:8001/mcp"))
+    parser.add_argument("--concurrency", type=int, default=10, help="Concurrent conversations (api) or MCP sessions (mcp).")
+    parser.add_argument("--duration", type=float, default=60.0, help="Run time in seconds.")
+    parser.add_argument("--turns", type=int, default=4, help="Turns per simulated conversation before starting a new one.")
+    parser.add_argument("--mix", help=f"Scenario weights, e.g. '{DEFAULT_API_MIX}'.")
+    parser.add_argument("--use-sessions", action="store_true", help="Send session_id instead of the full chat_history.")
+    parser.add_argument("--pg-dsn", help="Postgres DSN for sampling pg_stat_activity backend counts.")
+    parser.add_argument("--request-timeout", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="Write the report as JSON to this path.")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load(args))
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.output}")
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,142 @@
+# src/benchmarks/run_benchmark.py
+"""
+Offline benchmark for the /query pipeline.
+
+Runs the real LangGraph workflow (routing, SQL generation, Postgres execution,
+visualisation, final response) with every ChatVertexAI replaced by a scripted
+fake model, so results measure the non-LLM overhead of the pipeline and are
+reproducible without Google credentials or network access.
+
+Usage (from AGENT/src, against a scratch Postgres database):
+    python benchmarks/run_benchmark.py --seed --iterations 20 --concurrency 4 --llm-latency 0.2
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import asyncio
+import logging
+import argparse
+import statistics
+from typing import Dict, Any, List
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from benchmarks.fake_llm import ScriptedResponses, install_fake_vertexai
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of `values` (pct in 0-100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[rank]
+
+def summarize_timings(samples: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Per-stage p50/p95/p99/mean (ms) across all requests, plus non-LLM overhead."""
+    stage_values: Dict[str, List[float]] = {}
+    for timings in samples:
+        for stage, seconds in timings.items():
+            stage_values.setdefault(stage, []).append(seconds)
+        llm_seconds = sum(seconds for stage, seconds in timings.items() if stage.startswith("llm."))
+        if "total" in timings:
+            stage_values.setdefault("non_llm_overhead", []).append(timings["total"] - llm_seconds)
+
+    return {
+        stage: {
+            "count": len(values),
+            "p50_ms": round(percentile(values, 50) * 1000, 2),
+            "p95_ms": round(percentile(values, 95) * 1000, 2),
+            "p99_ms": round(percentile(values, 99) * 1000, 2),
+            "mean_ms": round(statistics.fmean(values) * 1000, 2),
+        }
+        for stage, values in sorted(stage_values.items())
+    }
+
+async def run_benchmark(corpus: List[Dict[str, Any]], iterations: int, concurrency: int, run_startup: bool) -> Dict[str, Any]:
+    # Imported here so the fake ChatVertexAI is already installed when main builds its agents.
+    import main
+    from main import QueryRequest, process_query
+
+    if run_startup:
+        await main.initial_app_setup()
+
+    questions = [entry["question"] for entry in corpus] * iterations
+    semaphore = asyncio.Semaphore(concurrency)
+    samples: List[Dict[str, float]] = []
+    failures: List[str] = []
+
+    async def run_one(question: str):
+        async with semaphore:
+            try:
+                response = await process_query(QueryRequest(query=question, include_timings=True, include_visualization=True))
+                body = json.loads(response.body)
+                samples.append(body.get("timings") or {})
+                if not body.get("success"):
+                    failures.append(f"{question}: {body.get('error')}")
+            except Exception as e:
+                failures.append(f"{question}: {type(e).__name__}: {e}")
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(run_one(question) for question in questions))
+    wall_seconds = time.perf_counter() - wall_start
+
+    return {
+        "requests": len(questions),
+        "failures": len(failures),
+        "failure_examples": failures[:5],
+        "concurrency": concurrency,
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_rps": round(len(questions) / wall_seconds, 2) if wall_seconds else 0.0,
+        "stages": summarize_timings(samples),
+    }
+
+def print_report(report: Dict[str, Any]):
+    print(f"\nRequests: {report['requests']}  failures: {report['failures']}  "
+          f"concurrency: {report['concurrency']}  wall: {report['wall_seconds']}s  "
+          f"throughput: {report['throughput_rps']} req/s")
+    print(f"{'stage':<40}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'mean ms':>10}")
+    for stage, stats in report["stages"].items():
+        print(f"{stage:<40}{stats['count']:>7}{stats['p50_ms']:>10}{stats['p95_ms']:>10}{stats['p99_ms']:>10}{stats['mean_ms']:>10}")
+    for failure in report["failure_examples"]:
+        print(f"  failure: {failure}")
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Offline /query pipeline benchmark with a scripted fake LLM.")
+    parser.add_argument("--corpus", default=os.path.join(BENCHMARKS_DIR, "corpus.json"), help="Question corpus (JSON list).")
+    parser.add_argument("--iterations", type=int, default=10, help="Times each corpus question is sent.")
+    parser.add_argument("--concurrency", type=int, default=1, help="Concurrent in-flight requests.")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="Simulated latency of each LLM call (seconds).")
+    parser.add_argument("--seed", action="store_true", help="(Re)create the schema and synthetic data before running.")
+    parser.add_argument("--leads", type=int, default=5000, help="Synthetic sales_lead rows when seeding.")
+    parser.add_argument("--opportunities", type=int, default=2000, help="Synthetic sales_opportunities rows when seeding.")
+    parser.add_argument("--skip-startup", action="store_true", help="Do not run the app's startup hook (schema map refresh, MCP setup).")
+    parser.add_argument("--output", help="Write the report as JSON to this path.")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    os.environ.setdefault("SKIP_GCP_CREDENTIALS", "1")
+
+    with open(args.corpus, "r", encoding="utf-8") as f:
+        corpus = json.load(f)
+    install_fake_vertexai(ScriptedResponses(corpus), latency_seconds=args.llm_latency)
+
+    if args.seed:
+        from benchmarks.seed_db import seed_database
+        from database.db_connector import DATABASE_URL
+        asyncio.run(seed_database(DATABASE_URL, args.leads, args.opportunities))
+
+    report = asyncio.run(run_benchmark(corpus, args.iterations, args.concurrency, not args.skip_startup))
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.output}")
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,145 @@
+# src/benchmarks/seed_db.py
+
+import os
+import random
+import logging
+from datetime import datetime, timedelta
+from typing import List
+
+import asyncpg
+
+# Backend_Api/sql, relative to this file
+SQL_SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../Backend_Api/sql')
+
+# Scripts applied, in order, to build the benchmark schema. Statements that fail
+# (e.g. FKs to tables the benchmark does not create) are logged and skipped.
+DEFAULT_SCRIPTS = [
+    "Locations.sql",
+    "lead.sql",
+    "opportunity.sql",
+    "OpportunityCardsSp.sql",
+    "leadGridKeyset.sql",
+]
+
+STATUSES = ["New", "Open", "Qualified", "Contacted", "Lost"]
+SCORES = ["Hot", "Warm", "Cold"]
+LEAD_TYPES = ["New", "Existing", "Referral"]
+AREAS = ["South", "North", "East", "West", "Central"]
+OPPORTUNITY_STATUSES = ["Prospecting", "Qualified", "Negotiation", "Closed Won", "Closed Lost"]
+
+def split_sql_statements(script: str) -> List[str]:
+    """
+    Splits a SQL script into statements on top-level semicolons, keeping
+    dollar-quoted function bodies, string literals and comments intact.
+    """
+    statements, current = [], []
+    i, length = 0, len(script)
+    dollar_tag = None
+    in_single_quote = False
+
+    while i < length:
+        char = script[i]
+        if dollar_tag:
+            if script.startswith(dollar_tag, i):
+                current.append(dollar_tag)
+                i += len(dollar_tag)
+                dollar_tag = None
+                continue
+        elif in_single_quote:
+            if char == "'":
+                in_single_quote = False
+        elif char == "'":
+            in_single_quote = True
+        elif script.startswith("--", i):
+            end = script.find("\n", i)
+            i = length if end == -1 else end
+            continue
+        elif char == "$":
+            end = script.find("$", i + 1)
+            tag = script[i:end + 1] if end != -1 else ""
+            if tag and (tag == "$$" or tag[1:-1].replace("_", "").isalnum()):
+                dollar_tag = tag
+                current.append(tag)
+                i = end + 1
+                continue
+        elif char == ";":
+            statement = "".join(current).strip()
+            if statement:
+                statements.append(statement)
+            current = []
+            i += 1
+            continue
+        current.append(char)
+        i += 1
+
+    statement = "".join(current).strip()
+    if statement:
+        statements.append(statement)
+    return statements
+
+async def apply_scripts(conn: asyncpg.Connection, scripts: List[str] = DEFAULT_SCRIPTS) -> int:
+    """Runs each script statement by statement. Returns the number of statements that failed."""
+    failures = 0
+    for script_name in scripts:
+        path = os.path.join(SQL_SCRIPTS_DIR, script_name)
+        with open(path, "r", encoding="utf-8") as f:
+            statements = split_sql_statements(f.read())
+        for statement in statements:
+            try:
+                await conn.execute(statement)
+            except Exception as e:
+                failures += 1
+                logging.debug(f"Seed: skipped statement from {script_name}: {type(e).__name__}: {e}")
+        logging.info(f"Seed: applied {script_name} ({len(statements)} statements).")
+    return failures
+
+async def insert_synthetic_rows(conn: asyncpg.Connection, lead_count: int, opportunity_count: int, seed: int = 42):
+    """Fills sales_lead and sales_opportunities with deterministic synthetic rows."""
+    rng = random.Random(seed)
+    base_date = datetime(2025, 1, 1)
+
+    await conn.execute("TRUNCATE sales_lead, sales_opportunities RESTART IDENTITY CASCADE")
+    await conn.executemany(
+        """
+        INSERT INTO sales_lead (lead_id, customer_name, lead_source, status, score, lead_type,
+                                contact_name, email, territory, area, city, isactive, date_created)
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, true, $12)
+        """,
+        [
+            (
+                f"LD{index:05d}", f"Customer {index}", rng.choice(["Web", "Referral", "Event"]),
+                rng.choice(STATUSES), rng.choice(SCORES), rng.choice(LEAD_TYPES),
+                f"Contact {index}", f"contact{index}@example.com", f"Territory {rng.randint(1, 8)}",
+                rng.choice(AREAS), f"City {rng.randint(1, 20)}", base_date + timedelta(minutes=index * 37)
+            )
+            for index in range(1, lead_count + 1)
+        ]
+    )
+    await conn.executemany(
+        """
+        INSERT INTO sales_opportunities (opportunity_id, opportunity_name, customer_name, status,
+                                         lead_id, isactive, date_created)
+        VALUES ($1, $2, $3, $4, $5, true, $6)
+        """,
+        [
+            (
+                f"OPP{index:05d}", f"Opportunity {index}", f"Customer {rng.randint(1, max(lead_count, 1))}",
+                rng.choice(OPPORTUNITY_STATUSES), f"LD{rng.randint(1, max(lead_count, 1)):05d}",
+                base_date + timedelta(hours=index)
+            )
+            for index in range(1, opportunity_count + 1)
+        ]
+    )
+    logging.info(f"Seed: inserted {lead_count} leads and {opportunity_count} opportunities.")
+
+async def seed_database(database_url: str, lead_count: int = 5000, opportunity_count: int = 2000):
+    """Builds the benchmark schema from Backend_Api/sql and loads synthetic data."""
+    conn = await asyncpg.connect(database_url)
+    try:
+        failures = await apply_scripts(conn)
+        if failures:
+            logging.info(f"Seed: {failures} statements were skipped (see debug log for details).")
+        await insert_synthetic_rows(conn, lead_count, opportunity_count)
+        await conn.execute("ANALYZE sales_lead; ANALYZE sales_opportunities;")
+    finally:
+        await conn.close()
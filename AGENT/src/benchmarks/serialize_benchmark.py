@@ -0,0 +1,125 @@
+# src/benchmarks/serialize_benchmark.py
+"""
+Micro-benchmark for encoding /query response bodies.
+
+Builds a response shaped like an include_results=true answer (N rows of asyncpg-style
+values: Decimal, datetime, date, UUID, text, NULLs, plus a chart image and a chat
+history) and times the previous path, jsonable_encoder(custom_encoder={Decimal: float})
+followed by JSONResponse, against FastJSONResponse. It also checks both bodies decode
+to the same JSON.
+
+Usage (from AGENT/src):
+    python benchmarks/serialize_benchmark.py --rows 10000 --repeat 20
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import random
+import argparse
+import statistics
+from decimal import Decimal
+from datetime import datetime, date, timedelta
+from typing import Dict, Any, List, Callable
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from benchmarks.run_benchmark import percentile
+from benchmarks.seed_db import STATUSES, SCORES, AREAS
+from utils.json_response import FastJSONResponse
+
+def build_rows(count: int, seed: int = 7) -> List[Dict[str, Any]]:
+    """Rows as DatabaseConnector returns them for a sales_lead-style query."""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, 8, 0, 0)
+    return [
+        {
+            "lead_id": index,
+            "lead_code": f"LD{index:05d}",
+            "external_ref": uuid.UUID(int=rng.getrandbits(128)),
+            "customer_name": f"Customer {rng.randint(1, 2000)}",
+            "status": rng.choice(STATUSES),
+            "score": rng.choice(SCORES),
+            "area": rng.choice(AREAS),
+            "expected_value": Decimal(rng.randint(1000, 5_000_000)) / 100,
+            "probability": round(rng.random(), 4),
+            "created_at": start + timedelta(minutes=rng.randint(0, 525_600)),
+            "follow_up_date": date(2024, 1, 1) + timedelta(days=rng.randint(0, 365)),
+            "notes": None if rng.random() < 0.4 else "Asked for a revised quotation.",
+        }
+        for index in range(count)
+    ]
+
+def build_payload(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "response": "Here are the leads matching your filters.",
+        "success": True,
+        "error": None,
+        "sql_query": "SELECT * FROM sales_lead WHERE status = 'Open'",
+        "sql_results": rows,
+        "chart_image_base64": "iVBORw0KGgo" * 20_000,
+        "chat_history": [{"role": "user", "content": "list open leads"},
+                         {"role": "assistant", "content": "Here are the leads matching your filters."}],
+        "session_id": None,
+        "timings": {"total": 1.234, "node.execute_sql": 0.05},
+    }
+
+def encode_previous(payload: Dict[str, Any]) -> bytes:
+    return JSONResponse(content=jsonable_encoder(payload, custom_encoder={Decimal: float})).body
+
+def encode_fast(payload: Dict[str, Any]) -> bytes:
+    return FastJSONResponse(payload, endpoint="benchmark").body
+
+def time_encoder(encode: Callable[[Dict[str, Any]], bytes], payload: Dict[str, Any], repeat: int) -> Dict[str, float]:
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = encode(payload)
+        durations.append(time.perf_counter() - start)
+    return {
+        "p50_ms": round(percentile(durations, 50) * 1000, 2),
+        "p95_ms": round(percentile(durations, 95) * 1000, 2),
+        "mean_ms": round(statistics.fmean(durations) * 1000, 2),
+        "bytes": len(body),
+    }
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Compare /query response encoders on a large result set.")
+    parser.add_argument("--rows", type=int, default=10_000, help="Rows in sql_results.")
+    parser.add_argument("--repeat", type=int, default=20, help="Encodings timed per encoder.")
+    parser.add_argument("--output", help="Write the report as JSON to this path.")
+    args = parser.parse_args()
+
+    payload = build_payload(build_rows(args.rows))
+    if json.loads(encode_previous(payload)) != json.loads(encode_fast(payload)):
+        raise SystemExit("FastJSONResponse output differs from the jsonable_encoder output.")
+
+    report = {
+        "rows": args.rows,
+        "repeat": args.repeat,
+        "jsonable_encoder+JSONResponse": time_encoder(encode_previous, payload, args.repeat),
+        "FastJSONResponse": time_encoder(encode_fast, payload, args.repeat),
+    }
+    report["speedup_p50"] = round(
+        report["jsonable_encoder+JSONResponse"]["p50_ms"] / max(report["FastJSONResponse"]["p50_ms"], 1e-6), 1)
+
+    print(f"\nRows: {report['rows']}  repeat: {report['repeat']}")
+    print(f"{'encoder':<32}{'p50 ms':>10}{'p95 ms':>10}{'mean ms':>10}{'bytes':>12}")
+    for encoder in ("jsonable_encoder+JSONResponse", "FastJSONResponse"):
+        stats = report[encoder]
+        print(f"{encoder:<32}{stats['p50_ms']:>10}{stats['p95_ms']:>10}{stats['mean_ms']:>10}{stats['bytes']:>12}")
+    print(f"speedup (p50): {report['speedup_p50']}x")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.output}")
+
+if __name__ == "__main__":
+    main_cli()
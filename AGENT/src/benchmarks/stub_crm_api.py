@@ -0,0 +1,147 @@
+# src/benchmarks/stub_crm_api.py
+"""
+Stand-in for the ERP.API CRM service (http://localhost:5104) used by crm_mcp_server.py.
+
+Serves the endpoints the MCP tools call with deterministic synthetic camelCase
+records, after a configurable delay and with an optional injected error rate,
+so the MCP server and the CRM agent can be load tested without the C# backend.
+
+Usage:
+    python benchmarks/stub_crm_api.py --port 5104 --latency 0.05 --error-rate 0.01
+"""
+
+import random
+import asyncio
+import argparse
+from datetime import datetime, timedelta
+from typing import Dict, Any, List
+
+import uvicorn
+from fastapi import FastAPI, HTTPException, status
+
+OPPORTUNITY_STATUSES = ["Identified", "Solution Presentation", "Proposal", "Negotiation", "Closed Won"]
+LEAD_STATUSES = ["New", "Open", "Qualified", "Contacted", "Lost"]
+BASE_DATE = datetime(2025, 1, 1)
+
+class StubSettings:
+    """Runtime knobs for the stub (set from the command line)."""
+    def __init__(self, latency_seconds: float = 0.0, error_rate: float = 0.0,
+                 lead_count: int = 5000, opportunity_count: int = 2000):
+        self.latency_seconds = latency_seconds
+        self.error_rate = error_rate
+        self.lead_count = lead_count
+        self.opportunity_count = opportunity_count
+
+settings = StubSettings()
+app = FastAPI(title="Stub CRM API")
+
+# --- Synthetic records ---
+def _lead(lead_db_id: int) -> Dict[str, Any]:
+    rng = random.Random(lead_db_id)
+    return {
+        "id": lead_db_id,
+        "leadId": f"LD{lead_db_id:05d}",
+        "customerName": f"Customer {lead_db_id}",
+        "status": rng.choice(LEAD_STATUSES),
+        "score": rng.choice(["Hot", "Warm", "Cold"]),
+        "leadType": rng.choice(["New", "Existing", "Referral"]),
+        "territory": f"Territory {rng.randint(1, 8)}",
+        "area": rng.choice(["South", "North", "East", "West", "Central"]),
+        "isActive": True,
+        "dateCreated": (BASE_DATE + timedelta(minutes=lead_db_id * 37)).isoformat(),
+    }
+
+def _opportunity_number(opportunity_id: str) -> int:
+    digits = "".join(ch for ch in opportunity_id if ch.isdigit())
+    return int(digits) if digits else 0
+
+def _opportunity(number: int, with_items: bool = False) -> Dict[str, Any]:
+    rng = random.Random(number)
+    record = {
+        "id": number,
+        "opportunityId": f"OPP{number:05d}",
+        "opportunityName": f"Opportunity {number}",
+        "customerName": f"Customer {rng.randint(1, 5000)}",
+        "status": rng.choice(OPPORTUNITY_STATUSES),
+        "leadId": f"LD{rng.randint(1, 5000):05d}",
+        "isActive": True,
+        "dateCreated": (BASE_DATE + timedelta(hours=number)).isoformat(),
+    }
+    if with_items:
+        record["items"] = [
+            {"itemId": item, "productName": f"Product {rng.randint(1, 200)}",
+             "quantity": rng.randint(1, 20), "unitPrice": round(rng.uniform(10, 5000), 2)}
+            for item in range(1, rng.randint(1, 5) + 1)
+        ]
+    return record
+
+async def _simulate():
+    """Applies the configured latency and randomly fails a share of requests."""
+    if settings.latency_seconds:
+        await asyncio.sleep(settings.latency_seconds)
+    if settings.error_rate and random.random() < settings.error_rate:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Injected stub failure.")
+
+# --- Endpoints mirrored from ERP.API ---
+@app.get("/api/SalesLead/{lead_db_id}")
+async def get_lead(lead_db_id: int):
+    await _simulate()
+    if not 1 <= lead_db_id <= settings.lead_count:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Lead with ID {lead_db_id} not found.")
+    return _lead(lead_db_id)
+
+@app.get("/api/SalesLead/{lead_id}/quotations-with-items")
+async def get_lead_quotations(lead_id: str):
+    await _simulate()
+    rng = random.Random(lead_id)
+    return [
+        {"quotationId": f"QT{rng.randint(1, 99999):05d}", "leadId": lead_id,
+         "items": [{"productName": f"Product {rng.randint(1, 200)}", "quantity": rng.randint(1, 10)}]}
+        for _ in range(rng.randint(0, 3))
+    ]
+
+@app.get("/api/SalesOpportunity/cards")
+async def get_opportunity_cards():
+    await _simulate()
+    counts: Dict[str, int] = {name: 0 for name in OPPORTUNITY_STATUSES}
+    for number in range(1, settings.opportunity_count + 1):
+        counts[random.Random(number).choice(OPPORTUNITY_STATUSES)] += 1
+    return [{"status": name, "count": count} for name, count in counts.items()]
+
+@app.get("/api/SalesOpportunity/with-items")
+async def get_active_opportunities_with_items() -> List[Dict[str, Any]]:
+    await _simulate()
+    return [_opportunity(number, with_items=True) for number in range(1, min(settings.opportunity_count, 200) + 1)]
+
+@app.get("/api/SalesOpportunity/with-items/{identifier}")
+async def get_opportunity_with_items(identifier: str):
+    await _simulate()
+    number = _opportunity_number(identifier)
+    if not 1 <= number <= settings.opportunity_count:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Opportunity '{identifier}' not found.")
+    return _opportunity(number, with_items=True)
+
+@app.get("/api/SalesOpportunity/{opportunity_id}")
+async def get_opportunity(opportunity_id: str):
+    await _simulate()
+    number = _opportunity_number(opportunity_id)
+    if not 1 <= number <= settings.opportunity_count:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Opportunity '{opportunity_id}' not found.")
+    return _opportunity(number)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stub CRM API for load testing the MCP server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5104)
+    parser.add_argument("--latency", type=float, default=0.0, help="Delay added to every response (seconds).")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 503 (0-1).")
+    parser.add_argument("--leads", type=int, default=5000)
+    parser.add_argument("--opportunities", type=int, default=2000)
+    args = parser.parse_args()
+
+    settings.latency_seconds = args.latency
+    settings.error_rate = args.error_rate
+    settings.lead_count = args.leads
+    settings.opportunity_count = args.opportunities
+    print(f"[Stub CRM API] Serving on http://{args.host}:{args.port} (latency={args.latency}s, error_rate={args.error_rate})")
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
@@ -12,7 +12,7 @@ from database.db_connector import DatabaseConnector
 
 # --- SQL Query to Fetch Full Schema Details (FINAL COMPREHENSIVE VERSION FOR YOUR DB) ---
 # This query correctly handles your information_schema structure to get FK details.
-GET_SCHEMA_SQL = """
+_SCHEMA_SQL_TEMPLATE = """
 SELECT
     c.table_name,
     c.column_name,
@@ -57,10 +57,53 @@ LEFT JOIN
     AND kcu_referenced.ordinal_position = fk_local.position_in_unique_constraint -- Crucial for composite keys, links FK column to PK column position
 WHERE
     c.table_schema = 'public' -- Specify 'public' schema or your custom schema name
+    {table_filter}
 ORDER BY
     c.table_name, c.ordinal_position;
 """
 
+GET_SCHEMA_SQL = _SCHEMA_SQL_TEMPLATE.format(table_filter="")
+# Same query restricted to a list of (lower-case) table names, used to re-introspect only changed tables.
+GET_TABLES_SCHEMA_SQL = _SCHEMA_SQL_TEMPLATE.format(table_filter="AND c.table_name = ANY($1::text[])")
+
+# Names of the tables/views currently in the schema (cheap check for renamed or dropped tables).
+GET_TABLE_NAMES_SQL = """
+SELECT table_name FROM information_schema.tables WHERE table_schema = 'public';
+"""
+
+def schema_rows_to_dataframe(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Converts rows of GET_SCHEMA_SQL / GET_TABLES_SCHEMA_SQL into the normalized schema DataFrame."""
+    df = pd.DataFrame(rows)
+    # Ensure consistent column names (lowercase to uppercase for consistency with previous examples)
+    df.columns = [col.upper() for col in df.columns] 
+    # Rename specific columns for clarity with previous logic if needed (adjust based on your GET_SCHEMA_SQL output)
+    df.rename(columns={
+        'TABLE_NAME': 'TABLE_NAME',
+        'COLUMN_NAME': 'COLUMN_NAME',
+        'DATA_TYPE': 'DATA_TYPE',
+        'COLUMN_KEY': 'COLUMN_KEY', # 'PRI', 'MUL', or None
+        'REFERENCED_SCHEMA_NAME': 'REFERENCED_SCHEMA_NAME', # Added this for completeness
+        'REFERENCED_TABLE_NAME': 'REFERENCED_TABLE_NAME',
+        'REFERENCED_COLUMN_NAME': 'REFERENCED_COLUMN_NAME'
+    }, inplace=True)
+    
+    # --- ADD THESE LINES TO NORMALIZE CASE ---
+    df['TABLE_NAME'] = df['TABLE_NAME'].str.upper()
+    df['COLUMN_NAME'] = df['COLUMN_NAME'].str.upper()
+    if 'REFERENCED_TABLE_NAME' in df.columns:
+        df['REFERENCED_TABLE_NAME'] = df['REFERENCED_TABLE_NAME'].str.upper()
+    if 'REFERENCED_COLUMN_NAME' in df.columns:
+        df['REFERENCED_COLUMN_NAME'] = df['REFERENCED_COLUMN_NAME'].str.upper()
+    # --- END ADDED LINES ---
+
+    # Fill NaN for referenced tables/columns where no FK exists with empty strings
+    df['REFERENCED_SCHEMA_NAME'] = df['REFERENCED_SCHEMA_NAME'].fillna('')
+    df['REFERENCED_TABLE_NAME'] = df['REFERENCED_TABLE_NAME'].fillna('')
+    df['REFERENCED_COLUMN_NAME'] = df['REFERENCED_COLUMN_NAME'].fillna('')
+    df['COLUMN_KEY'] = df['COLUMN_KEY'].fillna('') # Fill None with empty string for cleaner checks in validation
+    
+    return df
+
 async def fetch_full_schema_dataframe(db_connector: DatabaseConnector) -> pd.DataFrame:
     """
     Fetches the entire database schema using DatabaseConnector and returns it as a Pandas DataFrame.
@@ -72,35 +115,7 @@ async def fetch_full_schema_dataframe(db_connector: DatabaseConnector) -> pd.Dat
         rows = await db_connector.execute_query(GET_SCHEMA_SQL, fetch=True)
         
         if rows:
-            df = pd.DataFrame(rows)
-            # Ensure consistent column names (lowercase to uppercase for consistency with previous examples)
-            df.columns = [col.upper() for col in df.columns] 
-            # Rename specific columns for clarity with previous logic if needed (adjust based on your GET_SCHEMA_SQL output)
-            df.rename(columns={
-                'TABLE_NAME': 'TABLE_NAME',
-                'COLUMN_NAME': 'COLUMN_NAME',
-                'DATA_TYPE': 'DATA_TYPE',
-                'COLUMN_KEY': 'COLUMN_KEY', # 'PRI', 'MUL', or None
-                'REFERENCED_SCHEMA_NAME': 'REFERENCED_SCHEMA_NAME', # Added this for completeness
-                'REFERENCED_TABLE_NAME': 'REFERENCED_TABLE_NAME',
-                'REFERENCED_COLUMN_NAME': 'REFERENCED_COLUMN_NAME'
-            }, inplace=True)
-            
-            # --- ADD THESE LINES TO NORMALIZE CASE ---
-            df['TABLE_NAME'] = df['TABLE_NAME'].str.upper()
-            df['COLUMN_NAME'] = df['COLUMN_NAME'].str.upper()
-            if 'REFERENCED_TABLE_NAME' in df.columns:
-                df['REFERENCED_TABLE_NAME'] = df['REFERENCED_TABLE_NAME'].str.upper()
-            if 'REFERENCED_COLUMN_NAME' in df.columns:
-                df['REFERENCED_COLUMN_NAME'] = df['REFERENCED_COLUMN_NAME'].str.upper()
-            # --- END ADDED LINES ---
-
-            # Fill NaN for referenced tables/columns where no FK exists with empty strings
-            df['REFERENCED_SCHEMA_NAME'] = df['REFERENCED_SCHEMA_NAME'].fillna('')
-            df['REFERENCED_TABLE_NAME'] = df['REFERENCED_TABLE_NAME'].fillna('')
-            df['REFERENCED_COLUMN_NAME'] = df['REFERENCED_COLUMN_NAME'].fillna('')
-            df['COLUMN_KEY'] = df['COLUMN_KEY'].fillna('') # Fill None with empty string for cleaner checks in validation
-            
+            df = schema_rows_to_dataframe(rows)
             print("Database schema fetched and converted to DataFrame successfully.")
             return df
         else:
@@ -115,6 +130,23 @@ async def fetch_full_schema_dataframe(db_connector: DatabaseConnector) -> pd.Dat
         print(f" 4. The SQL query itself (GET_SCHEMA_SQL) or the database's information_schema structure.")
         return pd.DataFrame() # Return empty DataFrame on error
 
+async def fetch_tables_schema_dataframe(db_connector: DatabaseConnector, table_names: List[str]) -> pd.DataFrame:
+    """
+    Fetches the schema rows of only `table_names` (case-insensitive). Tables that no longer
+    exist simply have no rows. Raises on database errors so callers can keep their snapshot.
+    """
+    if not table_names:
+        return pd.DataFrame()
+    rows = await db_connector.execute_query(
+        GET_TABLES_SCHEMA_SQL, (sorted({name.lower() for name in table_names}),), fetch=True
+    )
+    return schema_rows_to_dataframe(rows) if rows else pd.DataFrame()
+
+async def fetch_table_names(db_connector: DatabaseConnector) -> List[str]:
+    """Upper-cased names of all tables in the schema. Raises on database errors."""
+    rows = await db_connector.execute_query(GET_TABLE_NAMES_SQL, fetch=True)
+    return [row['table_name'].upper() for row in rows or []]
+
 # --- Test block to verify schema fetching directly in this file ---
 if __name__ == "__main__":
     async def run_schema_full_tests():
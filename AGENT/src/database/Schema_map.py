@@ -1,2183 +0,0 @@
-# This file is automatically generated and updated by schema_updater.py
-# DO NOT EDIT MANUALLY - your changes will be overwritten.
-
-SCHEMA_MAP = \
-{   'ACCESSDELEGATIONS': {   'columns': [   'DELEGATIONID',
-                                            'FROMUSERID',
-                                            'TOUSERID',
-                                            'STARTDATE',
-                                            'ENDDATE',
-                                            'REASON',
-                                            'ISACTIVE',
-                                            'CREATEDBY',
-                                            'DATECREATED'],
-                             'synonyms': [],
-                             'table': 'ACCESSDELEGATIONS'},
-    'BILL_OF_MATERIAL': {   'columns': [   'ID',
-                                           'USER_CREATED',
-                                           'DATE_CREATED',
-                                           'USER_UPDATED',
-                                           'DATE_UPDATED',
-                                           'BOM_ID',
-                                           'QUANTITY',
-                                           'UOM_ID',
-                                           'BOM_DATE',
-                                           'EFFECTIVE_DATE',
-                                           'BOM',
-                                           'TYPE',
-                                           'PRODUCT_CODE',
-                                           'ITEM_CODE'],
-                            'synonyms': [],
-                            'table': 'BILL_OF_MATERIAL'},
-    'BOM_NAME': {   'columns': ['ID', 'USER_CREATED', 'DATE_CREATED', 'USER_UPDATED', 'DATE_UPDATED', 'NAME'],
-                    'synonyms': [],
-                    'table': 'BOM_NAME'},
-    'BOM_TYPE': {   'columns': ['ID', 'USER_CREATED', 'DATE_CREATED', 'USER_UPDATED', 'DATE_UPDATED', 'NAME'],
-                    'synonyms': [],
-                    'table': 'BOM_TYPE'},
-    'CATEGORIES': {   'columns': [   'ID',
-                                     'USER_CREATED',
-                                     'DATE_CREATED',
-                                     'USER_UPDATED',
-                                     'DATE_UPDATED',
-                                     'NAME',
-                                     'ISACTIVE'],
-                      'synonyms': [],
-                      'table': 'CATEGORIES'},
-    'CS_ACCOUNTING_PERIODS': {   'columns': [   'PERIOD_ID',
-                                                'COMPANY_ID',
-                                                'COMPANY_ID',
-                                                'PERIOD_NAME',
-                                                'START_DATE',
-                                                'END_DATE',
-                                                'STATUS',
-                                                'IS_CURRENT_ACTIVE',
-                                                'CREATED_AT',
-                                                'UPDATED_AT'],
-                                 'synonyms': [],
-                                 'table': 'CS_ACCOUNTING_PERIODS'},
-    'CS_BANK_ACCOUNTS': {   'columns': [   'BANK_ACCOUNT_ID',
-                                           'COMPANY_ID',
-                                           'COMPANY_ID',
-                                           'COMPANY_ID',
-                                           'COMPANY_ID',
-                                           'BANK_NAME',
-                                           'BANK_BRANCH_NAME',
-                                           'ACCOUNT_NUMBER',
-                                           'IFSC_CODE',
-                                           'SWIFT_CODE',
-                                           'PURPOSE',
-                                           'CURRENCY',
-                                           'CREATED_AT',
-                                           'UPDATED_AT'],
-                            'synonyms': [],
-                            'table': 'CS_BANK_ACCOUNTS'},
-    'CS_BANK_ACCOUNT_BRANCHES': {   'columns': ['BANK_ACCOUNT_ID', 'BANK_ACCOUNT_ID', 'BRANCH_ID'],
-                                    'synonyms': [],
-                                    'table': 'CS_BANK_ACCOUNT_BRANCHES'},
-    'CS_BRANCHES': {   'columns': [   'BRANCH_ID',
-                                      'COMPANY_ID',
-                                      'COMPANY_ID',
-                                      'BRANCH_CODE',
-                                      'BRANCH_NAME',
-                                      'BRANCH_ADDRESS_LINE1',
-                                      'BRANCH_ADDRESS_LINE2',
-                                      'CITY',
-                                      'STATE',
-                                      'PINCODE',
-                                      'BRANCH_PHONE_NUMBER',
-                                      'BRANCH_EMAIL_ADDRESS',
-                                      'BRANCH_GSTIN',
-                                      'CREATED_AT',
-                                      'UPDATED_AT',
-                                      'IS_ACTIVE',
-                                      'IS_HEAD_OFFICE'],
-                       'synonyms': [],
-                       'table': 'CS_BRANCHES'},
-    'CS_BRANCH_COST_CENTRES': {   'columns': ['BRANCH_ID', 'BRANCH_ID', 'COST_CENTRE_ID', 'COST_CENTRE_ID'],
-                                  'synonyms': [],
-                                  'table': 'CS_BRANCH_COST_CENTRES'},
-    'CS_BRANCH_WAREHOUSES': {   'columns': ['BRANCH_ID', 'BRANCH_ID', 'WAREHOUSE_ID', 'WAREHOUSE_ID'],
-                                'synonyms': [],
-                                'table': 'CS_BRANCH_WAREHOUSES'},
-    'CS_CHART_OF_ACCOUNTS': {   'columns': [   'ACCOUNT_ID',
-                                               'COMPANY_ID',
-                                               'PARENT_ACCOUNT_ID',
-                                               'ACCOUNT_CODE',
-                                               'ACCOUNT_NAME',
-                                               'ACCOUNT_TYPE',
-                                               'IS_ACTIVE',
-                                               'COST_CENTRE_ALLOCATION_REQUIRED',
-                                               'CREATED_AT',
-                                               'UPDATED_AT'],
-                                'synonyms': [],
-                                'table': 'CS_CHART_OF_ACCOUNTS'},
-    'CS_COMPANIES': {   'columns': [   'COMPANY_ID',
-                                       'PARENT_COMPANY_ID',
-                                       'LEGAL_COMPANY_NAME',
-                                       'REGISTERED_ADDRESS_LINE1',
-                                       'REGISTERED_ADDRESS_LINE2',
-                                       'CITY',
-                                       'STATE',
-                                       'PINCODE',
-                                       'PHONE_NUMBER',
-                                       'EMAIL_ADDRESS',
-                                       'WEBSITE_URL',
-                                       'COMPANY_LOGO_PATH',
-                                       'BASE_CURRENCY',
-                                       'FINANCIAL_YEAR_START_DATE',
-                                       'FINANCIAL_YEAR_END_DATE',
-                                       'PAN',
-                                       'TAN',
-                                       'GSTIN',
-                                       'LEGAL_ENTITY_TYPE',
-                                       'LEGAL_NAME_AS_PER_PAN_TAN',
-                                       'CREATED_AT',
-                                       'UPDATED_AT'],
-                        'synonyms': [],
-                        'table': 'CS_COMPANIES'},
-    'CS_COST_CENTRES': {   'columns': [   'COST_CENTRE_ID',
-                                          'COMPANY_ID',
-                                          'PARENT_COST_CENTRE_ID',
-                                          'COST_CENTRE_CODE',
-                                          'COST_CENTRE_NAME',
-                                          'IS_ACTIVE',
-                                          'CREATED_AT',
-                                          'UPDATED_AT'],
-                           'synonyms': [],
-                           'table': 'CS_COST_CENTRES'},
-    'CS_DEFAULT_ACCOUNT_MAPPINGS': {   'columns': [   'MAPPING_ID',
-                                                      'COMPANY_ID',
-                                                      'COMPANY_ID',
-                                                      'TRANSACTION_TYPE',
-                                                      'DEFAULT_DEBIT_ACCOUNT_ID',
-                                                      'DEFAULT_CREDIT_ACCOUNT_ID',
-                                                      'CREATED_AT',
-                                                      'UPDATED_AT'],
-                                       'synonyms': [],
-                                       'table': 'CS_DEFAULT_ACCOUNT_MAPPINGS'},
-    'CS_GST_RATES': {   'columns': [   'GST_RATE_ID',
-                                       'COMPANY_ID',
-                                       'COMPANY_ID',
-                                       'HSN_SAC_CODE',
-                                       'IS_HSN',
-                                       'GST_RATE',
-                                       'EFFECTIVE_DATE',
-                                       'CREATED_AT',
-                                       'UPDATED_AT'],
-                        'synonyms': [],
-                        'table': 'CS_GST_RATES'},
-    'CS_HSN_CODES': {   'columns': [   'HSN_CODE_ID',
-                                       'COMPANY_ID',
-                                       'COMPANY_ID',
-                                       'HSN_CODE',
-                                       'DESCRIPTION',
-                                       'DEFAULT_GST_RATE',
-                                       'CREATED_AT',
-                                       'UPDATED_AT'],
-                        'synonyms': [],
-                        'table': 'CS_HSN_CODES'},
-    'CS_INTERCOMPANY_ACCOUNTS': {   'columns': [   'INTERCOMPANY_ACCOUNT_ID',
-                                                   'RELATIONSHIP_ID',
-                                                   'RELATIONSHIP_ID',
-                                                   'TRANSACTION_TYPE',
-                                                   'COMPANY1_RECEIVABLE_ACCOUNT_ID',
-                                                   'COMPANY2_PAYABLE_ACCOUNT_ID',
-                                                   'COMPANY1_TAX_TREATMENT_RULE',
-                                                   'COMPANY2_TAX_TREATMENT_RULE',
-                                                   'CREATED_AT',
-                                                   'UPDATED_AT'],
-                                    'synonyms': [],
-                                    'table': 'CS_INTERCOMPANY_ACCOUNTS'},
-    'CS_INTERCOMPANY_RELATIONSHIPS': {   'columns': [   'RELATIONSHIP_ID',
-                                                        'COMPANY1_ID',
-                                                        'COMPANY1_ID',
-                                                        'COMPANY2_ID',
-                                                        'COMPANY2_ID',
-                                                        'RELATIONSHIP_TYPE',
-                                                        'IS_ACTIVE',
-                                                        'CREATED_AT',
-                                                        'UPDATED_AT'],
-                                         'synonyms': [],
-                                         'table': 'CS_INTERCOMPANY_RELATIONSHIPS'},
-    'CS_INVENTORY_LOCATIONS': {   'columns': [   'LOCATION_ID',
-                                                 'WAREHOUSE_ID',
-                                                 'LOCATION_CODE',
-                                                 'LOCATION_NAME',
-                                                 'LOCATION_CATEGORY',
-                                                 'CAPACITY_WEIGHT',
-                                                 'CAPACITY_WEIGHT_UOM',
-                                                 'CAPACITY_VOLUME',
-                                                 'CAPACITY_VOLUME_UOM',
-                                                 'CAPACITY_ITEM_COUNT',
-                                                 'CREATED_AT',
-                                                 'UPDATED_AT'],
-                                  'synonyms': [],
-                                  'table': 'CS_INVENTORY_LOCATIONS'},
-    'CS_OPENING_BALANCES': {   'columns': [   'BALANCE_ID',
-                                              'COMPANY_ID',
-                                              'COMPANY_ID',
-                                              'ACCOUNT_ID',
-                                              'ACCOUNT_ID',
-                                              'PERIOD_ID',
-                                              'PERIOD_ID',
-                                              'BALANCE_AMOUNT',
-                                              'BALANCE_TYPE',
-                                              'CREATED_AT',
-                                              'UPDATED_AT'],
-                               'synonyms': [],
-                               'table': 'CS_OPENING_BALANCES'},
-    'CS_PAYMENT_TERMS': {   'columns': [   'TERM_ID',
-                                           'COMPANY_ID',
-                                           'COMPANY_ID',
-                                           'TERM_NAME',
-                                           'CALCULATION_TYPE',
-                                           'DUE_DAYS',
-                                           'DISCOUNT_PERCENTAGE',
-                                           'DISCOUNT_DAYS',
-                                           'CREATED_AT',
-                                           'UPDATED_AT'],
-                            'synonyms': [],
-                            'table': 'CS_PAYMENT_TERMS'},
-    'CS_SAC_CODES': {   'columns': [   'SAC_CODE_ID',
-                                       'COMPANY_ID',
-                                       'COMPANY_ID',
-                                       'SAC_CODE',
-                                       'DESCRIPTION',
-                                       'DEFAULT_GST_RATE',
-                                       'CREATED_AT',
-                                       'UPDATED_AT'],
-                        'synonyms': [],
-                        'table': 'CS_SAC_CODES'},
-    'CS_TDS_RATES': {   'columns': [   'TDS_RATE_ID',
-                                       'COMPANY_ID',
-                                       'COMPANY_ID',
-                                       'SECTION_TYPE',
-                                       'THRESHOLD_AMOUNT',
-                                       'RATE',
-                                       'EFFECTIVE_DATE',
-                                       'CREATED_AT',
-                                       'UPDATED_AT'],
-                        'synonyms': [],
-                        'table': 'CS_TDS_RATES'},
-    'CS_WAREHOUSES': {   'columns': [   'WAREHOUSE_ID',
-                                        'COMPANY_ID',
-                                        'COMPANY_ID',
-                                        'BRANCH_ID',
-                                        'WAREHOUSE_CODE',
-                                        'WAREHOUSE_NAME',
-                                        'WAREHOUSE_ADDRESS_LINE1',
-                                        'WAREHOUSE_ADDRESS_LINE2',
-                                        'CITY',
-                                        'STATE',
-                                        'PINCODE',
-                                        'DEFAULT_INVENTORY_LOCATION_ID',
-                                        'CREATED_AT',
-                                        'UPDATED_AT'],
-                         'synonyms': [],
-                         'table': 'CS_WAREHOUSES'},
-    'CURRENCIES': {   'columns': [   'CURRENCY_ID',
-                                     'CURRENCY_CODE',
-                                     'CURRENCY_NAME',
-                                     'CURRENCY_SYMBOL',
-                                     'DECIMAL_PLACES',
-                                     'IS_BASE_CURRENCY',
-                                     'IS_ACTIVE',
-                                     'CREATED_BY',
-                                     'CREATED_DATE',
-                                     'MODIFIED_BY',
-                                     'MODIFIED_DATE'],
-                      'synonyms': [],
-                      'table': 'CURRENCIES'},
-    'CURRENCY_EXCHANGE_RATES': {   'columns': [   'EXCHANGE_RATE_ID',
-                                                  'COMPANY_ID',
-                                                  'FROM_CURRENCY_ID',
-                                                  'TO_CURRENCY_ID',
-                                                  'RATE_DATE',
-                                                  'EXCHANGE_RATE',
-                                                  'RATE_TYPE',
-                                                  'RATE_SOURCE',
-                                                  'IS_ACTIVE',
-                                                  'EFFECTIVE_FROM_DATE',
-                                                  'EFFECTIVE_TO_DATE',
-                                                  'CREATED_BY',
-                                                  'CREATED_DATE',
-                                                  'MODIFIED_BY',
-                                                  'MODIFIED_DATE'],
-                                   'synonyms': [],
-                                   'table': 'CURRENCY_EXCHANGE_RATES'},
-    'DELEGATIONPERMISSIONS': {   'columns': ['DELEGATIONID', 'DELEGATIONID', 'PERMISSIONID', 'PERMISSIONID'],
-                                 'synonyms': [],
-                                 'table': 'DELEGATIONPERMISSIONS'},
-    'DELIVERIES': {   'columns': [   'ID',
-                                     'USER_CREATED',
-                                     'DATE_CREATED',
-                                     'USER_UPDATED',
-                                     'DATE_UPDATED',
-                                     'SALES_ORDER_ID',
-                                     'PO_ID',
-                                     'DELIVERY_ID',
-                                     'DELIVERY_DATE',
-                                     'DELIVERY_STATUS',
-                                     'PRIORITY',
-                                     'TRANSPORTER_NAME',
-                                     'DISPATCH_ADDRESS',
-                                     'VEHICLE_NO',
-                                     'DRIVER_NAME',
-                                     'DRIVER_CONTACT',
-                                     'MODE_OF_DELIVERY',
-                                     'INVOICE_ID'],
-                      'synonyms': [],
-                      'table': 'DELIVERIES'},
-    'DELIVERY_ITEMS': {   'columns': [   'ITEM_ID',
-                                         'DELIVERY_ID',
-                                         'PRODUCT_ID',
-                                         'USER_CREATED',
-                                         'DATE_CREATED',
-                                         'USER_UPDATED',
-                                         'DATE_UPDATED',
-                                         'QTY',
-                                         'AMOUNT',
-                                         'IS_ACTIVE',
-                                         'UNIT_PRICE',
-                                         'INCLUDED_CHILD_ITEM_IDS',
-                                         'ACCESSORIES_IDS'],
-                          'synonyms': [],
-                          'table': 'DELIVERY_ITEMS'},
-    'DEMO_ASSIGNMENTS': {   'columns': [   'ID',
-                                           'USER_CREATED',
-                                           'DATE_CREATED',
-                                           'USER_UPDATED',
-                                           'DATE_UPDATED',
-                                           'DEMO_ITEM_ID',
-                                           'ASSIGNED_TO_TYPE',
-                                           'ASSIGNED_TO_ID',
-                                           'ASSIGNMENT_START_DATE',
-                                           'EXPECTED_RETURN_DATE',
-                                           'ACTUAL_RETURN_DATE',
-                                           'STATUS'],
-                            'synonyms': [],
-                            'table': 'DEMO_ASSIGNMENTS'},
-    'DEMO_CHECKLISTS': {   'columns': [   'ID',
-                                          'CHECKLIST_ID',
-                                          'CHECKLIST_NAME',
-                                          'DEMO_ID',
-                                          'CREATED_AT',
-                                          'UPDATED_AT',
-                                          'IS_ACTIVE'],
-                           'synonyms': [],
-                           'table': 'DEMO_CHECKLISTS'},
-    'DEMO_CHECKLIST_ITEMS': {   'columns': ['ID', 'CHECKLIST_NAME', 'CREATED_AT', 'UPDATED_AT', 'IS_ACTIVE'],
-                                'synonyms': [],
-                                'table': 'DEMO_CHECKLIST_ITEMS'},
-    'DEMO_INVENTORY': {   'columns': [   'ID',
-                                         'ITEM_ID',
-                                         'STATUS',
-                                         'CONDITION',
-                                         'DEMO_START_DATE',
-                                         'DEMO_EXPECTED_END_DATE',
-                                         'DEMO_ACTUAL_END_DATE',
-                                         'ASSIGNED_TO_TYPE',
-                                         'NOTES',
-                                         'ORIGINAL_COST',
-                                         'CURRENT_VALUE',
-                                         'LAST_INSPECTION_DATE',
-                                         'LAST_MAINTENANCE_DATE',
-                                         'USER_CREATED',
-                                         'DATE_CREATED',
-                                         'USER_UPDATED',
-                                         'DATE_UPDATED'],
-                          'synonyms': [],
-                          'table': 'DEMO_INVENTORY'},
-    'DEPARTMENTS': {'columns': ['DEPARTMENT_ID', 'NAME', 'DESCRIPTION'], 'synonyms': [], 'table': 'DEPARTMENTS'},
-    'EMPLOYEE': {   'columns': [   'EMPLOYEEID',
-                                   'USERID',
-                                   'USERID',
-                                   'DESIGNATION',
-                                   'DATEOFJOINING',
-                                   'SALARY',
-                                   'MANAGERID',
-                                   'DEPARTMENTID'],
-                    'synonyms': [],
-                    'table': 'EMPLOYEE'},
-    'FINANCIAL_STATEMENT_LINE_ITEMS': {   'columns': [   'LINE_ITEM_ID',
-                                                         'SECTION_ID',
-                                                         'SECTION_ID',
-                                                         'LINE_ITEM_CODE',
-                                                         'LINE_ITEM_NAME',
-                                                         'LINE_ITEM_ORDER',
-                                                         'LINE_ITEM_LEVEL',
-                                                         'IS_TOTAL_LINE',
-                                                         'IS_CALCULATED',
-                                                         'CALCULATION_FORMULA',
-                                                         'SHOW_IN_REPORT',
-                                                         'INDENT_LEVEL',
-                                                         'IS_ACTIVE',
-                                                         'CREATED_BY',
-                                                         'CREATED_DATE',
-                                                         'MODIFIED_BY',
-                                                         'MODIFIED_DATE'],
-                                          'synonyms': [],
-                                          'table': 'FINANCIAL_STATEMENT_LINE_ITEMS'},
-    'FINANCIAL_STATEMENT_SECTIONS': {   'columns': [   'SECTION_ID',
-                                                       'TEMPLATE_ID',
-                                                       'TEMPLATE_ID',
-                                                       'SECTION_CODE',
-                                                       'SECTION_NAME',
-                                                       'SECTION_ORDER',
-                                                       'PARENT_SECTION_ID',
-                                                       'SECTION_LEVEL',
-                                                       'IS_TOTAL_SECTION',
-                                                       'SIGN_MULTIPLIER',
-                                                       'IS_ACTIVE',
-                                                       'CREATED_BY',
-                                                       'CREATED_DATE',
-                                                       'MODIFIED_BY',
-                                                       'MODIFIED_DATE'],
-                                        'synonyms': [],
-                                        'table': 'FINANCIAL_STATEMENT_SECTIONS'},
-    'FINANCIAL_STATEMENT_TEMPLATES': {   'columns': [   'TEMPLATE_ID',
-                                                        'TEMPLATE_CODE',
-                                                        'TEMPLATE_NAME',
-                                                        'TEMPLATE_TYPE',
-                                                        'TEMPLATE_DESCRIPTION',
-                                                        'ACCOUNTING_STANDARD',
-                                                        'IS_DEFAULT',
-                                                        'IS_ACTIVE',
-                                                        'CREATED_BY',
-                                                        'CREATED_DATE',
-                                                        'MODIFIED_BY',
-                                                        'MODIFIED_DATE'],
-                                         'synonyms': [],
-                                         'table': 'FINANCIAL_STATEMENT_TEMPLATES'},
-    'GEOGRAPHICAL_DIVISIONS': {   'columns': [   'DIVISION_ID',
-                                                 'DIVISION_NAME',
-                                                 'DIVISION_TYPE',
-                                                 'PARENT_DIVISION_ID',
-                                                 'PARENT_DIVISION_ID',
-                                                 'CREATED_AT',
-                                                 'UPDATED_AT',
-                                                 'CREATED_BY',
-                                                 'UPDATED_BY'],
-                                  'synonyms': [],
-                                  'table': 'GEOGRAPHICAL_DIVISIONS'},
-    'INTERNAL_DISCUSSION': {   'columns': [   'ID',
-                                              'USER_CREATED',
-                                              'DATE_CREATED',
-                                              'USER_UPDATED',
-                                              'DATE_UPDATED',
-                                              'COMMENT',
-                                              'PARENT',
-                                              'STAGE',
-                                              'STAGE_ITEM_ID',
-                                              'SEEN_BY',
-                                              'USER_NAME'],
-                               'synonyms': [],
-                               'table': 'INTERNAL_DISCUSSION'},
-    'INVENTORY_ITEMS': {   'columns': [   'ID',
-                                          'USER_CREATED',
-                                          'DATE_CREATED',
-                                          'USER_UPDATED',
-                                          'DATE_UPDATED',
-                                          'QUANTITY',
-                                          'HSN',
-                                          'RACK',
-                                          'SHELF',
-                                          'COLUMN',
-                                          'BRAND',
-                                          'UOM',
-                                          'STATUS',
-                                          'MAKE_ID',
-                                          'MODEL_ID',
-                                          'PRODUCT_ID',
-                                          'CATEGORY_ID',
-                                          'ITEM_CODE',
-                                          'ITEM_NAME',
-                                          'ITEM_DESCRIPTION',
-                                          'INTERNAL_SERIAL_NUM',
-                                          'EXTERNAL_SERIAL_NUM',
-                                          'TAX_PERCENTAGE',
-                                          'CRITICAL',
-                                          'PARENT_ITEMS_CODE',
-                                          'VALUATION_METHOD',
-                                          'CATEGORY_NO',
-                                          'STANDARD_SELLING_RATE',
-                                          'MINIMUM_SELLING_RATE',
-                                          'UNIT_OF_MEASURES',
-                                          'GROUP_OF_ITEM',
-                                          'SUPPLIER_ID',
-                                          'SALES_ACCOUNT',
-                                          'SAFETY_STOCK',
-                                          'BUYING_UNIT_OF_MEASURE',
-                                          'ITEM_FULL_NAME',
-                                          'CONSUMPTION_UOM',
-                                          'BUOM_TO_UOM',
-                                          'ITEM_FOR',
-                                          'CUOM_TO_UOM',
-                                          'REORDER_QTY',
-                                          'PURCHASE_ACCOUNT',
-                                          'ISACTIVE',
-                                          'CATEGORY_NAME',
-                                          'INVENTORY_ITEM_CATEGORIES_ID',
-                                          'PARENT_INVENTORY_ITEMS_ID'],
-                           'synonyms': [],
-                           'table': 'INVENTORY_ITEMS'},
-    'INVENTORY_ITEMS_SERIAL_NUM': {   'columns': [   'ID',
-                                                     'USER_CREATED',
-                                                     'DATE_CREATED',
-                                                     'USER_UPDATED',
-                                                     'DATE_UPDATED',
-                                                     'ITEM_ID',
-                                                     'INVENTORY_WAREHOUSE_ID',
-                                                     'INTERNAL_SERIAL_NUM',
-                                                     'EXTERNAL_SERIAL_NUM'],
-                                      'synonyms': [],
-                                      'table': 'INVENTORY_ITEMS_SERIAL_NUM'},
-    'INVENTORY_ITEM_BOUGHT_RATE': {   'columns': [   'ID',
-                                                     'USER_CREATED',
-                                                     'DATE_CREATED',
-                                                     'USER_UPDATED',
-                                                     'DATE_UPDATED',
-                                                     'BOUGHT_DATE',
-                                                     'ITEM_ID',
-                                                     'BATCH_ID',
-                                                     'UNIT_OF_MEASURES',
-                                                     'RATE',
-                                                     'PIECE_ID',
-                                                     'INACTIVE'],
-                                      'synonyms': [],
-                                      'table': 'INVENTORY_ITEM_BOUGHT_RATE'},
-    'INVENTORY_ITEM_CATEGORIES': {   'columns': [   'ID',
-                                                    'USER_CREATED',
-                                                    'DATE_CREATED',
-                                                    'USER_UPDATED',
-                                                    'DATE_UPDATED',
-                                                    'DESCRIPTION',
-                                                    'NAME',
-                                                    'ISACTIVE'],
-                                     'synonyms': [],
-                                     'table': 'INVENTORY_ITEM_CATEGORIES'},
-    'INVENTORY_ITEM_SUPPLIERS': {   'columns': [   'ID',
-                                                   'USER_CREATED',
-                                                   'DATE_CREATED',
-                                                   'USER_UPDATED',
-                                                   'DATE_UPDATED',
-                                                   'DESCRIPTION',
-                                                   'NAME',
-                                                   'ITEM_ID',
-                                                   'LAST_PURCHASED_DATE',
-                                                   'AVERAGE_LEAD_TIME',
-                                                   'NOTES',
-                                                   'RATE',
-                                                   'INACTIVE'],
-                                    'synonyms': [],
-                                    'table': 'INVENTORY_ITEM_SUPPLIERS'},
-    'INVENTORY_STOCK_LEVEL': {   'columns': [   'ID',
-                                                'USER_CREATED',
-                                                'DATE_CREATED',
-                                                'USER_UPDATED',
-                                                'DATE_UPDATED',
-                                                'UUID',
-                                                'ITEMCODE',
-                                                'QUANTITYONHAND',
-                                                'LOCATION'],
-                                 'synonyms': [],
-                                 'table': 'INVENTORY_STOCK_LEVEL'},
-    'ITEM_MASTER': {   'columns': [   'ID',
-                                      'USER_CREATED',
-                                      'DATE_CREATED',
-                                      'USER_UPDATED',
-                                      'DATE_UPDATED',
-                                      'CATEGORY',
-                                      'MAKE',
-                                      'MODEL',
-                                      'ITEM_NAME',
-                                      'ITEM_CODE',
-                                      'DEFAULT_PURCHASE_PRICE',
-                                      'DEFAULT_SALE_PRICE',
-                                      'IS_ACTIVE',
-                                      'REORDER_LEVEL',
-                                      'MAXIMUM_STOCK_LEVEL',
-                                      'IMAGE_URL',
-                                      'PRODUCT',
-                                      'UNIT_PRICE',
-                                      'UOM',
-                                      'CAT_NO',
-                                      'INVENTORY_METHOD',
-                                      'LP_RATE',
-                                      'HSN',
-                                      'TAX_PERCENTAGE',
-                                      'VALUATION_METHOD',
-                                      'PARENT_ID'],
-                       'synonyms': [],
-                       'table': 'ITEM_MASTER'},
-    'ITEM_RATES': {   'columns': [   'ID',
-                                     'USER_CREATED',
-                                     'DATE_CREATED',
-                                     'USER_UPDATED',
-                                     'DATE_UPDATED',
-                                     'ITEM_CODE',
-                                     'RATE',
-                                     'EFFECTIVE_DATE',
-                                     'END_DATE',
-                                     'ITEM_RATE_MASTER_ID'],
-                      'synonyms': [],
-                      'table': 'ITEM_RATES'},
-    'JOURNAL_ENTRY_TEMPLATES': {   'columns': [   'TEMPLATE_ID',
-                                                  'COMPANY_ID',
-                                                  'TEMPLATE_CODE',
-                                                  'TEMPLATE_NAME',
-                                                  'TEMPLATE_DESCRIPTION',
-                                                  'TEMPLATE_CATEGORY_ID',
-                                                  'FREQUENCY',
-                                                  'IS_ACTIVE',
-                                                  'AUTO_REVERSE',
-                                                  'AUTO_REVERSE_DAYS',
-                                                  'APPROVAL_REQUIRED',
-                                                  'APPROVAL_WORKFLOW_ID',
-                                                  'AUTO_GENERATE',
-                                                  'NEXT_GENERATION_DATE',
-                                                  'LAST_GENERATED_DATE',
-                                                  'GENERATION_COUNT',
-                                                  'TAGS',
-                                                  'CREATED_BY',
-                                                  'CREATED_DATE',
-                                                  'MODIFIED_BY',
-                                                  'MODIFIED_DATE'],
-                                   'synonyms': [],
-                                   'table': 'JOURNAL_ENTRY_TEMPLATES'},
-    'JOURNAL_ENTRY_TEMPLATE_LINES': {   'columns': [   'TEMPLATE_LINE_ID',
-                                                       'TEMPLATE_ID',
-                                                       'LINE_NUMBER',
-                                                       'ACCOUNT_ID',
-                                                       'ACCOUNT_CODE',
-                                                       'ACCOUNT_NAME',
-                                                       'DEBIT_AMOUNT',
-                                                       'CREDIT_AMOUNT',
-                                                       'AMOUNT_TYPE',
-                                                       'PERCENTAGE_BASE',
-                                                       'VARIABLE_NAME',
-                                                       'CALCULATION_FORMULA',
-                                                       'DESCRIPTION',
-                                                       'COST_CENTER_REQUIRED',
-                                                       'COST_CENTER_ID',
-                                                       'DIMENSION_1',
-                                                       'DIMENSION_2',
-                                                       'DIMENSION_3',
-                                                       'NARRATION_TEMPLATE',
-                                                       'IS_MANDATORY',
-                                                       'IS_ACTIVE',
-                                                       'CREATED_BY',
-                                                       'CREATED_DATE',
-                                                       'MODIFIED_BY',
-                                                       'MODIFIED_DATE'],
-                                        'synonyms': [],
-                                        'table': 'JOURNAL_ENTRY_TEMPLATE_LINES'},
-    'JOURNAL_TEMPLATE_CATEGORIES': {   'columns': [   'CATEGORY_ID',
-                                                      'COMPANY_ID',
-                                                      'CATEGORY_CODE',
-                                                      'CATEGORY_NAME',
-                                                      'CATEGORY_DESCRIPTION',
-                                                      'PARENT_CATEGORY_ID',
-                                                      'DISPLAY_ORDER',
-                                                      'IS_ACTIVE',
-                                                      'CREATED_BY',
-                                                      'CREATED_DATE',
-                                                      'MODIFIED_BY',
-                                                      'MODIFIED_DATE'],
-                                       'synonyms': [],
-                                       'table': 'JOURNAL_TEMPLATE_CATEGORIES'},
-    'JOURNAL_TEMPLATE_GENERATION_HISTORY': {   'columns': [   'GENERATION_ID',
-                                                              'TEMPLATE_ID',
-                                                              'COMPANY_ID',
-                                                              'JOURNAL_ENTRY_ID',
-                                                              'GENERATION_DATE',
-                                                              'GENERATION_TYPE',
-                                                              'GENERATED_BY',
-                                                              'VARIABLE_VALUES',
-                                                              'GENERATION_STATUS',
-                                                              'ERROR_MESSAGE',
-                                                              'PROCESSING_TIME_MS',
-                                                              'CREATED_BY',
-                                                              'CREATED_DATE'],
-                                               'synonyms': [],
-                                               'table': 'JOURNAL_TEMPLATE_GENERATION_HISTORY'},
-    'JOURNAL_TEMPLATE_USAGE_STATS': {   'columns': [   'STATS_ID',
-                                                       'TEMPLATE_ID',
-                                                       'TEMPLATE_ID',
-                                                       'COMPANY_ID',
-                                                       'PERIOD_MONTH',
-                                                       'PERIOD_YEAR',
-                                                       'USAGE_COUNT',
-                                                       'TOTAL_AMOUNT',
-                                                       'SUCCESS_COUNT',
-                                                       'ERROR_COUNT',
-                                                       'AVG_PROCESSING_TIME_MS',
-                                                       'LAST_USED_DATE',
-                                                       'CREATED_DATE',
-                                                       'UPDATED_DATE'],
-                                        'synonyms': [],
-                                        'table': 'JOURNAL_TEMPLATE_USAGE_STATS'},
-    'JOURNAL_TEMPLATE_VARIABLES': {   'columns': [   'VARIABLE_ID',
-                                                     'TEMPLATE_ID',
-                                                     'TEMPLATE_ID',
-                                                     'VARIABLE_NAME',
-                                                     'VARIABLE_LABEL',
-                                                     'VARIABLE_TYPE',
-                                                     'DATA_TYPE',
-                                                     'LOOKUP_TABLE',
-                                                     'LOOKUP_DISPLAY_FIELD',
-                                                     'LOOKUP_VALUE_FIELD',
-                                                     'DEFAULT_VALUE',
-                                                     'IS_REQUIRED',
-                                                     'VALIDATION_RULE',
-                                                     'HELP_TEXT',
-                                                     'DISPLAY_ORDER',
-                                                     'IS_ACTIVE',
-                                                     'CREATED_BY',
-                                                     'CREATED_DATE',
-                                                     'MODIFIED_BY',
-                                                     'MODIFIED_DATE'],
-                                      'synonyms': [],
-                                      'table': 'JOURNAL_TEMPLATE_VARIABLES'},
-    'MAKES': {   'columns': [   'ID',
-                                'DATE_CREATED',
-                                'DATE_UPDATED',
-                                'NAME',
-                                'USER_CREATED',
-                                'USER_CREATED',
-                                'USER_CREATED',
-                                'USER_CREATED',
-                                'USER_UPDATED',
-                                'USER_UPDATED',
-                                'USER_UPDATED',
-                                'USER_UPDATED',
-                                'ISACTIVE'],
-                 'synonyms': [],
-                 'table': 'MAKES'},
-    'MODELS': {   'columns': [   'ID',
-                                 'DATE_CREATED',
-                                 'DATE_UPDATED',
-                                 'NAME',
-                                 'USER_CREATED',
-                                 'USER_CREATED',
-                                 'USER_CREATED',
-                                 'USER_CREATED',
-                                 'USER_UPDATED',
-                                 'USER_UPDATED',
-                                 'USER_UPDATED',
-                                 'USER_UPDATED',
-                                 'ISACTIVE'],
-                  'synonyms': [],
-                  'table': 'MODELS'},
-    'NOTIFICATION': {   'columns': [   'ID',
-                                       'USER_CREATED',
-                                       'DATE_CREATED',
-                                       'USER_UPDATED',
-                                       'DATE_UPDATED',
-                                       'MESSAGE',
-                                       'REDIRECTURL',
-                                       'USERS_ID'],
-                        'synonyms': [],
-                        'table': 'NOTIFICATION'},
-    'NOTIFICATION_USERS': {   'columns': ['ID', 'NOTIFICATION_ID', 'USERS_ID'],
-                              'synonyms': [],
-                              'table': 'NOTIFICATION_USERS'},
-    'ORDER_ACCEPTANCE': {   'columns': [   'ID',
-                                           'ORDER_ACCEPTANCE_ID',
-                                           'USER_CREATED',
-                                           'DATE_CREATED',
-                                           'USER_UPDATED',
-                                           'DATE_UPDATED',
-                                           'SUBJECT',
-                                           'PURCHASE_ORDER_ID',
-                                           'COMMENTS',
-                                           'FILEURL',
-                                           'FILENAME',
-                                           'QUOTATION_ID'],
-                            'synonyms': [],
-                            'table': 'ORDER_ACCEPTANCE'},
-    'ORGANIZATIONALUNITS': {   'columns': [   'UNITID',
-                                              'UNITNAME',
-                                              'UNITTYPE',
-                                              'DESCRIPTION',
-                                              'PARENTUNITID',
-                                              'MANAGERID',
-                                              'ISACTIVE',
-                                              'DATECREATED',
-                                              'CREATEDBY'],
-                               'synonyms': [],
-                               'table': 'ORGANIZATIONALUNITS'},
-    'PAYMENTS': {   'columns': [   'ID',
-                                   'USER_CREATED',
-                                   'DATE_CREATED',
-                                   'USER_UPDATED',
-                                   'DATE_UPDATED',
-                                   'INVOICE_ID',
-                                   'PAYMENT_DATE',
-                                   'DUE_DATE',
-                                   'PAYMENT_METHOD',
-                                   'AMOUNT_PAID',
-                                   'PAYMENT_STATUS',
-                                   'OUTSTANDING_AMOUNT',
-                                   'TOTAL_AMOUNT'],
-                    'synonyms': [],
-                    'table': 'PAYMENTS'},
-    'PERMISSIONS': {   'columns': ['PERMISSIONID', 'PERMISSIONNAME', 'DESCRIPTION', 'CATEGORY', 'ISACTIVE'],
-                       'synonyms': [],
-                       'table': 'PERMISSIONS'},
-    'PINCODES': {   'columns': [   'ID',
-                                   'USER_CREATED',
-                                   'DATE_CREATED',
-                                   'USER_UPDATED',
-                                   'DATE_UPDATED',
-                                   'PINCODE',
-                                   'SALES_AREAS_ID'],
-                    'synonyms': [],
-                    'table': 'PINCODES'},
-    'PRODUCTS': {   'columns': [   'ID',
-                                   'USER_CREATED',
-                                   'USER_CREATED',
-                                   'USER_CREATED',
-                                   'USER_CREATED',
-                                   'DATE_CREATED',
-                                   'USER_UPDATED',
-                                   'USER_UPDATED',
-                                   'USER_UPDATED',
-                                   'USER_UPDATED',
-                                   'DATE_UPDATED',
-                                   'NAME',
-                                   'ISACTIVE'],
-                    'synonyms': [],
-                    'table': 'PRODUCTS'},
-    'PURCHASE_ORDER': {   'columns': [   'ID',
-                                         'USER_CREATED',
-                                         'DATE_CREATED',
-                                         'USER_UPDATED',
-                                         'DATE_UPDATED',
-                                         'PO_ID',
-                                         'STATUS',
-                                         'CUSTOMER_ID',
-                                         'QUOTATION_ID',
-                                         'FILE_URL',
-                                         'SALES_ORDER_ID',
-                                         'INVOICE_ID',
-                                         'DELIVERY_DATE'],
-                          'synonyms': [],
-                          'table': 'PURCHASE_ORDER'},
-    'QUOTATION_ATTACHMENTS': {   'columns': [   'ID',
-                                                'USER_CREATED',
-                                                'DATE_CREATED',
-                                                'USER_UPDATED',
-                                                'DATE_UPDATED',
-                                                'QUOTATION_ID',
-                                                'FILE_URL',
-                                                'FILE_NAME'],
-                                 'synonyms': [],
-                                 'table': 'QUOTATION_ATTACHMENTS'},
-    'RATE_MASTER': {   'columns': [   'ID',
-                                      'USER_CREATED',
-                                      'DATE_CREATED',
-                                      'USER_UPDATED',
-                                      'DATE_UPDATED',
-                                      'RATE_MASTER_ID',
-                                      'NAME',
-                                      'DESCRIPTION',
-                                      'EFFECTIVE_DATE',
-                                      'END_DATE'],
-                       'synonyms': [],
-                       'table': 'RATE_MASTER'},
-    'RESOURCE_SPENDTIME_AND_MONEY': {   'columns': [   'ID',
-                                                       'USER_CREATED',
-                                                       'DATE_CREATED',
-                                                       'USER_UPDATED',
-                                                       'DATE_UPDATED',
-                                                       'UUID',
-                                                       'STAGE',
-                                                       'RESOURCE',
-                                                       'STAGEITEMID',
-                                                       'SPENDTIME',
-                                                       'MONEYSPEND'],
-                                        'synonyms': [],
-                                        'table': 'RESOURCE_SPENDTIME_AND_MONEY'},
-    'ROLEPERMISSIONS': {   'columns': [   'ROLEID',
-                                          'ROLEID',
-                                          'PERMISSIONID',
-                                          'PERMISSIONID',
-                                          'DATEASSIGNED',
-                                          'ASSIGNEDBY'],
-                           'synonyms': [],
-                           'table': 'ROLEPERMISSIONS'},
-    'ROLES': {   'columns': [   'ROLEID',
-                                'ROLENAME',
-                                'DESCRIPTION',
-                                'ISSYSTEMROLE',
-                                'DATECREATED',
-                                'CREATEDBY',
-                                'ISACTIVE'],
-                 'synonyms': [],
-                 'table': 'ROLES'},
-    'SALES_ACTIVITY_CALLS': {   'columns': [   'ID',
-                                               'USER_CREATED',
-                                               'DATE_CREATED',
-                                               'USER_UPDATED',
-                                               'DATE_UPDATED',
-                                               'CALL_TITLE',
-                                               'PARTICIPANTS',
-                                               'CALL_MODE',
-                                               'CALL_TYPE',
-                                               'CALL_DATETIME',
-                                               'STATUS',
-                                               'DESCRIPTION',
-                                               'DURATION',
-                                               'PRIORITY',
-                                               'CALL_AGENDA',
-                                               'OUTCOME',
-                                               'CALL_RESULT',
-                                               'FILE_URL',
-                                               'STAGE_ITEM_ID',
-                                               'STAGE',
-                                               'CALL_ID',
-                                               'SALES_ACTIVITY_CHECKLISTS_ID',
-                                               'ISACTIVE',
-                                               'CALL_WITH',
-                                               'COMMENTS',
-                                               'GROUP_WITH',
-                                               'ASSIGNED_TO'],
-                                'synonyms': [],
-                                'table': 'SALES_ACTIVITY_CALLS'},
-    'SALES_ACTIVITY_CHECKLISTS': {   'columns': [   'ID',
-                                                    'USER_CREATED',
-                                                    'DATE_CREATED',
-                                                    'USER_UPDATED',
-                                                    'DATE_UPDATED',
-                                                    'DESCRIPTION',
-                                                    'DONE',
-                                                    'CHECK_LIST_TITLE'],
-                                     'synonyms': [],
-                                     'table': 'SALES_ACTIVITY_CHECKLISTS'},
-    'SALES_ACTIVITY_EVENTS': {   'columns': [   'ID',
-                                                'USER_CREATED',
-                                                'DATE_CREATED',
-                                                'USER_UPDATED',
-                                                'DATE_UPDATED',
-                                                'EVENT_TITLE',
-                                                'GUESTS',
-                                                'START_DATE',
-                                                'END_DATE',
-                                                'START_TIME',
-                                                'END_TIME',
-                                                'PARTICIPANT',
-                                                'EVENT_LOCATION',
-                                                'DESCRIPTION',
-                                                'STATUS',
-                                                'PRIORITY',
-                                                'FILE_URL',
-                                                'STAGE_ITEM_ID',
-                                                'STAGE',
-                                                'EVENT_ID',
-                                                'SALES_ACTIVITY_CHECKLISTS_ID',
-                                                'ISACTIVE',
-                                                'COMMENTS',
-                                                'ASSIGNED_TO'],
-                                 'synonyms': [],
-                                 'table': 'SALES_ACTIVITY_EVENTS'},
-    'SALES_ACTIVITY_MASTER': {   'columns': [   'ID',
-                                                'USER_CREATED',
-                                                'DATE_CREATED',
-                                                'USER_UPDATED',
-                                                'DATE_UPDATED',
-                                                'STAGE',
-                                                'TYPE',
-                                                'NAME',
-                                                'ORDER'],
-                                 'synonyms': [],
-                                 'table': 'SALES_ACTIVITY_MASTER'},
-    'SALES_ACTIVITY_MEETINGS': {   'columns': [   'ID',
-                                                  'USER_CREATED',
-                                                  'DATE_CREATED',
-                                                  'USER_UPDATED',
-                                                  'DATE_UPDATED',
-                                                  'MEETING_TYPE',
-                                                  'CUSTOMER_NAME',
-                                                  'CUSTOMER_ID',
-                                                  'MEETING_TITLE',
-                                                  'DESCRIPTION',
-                                                  'MEETING_DATE_TIME',
-                                                  'DURATION',
-                                                  'STATUS',
-                                                  'PARTICIPANT',
-                                                  'FILE_URL',
-                                                  'STAGE_ITEM_ID',
-                                                  'PARENT_MEETING',
-                                                  'STAGE',
-                                                  'ACTIVITY_CHECK_LISTS_ID',
-                                                  'ACTIVITY_PARENT_MEETINGS_ID',
-                                                  'CITY',
-                                                  'AREA',
-                                                  'ADDRESS',
-                                                  'COMMENTS',
-                                                  'DELEGATE',
-                                                  'ASSIGNED_TO'],
-                                   'synonyms': [],
-                                   'table': 'SALES_ACTIVITY_MEETINGS'},
-    'SALES_ACTIVITY_TASKS': {   'columns': [   'ID',
-                                               'USER_CREATED',
-                                               'DATE_CREATED',
-                                               'USER_UPDATED',
-                                               'DATE_UPDATED',
-                                               'TASK_TYPE',
-                                               'TASK_NAME',
-                                               'DUE_DATE',
-                                               'DESCRIPTION',
-                                               'PRIORITY',
-                                               'CUSTOMER_NAME',
-                                               'CUSTOMER_ID',
-                                               'ITEM_LINK',
-                                               'STATUS',
-                                               'PARENT_TASK_ID',
-                                               'SUB_TASKS',
-                                               'ALLOW_COMPLETION',
-                                               'STAGE_ITEM_ID',
-                                               'STAGE',
-                                               'TASK_ID',
-                                               'SALES_ACTIVITY_CHECKLISTS_ID',
-                                               'ISACTIVE',
-                                               'TO_DO',
-                                               'COMMENTS',
-                                               'ASSIGNED_TO'],
-                                'synonyms': [],
-                                'table': 'SALES_ACTIVITY_TASKS'},
-    'SALES_ADDRESSES': {   'columns': [   'ID',
-                                          'USER_CREATED',
-                                          'DATE_CREATED',
-                                          'USER_UPDATED',
-                                          'DATE_UPDATED',
-                                          'CONTACT_NAME',
-                                          'TYPE',
-                                          'CITY',
-                                          'STATE',
-                                          'PINCODE',
-                                          'ISACTIVE',
-                                          'BLOCK',
-                                          'DEPARTMENT',
-                                          'AREA',
-                                          'OPPORTUNITY_ID',
-                                          'DOOR_NO',
-                                          'STREET',
-                                          'LAND_MARK',
-                                          'IS_DEFAULT',
-                                          'SALES_LEAD_ID'],
-                           'synonyms': [],
-                           'table': 'SALES_ADDRESSES'},
-    'SALES_AREAS': {   'columns': [   'ID',
-                                      'USER_CREATED',
-                                      'DATE_CREATED',
-                                      'USER_UPDATED',
-                                      'DATE_UPDATED',
-                                      'NAME',
-                                      'SALES_CITIES_ID',
-                                      'PINCODE',
-                                      'DESCRIPTION'],
-                       'synonyms': [],
-                       'table': 'SALES_AREAS'},
-    'SALES_ATTACHMENTS': {   'columns': [   'ID',
-                                            'USER_CREATED',
-                                            'DATE_CREATED',
-                                            'USER_UPDATED',
-                                            'DATE_UPDATED',
-                                            'FILE_URL',
-                                            'FILE_NAME',
-                                            'STAGE',
-                                            'USER_INTERFACE_ID'],
-                             'synonyms': [],
-                             'table': 'SALES_ATTACHMENTS'},
-    'SALES_BANK_ACCOUNT': {   'columns': [   'ID',
-                                             'USER_CREATED',
-                                             'DATE_CREATED',
-                                             'USER_UPDATED',
-                                             'DATE_UPDATED',
-                                             'BRANCH',
-                                             'REGISTERED_COMPANY',
-                                             'NAME_OF_THE_BANK',
-                                             'ACCOUNT_NO',
-                                             'IFSC_CODE',
-                                             'ACCOUNT_HOLDER_NAME',
-                                             'ISACTIVE'],
-                              'synonyms': [],
-                              'table': 'SALES_BANK_ACCOUNT'},
-    'SALES_CITIES': {   'columns': [   'ID',
-                                       'USER_CREATED',
-                                       'DATE_CREATED',
-                                       'USER_UPDATED',
-                                       'DATE_UPDATED',
-                                       'NAME',
-                                       'SALES_DISTRICTS_ID',
-                                       'CITY_CODE',
-                                       'DESCRIPTION'],
-                        'synonyms': [],
-                        'table': 'SALES_CITIES'},
-    'SALES_CONTACTS': {   'columns': [   'ID',
-                                         'USER_CREATED',
-                                         'DATE_CREATED',
-                                         'USER_UPDATED',
-                                         'DATE_UPDATED',
-                                         'CONTACT_NAME',
-                                         'DEPARTMENT_NAME',
-                                         'SPECIALIST',
-                                         'DEGREE',
-                                         'EMAIL',
-                                         'MOBILE_NO',
-                                         'WEBSITE',
-                                         'ISACTIVE',
-                                         'OWN_CLINIC',
-                                         'VISITING_HOURS',
-                                         'CLINIC_VISITING_HOURS',
-                                         'SALES_LEAD_ID_CUSTOM',
-                                         'LAND_LINE_NO',
-                                         'FAX',
-                                         'SALUTATION',
-                                         'JOB_TITLE',
-                                         'IS_DEFAULT',
-                                         'SALES_LEAD_ID'],
-                          'synonyms': [],
-                          'table': 'SALES_CONTACTS'},
-    'SALES_COUNTRIES': {   'columns': [   'ID',
-                                          'USER_CREATED',
-                                          'DATE_CREATED',
-                                          'USER_UPDATED',
-                                          'DATE_UPDATED',
-                                          'NAME',
-                                          'DESCRIPTION'],
-                           'synonyms': [],
-                           'table': 'SALES_COUNTRIES'},
-    'SALES_CURRENCY_LIST': {   'columns': [   'ID',
-                                              'USER_CREATED',
-                                              'DATE_CREATED',
-                                              'USER_UPDATED',
-                                              'DATE_UPDATED',
-                                              'CURRENCYNAME',
-                                              'CURRENCYCODE',
-                                              'EXCHANGERATE'],
-                               'synonyms': [],
-                               'table': 'SALES_CURRENCY_LIST'},
-    'SALES_CUSTOMERS': {   'columns': [   'ID',
-                                          'USER_CREATED',
-                                          'USER_CREATED',
-                                          'USER_CREATED',
-                                          'USER_CREATED',
-                                          'DATE_CREATED',
-                                          'USER_UPDATED',
-                                          'USER_UPDATED',
-                                          'USER_UPDATED',
-                                          'USER_UPDATED',
-                                          'DATE_UPDATED',
-                                          'CUSTOMER_ID',
-                                          'FIRST_DEAL_ID',
-                                          'PRIMARY_CONTACT',
-                                          'CUSTOMER_TYPE',
-                                          'SOURCE',
-                                          'SOCIAL_MEDIA',
-                                          'REFERRAL_SOURCE_NAME',
-                                          'HOSPITAL_OF_REFERRAL',
-                                          'DEPARTMENT_OF_REFERRAL',
-                                          'CITY_OF_REFERRAL',
-                                          'EVENT_NAME',
-                                          'EVENT_DATE',
-                                          'STATUS',
-                                          'TERRITORY_ID',
-                                          'CITY_ID',
-                                          'CUSTOMER_INTERNAL_ID',
-                                          'SALES_PERSON_ID',
-                                          'EMAIL_OPT_OUT',
-                                          'RATING',
-                                          'PHONE_NO',
-                                          'PHONE_EXT',
-                                          'TICKER_SYMBOL',
-                                          'EMPLOYEES',
-                                          'ANNUAL_REVENUE',
-                                          'NIC_CODE',
-                                          'PARENT_CUSTOMER',
-                                          'OWNERSHIP',
-                                          'WEBSITE',
-                                          'FAX',
-                                          'PAYMENT_TERM',
-                                          'CREDIT_LIMIT',
-                                          'LOYALTY_PROGRAM',
-                                          'SALES_PARTNER',
-                                          'COOMMISSION_RATE',
-                                          'TOTAL_RECEIVABLE',
-                                          'OUTSTANDING',
-                                          'ACCOUNT_BALANCE',
-                                          'NAME',
-                                          'TERRITORY',
-                                          'ISACTIVE'],
-                           'synonyms': [],
-                           'table': 'SALES_CUSTOMERS'},
-    'SALES_CUSTOMER_ADDRESSES': {   'columns': [   'ID',
-                                                   'USER_CREATED',
-                                                   'DATE_CREATED',
-                                                   'USER_UPDATED',
-                                                   'DATE_UPDATED',
-                                                   'CONTACTNAME',
-                                                   'TYPE',
-                                                   'CITY',
-                                                   'STATE',
-                                                   'PINCODE',
-                                                   'INACTIVE',
-                                                   'CUSTOMERID',
-                                                   'BLOCK',
-                                                   'DEPARTMENT',
-                                                   'TERRITORY',
-                                                   'TOCOMMUNICATION',
-                                                   'AREA',
-                                                   'DOORNO',
-                                                   'STREET',
-                                                   'LANDMARK',
-                                                   'DEFAULT',
-                                                   'SALES_CUSTOMER_CONTACTSID'],
-                                    'synonyms': [],
-                                    'table': 'SALES_CUSTOMER_ADDRESSES'},
-    'SALES_CUSTOMER_ATTACHMENTS': {   'columns': [   'ID',
-                                                     'USER_CREATED',
-                                                     'DATE_CREATED',
-                                                     'USER_UPDATED',
-                                                     'DATE_UPDATED',
-                                                     'STAGE_ID',
-                                                     'PARENT_ID',
-                                                     'FILE_NAME',
-                                                     'DESCRIPTION',
-                                                     'DATE',
-                                                     'TYPE'],
-                                      'synonyms': [],
-                                      'table': 'SALES_CUSTOMER_ATTACHMENTS'},
-    'SALES_CUSTOMER_CONTACTS': {   'columns': [   'ID',
-                                                  'USER_CREATED',
-                                                  'DATE_CREATED',
-                                                  'USER_UPDATED',
-                                                  'DATE_UPDATED',
-                                                  'CONTACTNAME',
-                                                  'JOBTITLE',
-                                                  'DEPARTMENTNAME',
-                                                  'SPECIALIST',
-                                                  'DEGREE',
-                                                  'EMAIL',
-                                                  'INACTIVE',
-                                                  'CUSTOMERID',
-                                                  'MOBILENO',
-                                                  'WEBSITE',
-                                                  'VISITINGHOURS',
-                                                  'OWNCLINIC',
-                                                  'CLINICVISITINGHOURS',
-                                                  'LANDLINENO',
-                                                  'FAX',
-                                                  'SALUTATION',
-                                                  'DEFAULT',
-                                                  'SALES_CUSTOMERSID'],
-                                   'synonyms': [],
-                                   'table': 'SALES_CUSTOMER_CONTACTS'},
-    'SALES_CUSTOMER_HISTORY': {   'columns': [   'ID',
-                                                 'USER_CREATED',
-                                                 'DATE_CREATED',
-                                                 'USER_UPDATED',
-                                                 'DATE_UPDATED',
-                                                 'DATE',
-                                                 'STAGE',
-                                                 'TITLE',
-                                                 'COMMENTS'],
-                                  'synonyms': [],
-                                  'table': 'SALES_CUSTOMER_HISTORY'},
-    'SALES_CUSTOMER_MAILS': {   'columns': [   'ID',
-                                               'USER_CREATED',
-                                               'DATE_CREATED',
-                                               'USER_UPDATED',
-                                               'DATE_UPDATED',
-                                               'STAGE_ID',
-                                               'PARENT_ID',
-                                               'TYPE',
-                                               'DATE',
-                                               'TITLE',
-                                               'BODY',
-                                               'SENDER',
-                                               'RECEIVER'],
-                                'synonyms': [],
-                                'table': 'SALES_CUSTOMER_MAILS'},
-    'SALES_CUSTOMER_PAYMENTS': {   'columns': [   'ID',
-                                                  'USER_CREATED',
-                                                  'DATE_CREATED',
-                                                  'USER_UPDATED',
-                                                  'DATE_UPDATED',
-                                                  'CUSTOMER_ID',
-                                                  'PAYMENT_TYPE_ID',
-                                                  'AMOUNT',
-                                                  'INVOICE_ID',
-                                                  'PAID_DATE',
-                                                  'CHEQUE_NO',
-                                                  'CHEQUE_BANK_NAME',
-                                                  'MODE_OF_PAYMENT',
-                                                  'OUTSTANDING',
-                                                  'ADVANCE',
-                                                  'TERMS',
-                                                  'CONDITION',
-                                                  'TERM_CONDITION_TEMPLATE',
-                                                  'PAYMENT_TERMS',
-                                                  'NOTES'],
-                                   'synonyms': [],
-                                   'table': 'SALES_CUSTOMER_PAYMENTS'},
-    'SALES_CUSTOMER_PAYMENT_DETAILS': {   'columns': [   'ID',
-                                                         'USER_CREATED',
-                                                         'DATE_CREATED',
-                                                         'USER_UPDATED',
-                                                         'DATE_UPDATED',
-                                                         'PAYMENT_ID',
-                                                         'INVOICE_ID',
-                                                         'RECEIVED_AMOUNT',
-                                                         'NOTES'],
-                                          'synonyms': [],
-                                          'table': 'SALES_CUSTOMER_PAYMENT_DETAILS'},
-    'SALES_DEMOS': {   'columns': [   'ID',
-                                      'USER_CREATED',
-                                      'DATE_CREATED',
-                                      'USER_UPDATED',
-                                      'DATE_UPDATED',
-                                      'USER_ID',
-                                      'DEMO_DATE',
-                                      'STATUS',
-                                      'OPPORTUNITY_ID',
-                                      'CUSTOMER_ID',
-                                      'DEMO_CONTACT',
-                                      'CUSTOMER_NAME',
-                                      'DEMO_APPROACH',
-                                      'DEMO_OUTCOME',
-                                      'DEMO_FEEDBACK',
-                                      'COMMENTS',
-                                      'LEADID',
-                                      'CONTACT_MOBILE_NUM',
-                                      'ADDRESS',
-                                      'PRESENTER_IDS',
-                                      'DEMO_TIME',
-                                      'DEMO_NAME'],
-                       'synonyms': [],
-                       'table': 'SALES_DEMOS'},
-    'SALES_DEMO_ACCESSORIES': {   'columns': [   'ID',
-                                                 'SALES_DEMO_ITEM_ID',
-                                                 'ACCESSORIES_ITEM_ID',
-                                                 'CREATED_AT',
-                                                 'UPDATED_AT'],
-                                  'synonyms': [],
-                                  'table': 'SALES_DEMO_ACCESSORIES'},
-    'SALES_DEMO_CHILD_ITEMS': {   'columns': ['ID', 'SALES_DEMO_ITEM_ID', 'CHILD_ITEM_ID', 'CREATED_AT', 'UPDATED_AT'],
-                                  'synonyms': [],
-                                  'table': 'SALES_DEMO_CHILD_ITEMS'},
-    'SALES_DEMO_ITEMS': {   'columns': [   'ID',
-                                           'DEMO_ID',
-                                           'USER_CREATED',
-                                           'DATE_CREATED',
-                                           'USER_UPDATED',
-                                           'DATE_UPDATED',
-                                           'QTY',
-                                           'AMOUNT',
-                                           'IS_ACTIVE',
-                                           'ITEM_ID',
-                                           'UNIT_PRICE',
-                                           'STAGE',
-                                           'STAGE_ITEM_ID'],
-                            'synonyms': [],
-                            'table': 'SALES_DEMO_ITEMS'},
-    'SALES_DEMO_PRESENTERS': {   'columns': ['ID', 'DEMO_ID', 'PRESENTER_ID'],
-                                 'synonyms': [],
-                                 'table': 'SALES_DEMO_PRESENTERS'},
-    'SALES_DISCOUNT': {   'columns': [   'ID',
-                                         'USER_CREATED',
-                                         'DATE_CREATED',
-                                         'USER_UPDATED',
-                                         'DATE_UPDATED',
-                                         'CALCULATIONBASEDON',
-                                         'FROMVALUE',
-                                         'TOVALUE',
-                                         'AMOUNT',
-                                         'PERCENTAGE',
-                                         'PRODUCTCODE',
-                                         'PRODUCTCATEGORY',
-                                         'INACTIVE',
-                                         'CUSTOMERID',
-                                         'DEFAULT',
-                                         'CUSTOMER_ID',
-                                         'PRODUCT_ID'],
-                          'synonyms': [],
-                          'table': 'SALES_DISCOUNT'},
-    'SALES_DISTRICTS': {   'columns': [   'ID',
-                                          'USER_CREATED',
-                                          'DATE_CREATED',
-                                          'USER_UPDATED',
-                                          'DATE_UPDATED',
-                                          'NAME',
-                                          'SALES_TERRITORIES_ID'],
-                           'synonyms': [],
-                           'table': 'SALES_DISTRICTS'},
-    'SALES_DOCUMENTS': {   'columns': [   'ID',
-                                          'USER_CREATED',
-                                          'DATE_CREATED',
-                                          'USER_UPDATED',
-                                          'DATE_UPDATED',
-                                          'FILE_URL',
-                                          'TITLE',
-                                          'FILE_TYPE',
-                                          'FILE_NAME',
-                                          'ICON_URL',
-                                          'DESCRIPTION',
-                                          'ISACTIVE',
-                                          'DOCUMENT_ID',
-                                          'STAGE',
-                                          'STAGE_ITEM_ID'],
-                           'synonyms': [],
-                           'table': 'SALES_DOCUMENTS'},
-    'SALES_EMPLOYEES': {   'columns': [   'ID',
-                                          'USER_CREATED',
-                                          'DATE_CREATED',
-                                          'USER_UPDATED',
-                                          'DATE_UPDATED',
-                                          'EMPLOYEE_ID',
-                                          'NAME',
-                                          'COMPANY',
-                                          'DEPARTMENT',
-                                          'ROLE',
-                                          'DEPARTMENT_TYPE',
-                                          'MARITAL_STATUS',
-                                          'JOINING_DATE',
-                                          'GENDER',
-                                          'MOBILE_NO',
-                                          'COMPANY_MOBILE',
-                                          'EMERGENCY_CONTACT_NAME',
-                                          'EMERGENCY_PHONE',
-                                          'RELATION',
-                                          'EMAIL_ID',
-                                          'COMPANY_EMAIL_ID',
-                                          'COMPANY_MOBILE_IMEI_NO',
-                                          'COMPANY_MOBILE_MODEL',
-                                          'REPORT_TO',
-                                          'STATUS_ID',
-                                          'FAMILY',
-                                          'HEALTH_DETAILS',
-                                          'LANGUAGE_KNOWN',
-                                          'HOME_ADDRESS',
-                                          'SALES_TERRITORIES_ID',
-                                          'ISACTIVE'],
-                           'synonyms': [],
-                           'table': 'SALES_EMPLOYEES'},
-    'SALES_EXTERNAL_COMMENTS': {   'columns': [   'ID',
-                                                  'USER_CREATED',
-                                                  'DATE_CREATED',
-                                                  'USER_UPDATED',
-                                                  'DATE_UPDATED',
-                                                  'TITLE',
-                                                  'DESCRIPTION',
-                                                  'DATE_TIME',
-                                                  'ACTIVITY_ID',
-                                                  'STAGE',
-                                                  'STAGE_ITEM_ID',
-                                                  'ISACTIVE'],
-                                   'synonyms': [],
-                                   'table': 'SALES_EXTERNAL_COMMENTS'},
-    'SALES_FLOW_MASTER': {   'columns': [   'ID',
-                                            'USER_CREATED',
-                                            'DATE_CREATED',
-                                            'USER_UPDATED',
-                                            'DATE_UPDATED',
-                                            'STAGE',
-                                            'TASKNAME',
-                                            'MEETINGNAME',
-                                            'MULTITIMEAFTER',
-                                            'PARENTINTERNALIDS'],
-                             'synonyms': [],
-                             'table': 'SALES_FLOW_MASTER'},
-    'SALES_INVOICES': {   'columns': [   'ID',
-                                         'USER_CREATED',
-                                         'DATE_CREATED',
-                                         'USER_UPDATED',
-                                         'DATE_UPDATED',
-                                         'QUOTATION_ID',
-                                         'PO_ID',
-                                         'SALES_ORDER_ID',
-                                         'INVOICE_ID',
-                                         'INVOICE_DATE',
-                                         'TOTAL_AMOUNT',
-                                         'STATUS',
-                                         'QUANTITY',
-                                         'ITEM_ID',
-                                         'UNIT_PRICE',
-                                         'AMOUNT',
-                                         'DELIVERY_ID'],
-                          'synonyms': [],
-                          'table': 'SALES_INVOICES'},
-    'SALES_INVOICE_ITEMS': {   'columns': [   'ID',
-                                              'INVOICE_ID',
-                                              'PO_ID',
-                                              'ITEM_ID',
-                                              'QUANTITY',
-                                              'UNIT_PRICE',
-                                              'AMOUNT',
-                                              'CREATED_AT'],
-                               'synonyms': [],
-                               'table': 'SALES_INVOICE_ITEMS'},
-    'SALES_ITEMS': {   'columns': [   'ID',
-                                      'QTY',
-                                      'AMOUNT',
-                                      'ITEM_ID',
-                                      'STAGE',
-                                      'STAGE_ITEM_ID',
-                                      'IS_ACTIVE',
-                                      'UNIT_PRICE',
-                                      'USER_CREATED',
-                                      'DATE_CREATED',
-                                      'USER_UPDATED',
-                                      'DATE_UPDATED'],
-                       'synonyms': [],
-                       'table': 'SALES_ITEMS'},
-    'SALES_ITEM_COUPEN_CODES': {   'columns': [   'ID',
-                                                  'USER_CREATED',
-                                                  'DATE_CREATED',
-                                                  'USER_UPDATED',
-                                                  'DATE_UPDATED',
-                                                  'CUSTOMERID',
-                                                  'AMOUNT',
-                                                  'PERCENTAGE',
-                                                  'PRODUCTCATEGORIES',
-                                                  'COUPENCODE',
-                                                  'EXPIREDATE',
-                                                  'PRODUCTCODE',
-                                                  'DEFAULT',
-                                                  'CUSTOMER_ID',
-                                                  'PRODUCT_ID'],
-                                   'synonyms': [],
-                                   'table': 'SALES_ITEM_COUPEN_CODES'},
-    'SALES_ITEM_SHIPPING_RULES': {   'columns': [   'ID',
-                                                    'USER_CREATED',
-                                                    'DATE_CREATED',
-                                                    'USER_UPDATED',
-                                                    'DATE_UPDATED',
-                                                    'CALCULATIONBASEDON',
-                                                    'FROMVALUE',
-                                                    'TOVALUE',
-                                                    'SHIPMENTAMOUNT',
-                                                    'FOR',
-                                                    'CUSTOMERID',
-                                                    'PRODUCTCODE',
-                                                    'DEFAULT',
-                                                    'CUSTOMER_ID',
-                                                    'PRODUCT_ID'],
-                                     'synonyms': [],
-                                     'table': 'SALES_ITEM_SHIPPING_RULES'},
-    'SALES_LEAD': {   'columns': [   'ID',
-                                     'USER_CREATED',
-                                     'DATE_CREATED',
-                                     'USER_UPDATED',
-                                     'DATE_UPDATED',
-                                     'CUSTOMER_NAME',
-                                     'LEAD_SOURCE',
-                                     'REFERRAL_SOURCE_NAME',
-                                     'HOSPITAL_OF_REFERRAL',
-                                     'DEPARTMENT_OF_REFERRAL',
-                                     'SOCIAL_MEDIA',
-                                     'EVENT_DATE',
-                                     'EVENT_NAME',
-                                     'LEAD_ID',
-                                     'STATUS',
-                                     'SCORE',
-                                     'ISACTIVE',
-                                     'COMMENTS',
-                                     'LEAD_TYPE',
-                                     'CONTACT_NAME',
-                                     'SALUTATION',
-                                     'CONTACT_MOBILE_NO',
-                                     'LAND_LINE_NO',
-                                     'EMAIL',
-                                     'FAX',
-                                     'DOOR_NO',
-                                     'STREET',
-                                     'LANDMARK',
-                                     'WEBSITE',
-                                     'GEO_DIVISIONS_ID',
-                                     'TERRITORY',
-                                     'AREA_ID',
-                                     'AREA',
-                                     'CITY',
-                                     'PINCODE_ID',
-                                     'PINCODE',
-                                     'DISTRICT',
-                                     'STATE',
-                                     'COUNTRY',
-                                     'CONVERTED_CUSTOMER_ID'],
-                      'synonyms': [],
-                      'table': 'SALES_LEAD'},
-    'SALES_MAILS': {   'columns': [   'ID',
-                                      'USER_CREATED',
-                                      'DATE_CREATED',
-                                      'USER_UPDATED',
-                                      'DATE_UPDATED',
-                                      'FROM_EMAIL',
-                                      'TO_EMAIL',
-                                      'CC_EMAIL',
-                                      'SUBJECT',
-                                      'BODY',
-                                      'SEEN_BY',
-                                      'SEND_DATE',
-                                      'RECEIVE_DATE',
-                                      'LEAD_ID',
-                                      'OPPORTUNITY_ID',
-                                      'MAIL_TYPE',
-                                      'MAIL_ID',
-                                      'PARENT_ID',
-                                      'IS_LAST_REPLY',
-                                      'ISACTIVE'],
-                       'synonyms': [],
-                       'table': 'SALES_MAILS'},
-    'SALES_MAIL_DRAFTS': {   'columns': [   'ID',
-                                            'USER_CREATED',
-                                            'DATE_CREATED',
-                                            'USER_UPDATED',
-                                            'DATE_UPDATED',
-                                            'FROM_EMAIL',
-                                            'TO_EMAIL',
-                                            'CC_EMAIL',
-                                            'SUBJECT',
-                                            'BODY',
-                                            'ISACTIVE',
-                                            'LEAD_ID',
-                                            'OPPORTUNITY_ID',
-                                            'DRAFT_ID'],
-                             'synonyms': [],
-                             'table': 'SALES_MAIL_DRAFTS'},
-    'SALES_MAIL_SENT': {   'columns': [   'ID',
-                                          'USER_CREATED',
-                                          'DATE_CREATED',
-                                          'USER_UPDATED',
-                                          'DATE_UPDATED',
-                                          'FROM_EMAIL',
-                                          'TO_EMAIL',
-                                          'CC_EMAIL',
-                                          'SUBJECT',
-                                          'BODY',
-                                          'SEND_DATE',
-                                          'LEAD_ID',
-                                          'OPPORTUNITY_ID',
-                                          'IS_LAST_REPLY',
-                                          'MAIL_ID',
-                                          'ISACTIVE'],
-                           'synonyms': [],
-                           'table': 'SALES_MAIL_SENT'},
-    'SALES_OPPORTUNITIES': {   'columns': [   'ID',
-                                              'USER_CREATED',
-                                              'DATE_CREATED',
-                                              'USER_UPDATED',
-                                              'DATE_UPDATED',
-                                              'STATUS',
-                                              'EXPECTED_COMPLETION',
-                                              'OPPORTUNITY_TYPE',
-                                              'OPPORTUNITY_FOR',
-                                              'CUSTOMER_ID',
-                                              'CUSTOMER_NAME',
-                                              'CUSTOMER_TYPE',
-                                              'OPPORTUNITY_NAME',
-                                              'OPPORTUNITY_ID',
-                                              'COMMENTS',
-                                              'ISACTIVE',
-                                              'LEAD_ID',
-                                              'SALES_REPRESENTATIVE_ID',
-                                              'CONTACT_NAME',
-                                              'CONTACT_MOBILE_NO'],
-                               'synonyms': [],
-                               'table': 'SALES_OPPORTUNITIES'},
-    'SALES_ORDERS': {   'columns': [   'ID',
-                                       'ORDER_ID',
-                                       'ORDER_ID',
-                                       'CUSTOMER_ID',
-                                       'ORDER_DATE',
-                                       'EXPECTED_DELIVERY_DATE',
-                                       'STATUS',
-                                       'QUOTATION_ID',
-                                       'PO_ID',
-                                       'ACCEPTANCE_DATE',
-                                       'TOTAL_AMOUNT',
-                                       'TAX_AMOUNT',
-                                       'GRAND_TOTAL',
-                                       'NOTES',
-                                       'USER_CREATED',
-                                       'DATE_CREATED',
-                                       'USER_UPDATED',
-                                       'DATE_UPDATED',
-                                       'FREIGHT_CHARGE'],
-                        'synonyms': [],
-                        'table': 'SALES_ORDERS'},
-    'SALES_PRICING_RULES': {   'columns': [   'ID',
-                                              'USER_CREATED',
-                                              'DATE_CREATED',
-                                              'USER_UPDATED',
-                                              'DATE_UPDATED',
-                                              'TITLE',
-                                              'PRODUCTCODES',
-                                              'DESCRIPTION',
-                                              'APPLYON',
-                                              'PRODUCTCATEGORIES',
-                                              'BRANDS',
-                                              'WAREHOUSE'],
-                               'synonyms': [],
-                               'table': 'SALES_PRICING_RULES'},
-    'SALES_PRODUCT': {   'columns': [   'ID',
-                                        'USER_CREATED',
-                                        'DATE_CREATED',
-                                        'USER_UPDATED',
-                                        'DATE_UPDATED',
-                                        'QTY',
-                                        'AMOUNT',
-                                        'IS_ACTIVE',
-                                        'ITEM_ID',
-                                        'STAGE',
-                                        'UNIT_PRICE',
-                                        'STAGE_ITEM_ID',
-                                        'PARENT_ID'],
-                         'synonyms': [],
-                         'table': 'SALES_PRODUCT'},
-    'SALES_PRODUCT_ACCESSORIES': {   'columns': [   'ID',
-                                                    'SALES_PRODUCT_ID',
-                                                    'SALES_PRODUCT_ID',
-                                                    'ACCESSORIES_ITEM_ID',
-                                                    'QUANTITY',
-                                                    'ISACTIVE',
-                                                    'DATE_CREATED',
-                                                    'USER_CREATED',
-                                                    'DATE_UPDATED',
-                                                    'USER_UPDATED'],
-                                     'synonyms': [],
-                                     'table': 'SALES_PRODUCT_ACCESSORIES'},
-    'SALES_PRODUCT_CHILD_ITEMS': {   'columns': [   'ID',
-                                                    'SALES_PRODUCT_ID',
-                                                    'SALES_PRODUCT_ID',
-                                                    'CHILD_ITEM_ID',
-                                                    'QUANTITY',
-                                                    'ISACTIVE',
-                                                    'DATE_CREATED',
-                                                    'USER_CREATED',
-                                                    'DATE_UPDATED',
-                                                    'USER_UPDATED'],
-                                     'synonyms': [],
-                                     'table': 'SALES_PRODUCT_CHILD_ITEMS'},
-    'SALES_PROMOTIONS': {   'columns': [   'ID',
-                                           'USER_CREATED',
-                                           'DATE_CREATED',
-                                           'USER_UPDATED',
-                                           'DATE_UPDATED',
-                                           'PROMOTION_ID',
-                                           'NAME',
-                                           'PROMOTION_TYPE',
-                                           'DISCOUNT_PERCENTAGE',
-                                           'MINIMUM_ORDER_AMOUNT',
-                                           'EFFECTIVE_DATE',
-                                           'END_DATE',
-                                           'IS_ACTIVE'],
-                            'synonyms': [],
-                            'table': 'SALES_PROMOTIONS'},
-    'SALES_PROMOTION_CUSTOMERS': {   'columns': [   'ID',
-                                                    'USER_CREATED',
-                                                    'DATE_CREATED',
-                                                    'USER_UPDATED',
-                                                    'DATE_UPDATED',
-                                                    'PROMOTION_CUSTOMER_ID',
-                                                    'PROMOTION_ID',
-                                                    'CUSTOMER_ID'],
-                                     'synonyms': [],
-                                     'table': 'SALES_PROMOTION_CUSTOMERS'},
-    'SALES_QUOTATIONS': {   'columns': [   'ID',
-                                           'USER_CREATED',
-                                           'DATE_CREATED',
-                                           'USER_UPDATED',
-                                           'DATE_UPDATED',
-                                           'VERSION',
-                                           'TERMS',
-                                           'VALID_TILL',
-                                           'QUOTATION_FOR',
-                                           'STATUS',
-                                           'LOST_REASON',
-                                           'CUSTOMER_ID',
-                                           'QUOTATION_TYPE',
-                                           'QUOTATION_DATE',
-                                           'ORDER_TYPE',
-                                           'COMMENTS',
-                                           'DELIVERY_WITHIN',
-                                           'DELIVERY_AFTER',
-                                           'IS_ACTIVE',
-                                           'QUOTATION_ID',
-                                           'CUSTOMER_NAME',
-                                           'TAXES',
-                                           'DELIVERY',
-                                           'PAYMENT',
-                                           'WARRANTY',
-                                           'FREIGHT_CHARGE',
-                                           'IS_CURRENT',
-                                           'PARENT_SALES_QUOTATIONS_ID',
-                                           'LEAD_ID',
-                                           'OPPORTUNITY_ID',
-                                           'TAX',
-                                           'DISCOUNT',
-                                           'FREIGHT_CHARGES',
-                                           'CONTACT_NAME',
-                                           'CONTACT_MOBILE_NO'],
-                            'synonyms': [],
-                            'table': 'SALES_QUOTATIONS'},
-    'SALES_STATES': {   'columns': [   'ID',
-                                       'USER_CREATED',
-                                       'DATE_CREATED',
-                                       'USER_UPDATED',
-                                       'DATE_UPDATED',
-                                       'NAME',
-                                       'SALES_COUNTRIES_ID'],
-                        'synonyms': [],
-                        'table': 'SALES_STATES'},
-    'SALES_SUMMARIES': {   'columns': [   'ID',
-                                          'USER_CREATED',
-                                          'DATE_CREATED',
-                                          'USER_UPDATED',
-                                          'DATE_UPDATED',
-                                          'ICON_URL',
-                                          'TITLE',
-                                          'DESCRIPTION',
-                                          'DATE_TIME',
-                                          'ISACTIVE',
-                                          'STAGE_ITEM_ID',
-                                          'ENTITIES',
-                                          'STAGE'],
-                           'synonyms': [],
-                           'table': 'SALES_SUMMARIES'},
-    'SALES_SUPPLIER_ADDRESSES': {   'columns': [   'ID',
-                                                   'USER_CREATED',
-                                                   'DATE_CREATED',
-                                                   'USER_UPDATED',
-                                                   'DATE_UPDATED',
-                                                   'TYPE',
-                                                   'SUPPLIER_ID',
-                                                   'CONTACT_NAME',
-                                                   'ADDRESS',
-                                                   'CITY',
-                                                   'STATE',
-                                                   'ZIPCODE',
-                                                   'COUNTRY',
-                                                   'LANDMARK',
-                                                   'EMAIL',
-                                                   'PHONE',
-                                                   'TERMS',
-                                                   'CONDITION',
-                                                   'TERM_CONDITION_TEMPLATE'],
-                                    'synonyms': [],
-                                    'table': 'SALES_SUPPLIER_ADDRESSES'},
-    'SALES_SUPPLIER_CONTACTS': {   'columns': [   'ID',
-                                                  'USER_CREATED',
-                                                  'DATE_CREATED',
-                                                  'USER_UPDATED',
-                                                  'DATE_UPDATED',
-                                                  'NAME',
-                                                  'SALUTATION',
-                                                  'STATUS_ID',
-                                                  'EMAIL',
-                                                  'DESIGNATION',
-                                                  'GENDER',
-                                                  'MOBILE_NO',
-                                                  'ASSISTANT',
-                                                  'ASSISTANT_EMAIL',
-                                                  'ASSISTANT_PHONE',
-                                                  'DATE_OF_BIRTH',
-                                                  'EMAIL_OPT_OUT'],
-                                   'synonyms': [],
-                                   'table': 'SALES_SUPPLIER_CONTACTS'},
-    'SALES_TAXES': {   'columns': [   'ID',
-                                      'USER_CREATED',
-                                      'DATE_CREATED',
-                                      'USER_UPDATED',
-                                      'DATE_UPDATED',
-                                      'STATE',
-                                      'COUNTRY',
-                                      'PERCENTAGE',
-                                      'DESCRIPTION',
-                                      'FOR',
-                                      'TITLE',
-                                      'UUID'],
-                       'synonyms': [],
-                       'table': 'SALES_TAXES'},
-    'SALES_TEMP_LEADS': {   'columns': [   'ID',
-                                           'USER_CREATED',
-                                           'DATE_CREATED',
-                                           'USER_UPDATED',
-                                           'DATE_UPDATED',
-                                           'LEAD_NAME',
-                                           'HOSPITAL_NAME',
-                                           'LEAD_TYPE',
-                                           'ZONE',
-                                           'TERRITORY',
-                                           'LEAD_SOURCE',
-                                           'FOLLOW_UP_TYPE',
-                                           'EXPECTED_COMPLETION',
-                                           'PHONE_NUMBER',
-                                           'MOBILE_NUMBER',
-                                           'JOB_TITLE',
-                                           'EMAIL',
-                                           'CITY',
-                                           'ADDRESS',
-                                           'PINCODE',
-                                           'INACTIVE'],
-                            'synonyms': [],
-                            'table': 'SALES_TEMP_LEADS'},
-    'SALES_TERMS_AND_CONDITIONS': {   'columns': [   'ID',
-                                                     'USER_CREATED',
-                                                     'DATE_CREATED',
-                                                     'USER_UPDATED',
-                                                     'DATE_UPDATED',
-                                                     'TAXES',
-                                                     'FREIGHT_CHARGES',
-                                                     'DELIVERY',
-                                                     'PAYMENT',
-                                                     'WARRANTY',
-                                                     'TEMPLATE_NAME',
-                                                     'IS_DEFAULT',
-                                                     'IS_ACTIVE',
-                                                     'QUOTATION_ID'],
-                                      'synonyms': [],
-                                      'table': 'SALES_TERMS_AND_CONDITIONS'},
-    'SALES_TERRITORIES': {   'columns': [   'ID',
-                                            'USER_CREATED',
-                                            'DATE_CREATED',
-                                            'USER_UPDATED',
-                                            'DATE_UPDATED',
-                                            'NAME',
-                                            'ALIAS'],
-                             'synonyms': [],
-                             'table': 'SALES_TERRITORIES'},
-    'SALES_TIMELINE': {   'columns': [   'ID',
-                                         'USER_CREATED',
-                                         'DATE_CREATED',
-                                         'USER_UPDATED',
-                                         'DATE_UPDATED',
-                                         'UUID',
-                                         'STAGE',
-                                         'STAGEITEMID',
-                                         'SPENDDAY'],
-                          'synonyms': [],
-                          'table': 'SALES_TIMELINE'},
-    'SALES_VISITING_HOURS': {   'columns': [   'ID',
-                                               'USER_CREATED',
-                                               'DATE_CREATED',
-                                               'USER_UPDATED',
-                                               'DATE_UPDATED',
-                                               'FROM',
-                                               'TO',
-                                               'CONTACTID',
-                                               'LEADID',
-                                               'OPPORTUNITYID'],
-                                'synonyms': [],
-                                'table': 'SALES_VISITING_HOURS'},
-    'SALES_WARRANTY': {   'columns': [   'ID',
-                                         'USER_CREATED',
-                                         'DATE_CREATED',
-                                         'USER_UPDATED',
-                                         'DATE_UPDATED',
-                                         'PRODUCT',
-                                         'DESCRIPTION',
-                                         'YEAR',
-                                         'MONTH',
-                                         'PRODUCT_CODE_ID'],
-                          'synonyms': [],
-                          'table': 'SALES_WARRANTY'},
-    'STAGES': {   'columns': [   'ID',
-                                 'USER_CREATED',
-                                 'DATE_CREATED',
-                                 'USER_UPDATED',
-                                 'DATE_UPDATED',
-                                 'ORDER',
-                                 'MODULENAME',
-                                 'STAGENAME',
-                                 'UUID',
-                                 'INACTIVE'],
-                  'synonyms': [],
-                  'table': 'STAGES'},
-    'TASKS': {   'columns': ['ID', 'USER_CREATED', 'DATE_CREATED', 'USER_UPDATED', 'DATE_UPDATED', 'TASKNAME'],
-                 'synonyms': [],
-                 'table': 'TASKS'},
-    'TEAMHIERARCHY': {   'columns': [   'HIERARCHYID',
-                                        'USERID',
-                                        'PARENT_USERID',
-                                        'ROLEID',
-                                        'REGION',
-                                        'ASSIGNEDBY',
-                                        'ASSIGNED_DATE'],
-                         'synonyms': [],
-                         'table': 'TEAMHIERARCHY'},
-    'TESTCHILD': {   'columns': [   'ID',
-                                    'USER_CREATED',
-                                    'DATE_CREATED',
-                                    'USER_UPDATED',
-                                    'DATE_UPDATED',
-                                    'PRODUCT',
-                                    'TEST'],
-                     'synonyms': [],
-                     'table': 'TESTCHILD'},
-    'UNIT_OF_MEASURES': {   'columns': [   'ID',
-                                           'USER_CREATED',
-                                           'DATE_CREATED',
-                                           'USER_UPDATED',
-                                           'DATE_UPDATED',
-                                           'UOM_NAME',
-                                           'DESCRIPTION'],
-                            'synonyms': [],
-                            'table': 'UNIT_OF_MEASURES'},
-    'USER': {   'columns': [   'USERID',
-                               'USERNAME',
-                               'PASSWORDHASH',
-                               'EMAIL',
-                               'FIRSTNAME',
-                               'LASTNAME',
-                               'ROLE',
-                               'ISACTIVE',
-                               'CREATEDAT',
-                               'LASTLOGIN'],
-                'synonyms': [],
-                'table': 'USER'},
-    'USERAUDITLOG': {   'columns': [   'AUDITID',
-                                       'USERID',
-                                       'ACTIONTYPE',
-                                       'ENTITYTYPE',
-                                       'ENTITYID',
-                                       'DESCRIPTION',
-                                       'OLDVALUE',
-                                       'NEWVALUE',
-                                       'IPADDRESS',
-                                       'ACTIONTIME'],
-                        'synonyms': [],
-                        'table': 'USERAUDITLOG'},
-    'USERORGANIZATIONALUNITS': {   'columns': [   'USERID',
-                                                  'USERID',
-                                                  'UNITID',
-                                                  'UNITID',
-                                                  'ISPRIMARY',
-                                                  'DATEASSIGNED',
-                                                  'ASSIGNEDBY'],
-                                   'synonyms': [],
-                                   'table': 'USERORGANIZATIONALUNITS'},
-    'USERPREFERENCES': {   'columns': ['USERID', 'USERID', 'PREFERENCEKEY', 'PREFERENCEVALUE', 'DATEMODIFIED'],
-                           'synonyms': [],
-                           'table': 'USERPREFERENCES'},
-    'USERROLES': {   'columns': ['ID', 'USERID', 'ROLEID', 'DATEASSIGNED', 'ASSIGNEDBY'],
-                     'synonyms': [],
-                     'table': 'USERROLES'},
-    'USERS': {   'columns': [   'USERID',
-                                'USERNAME',
-                                'EMAIL',
-                                'FIRSTNAME',
-                                'LASTNAME',
-                                'PASSWORDHASH',
-                                'PASSWORDSALT',
-                                'PHONENUMBER',
-                                'PROFILEIMAGEURL',
-                                'DATECREATED',
-                                'LASTLOGINDATE',
-                                'ISACTIVE',
-                                'ISLOCKED',
-                                'FAILEDLOGINATTEMPTS',
-                                'RESETPASSWORDTOKEN',
-                                'RESETPASSWORDEXPIRY',
-                                'PREFERREDLANGUAGE',
-                                'TIMEZONE',
-                                'TWOFACTORENABLED',
-                                'TWOFACTORKEY',
-                                'LASTPASSWORDCHANGEDATE',
-                                'REQUIREPASSWORDCHANGE',
-                                'NOTES'],
-                 'synonyms': [],
-                 'table': 'USERS'},
-    'USERSESSIONS': {   'columns': [   'SESSIONID',
-                                       'USERID',
-                                       'LOGINTIME',
-                                       'LOGOUTTIME',
-                                       'IPADDRESS',
-                                       'DEVICEINFO',
-                                       'USERAGENT',
-                                       'ISACTIVE'],
-                        'synonyms': [],
-                        'table': 'USERSESSIONS'},
-    'USERS_SALES_TERRITORIES': {   'columns': ['ID', 'USERS_ID', 'SALES_TERRITORIES_ID'],
-                                   'synonyms': [],
-                                   'table': 'USERS_SALES_TERRITORIES'},
-    'USER_GROUPS': {   'columns': ['ID', 'USER_CREATED', 'DATE_CREATED', 'USER_UPDATED', 'DATE_UPDATED', 'GROUPNAME'],
-                       'synonyms': [],
-                       'table': 'USER_GROUPS'},
-    'USER_LOGIN_HISTORY': {   'columns': [   'LOGINID',
-                                             'USERID',
-                                             'LOGIN_TIME',
-                                             'SUCCESS',
-                                             'IP_ADDRESS',
-                                             'DEVICE_INFO',
-                                             'USER_AGENT',
-                                             'LOCATION',
-                                             'SESSION_ID'],
-                              'synonyms': [],
-                              'table': 'USER_LOGIN_HISTORY'},
-    'VARIANTS': {   'columns': [   'ID',
-                                   'USER_CREATED',
-                                   'DATE_CREATED',
-                                   'USER_UPDATED',
-                                   'DATE_UPDATED',
-                                   'NAME',
-                                   'COLOR',
-                                   'SIZE',
-                                   'MATERIAL',
-                                   'WEIGHT',
-                                   'PRICE',
-                                   'STATUS',
-                                   'PRODUCT_CODE_ID'],
-                    'synonyms': [],
-                    'table': 'VARIANTS'},
-    'VERSION': {   'columns': ['ID', 'USER_CREATED', 'DATE_CREATED', 'USER_UPDATED', 'DATE_UPDATED'],
-                   'synonyms': [],
-                   'table': 'VERSION'},
-    'WARRANTIES': {   'columns': [   'ID',
-                                     'USER_CREATED',
-                                     'DATE_CREATED',
-                                     'USER_UPDATED',
-                                     'DATE_UPDATED',
-                                     'WARRANTYID',
-                                     'NAME'],
-                      'synonyms': [],
-                      'table': 'WARRANTIES'},
-    'WORKFLOW_TASK_CHECK_LISTS': {   'columns': [   'ID',
-                                                    'USER_CREATED',
-                                                    'DATE_CREATED',
-                                                    'USER_UPDATED',
-                                                    'DATE_UPDATED',
-                                                    'TOCHECK',
-                                                    'WORKFLOW_TASK_MASTER_ID'],
-                                     'synonyms': [],
-                                     'table': 'WORKFLOW_TASK_CHECK_LISTS'},
-    'WORKFLOW_TASK_MASTER': {   'columns': [   'ID',
-                                               'USER_CREATED',
-                                               'DATE_CREATED',
-                                               'USER_UPDATED',
-                                               'DATE_UPDATED',
-                                               'TASKNAME',
-                                               'TASKTYPE',
-                                               'STAGE',
-                                               'STATUS',
-                                               'TASKAUTOCOMPLETECONDITION',
-                                               'EXPIRYDAYS',
-                                               'ASSIGNTO',
-                                               'CC',
-                                               'ESCALATEDAYS',
-                                               'ESCALATETO',
-                                               'REQUIRED',
-                                               'TASKTITLE',
-                                               'TASKDESCRIPTION',
-                                               'DUEIN',
-                                               'PARENT_TASK_ID'],
-                                'synonyms': [],
-                                'table': 'WORKFLOW_TASK_MASTER'},
-    'WORKFLOW_TASK_MASTER_WORKFLOW_TASK_MASTER': {   'columns': [   'ID',
-                                                                    'WORKFLOW_TASK_MASTER_ID',
-                                                                    'RELATED_WORKFLOW_TASK_MASTER_ID'],
-                                                     'synonyms': [],
-                                                     'table': 'WORKFLOW_TASK_MASTER_WORKFLOW_TASK_MASTER'}}
@@ -5,8 +5,13 @@ from dotenv import load_dotenv
 import asyncpg
 from fastapi import HTTPException, status # Keep if you're using FastAPI, otherwise can remove
 import asyncio 
+import time
 from typing import Dict, Any, List # Added for type hinting
 
+from utils.metrics import DB_QUERY_DURATION, DB_QUERY_ROWS, DB_CONNECTIONS_OPENED, DB_CONNECTIONS_OPEN, record_request_timing
+from utils.admission import db_limiter
+from database.result_set import ResultSet
+
 # Load environment variables from .env file.
 # Adjust the path if your .env file is located elsewhere.
 # This path assumes .env is in a 'config' folder one level up from 'src/database'
@@ -71,6 +76,20 @@ async def execute_query_async(conn: asyncpg.Connection, query: str, params: tupl
         print(f"Query: {query}")
         raise e # Re-raise for proper error handling
 
+async def fetch_result_set_async(conn: asyncpg.Connection, query: str, params: tuple = None) -> ResultSet:
+    """
+    Runs a SELECT query and returns its rows by column (see database/result_set.py), with
+    the column names and types of the prepared statement, so no dict is built per row.
+    """
+    try:
+        statement = await conn.prepare(query)
+        records = await statement.fetch(*(params if params is not None else ()))
+        return ResultSet.from_records(records, statement.get_attributes())
+    except Exception as e:
+        print(f"Error executing asynchronous query: {e}")
+        print(f"Query: {query}")
+        raise e # Re-raise for proper error handling
+
 # --- Main DatabaseConnector Class (Optional, but useful for structured access) ---
 class DatabaseConnector:
     def __init__(self):
@@ -78,23 +97,50 @@ class DatabaseConnector:
 
     async def get_connection(self) -> asyncpg.Connection:
         """Establishes and returns a new asyncpg connection."""
+        DB_CONNECTIONS_OPENED.inc()
         return await asyncpg.connect(self.database_url)
 
     async def execute_query(self, query: str, params: tuple = None, fetch: bool = True) -> List[Dict[str, Any]]:
         """
         Executes an SQL query and manages connection lifecycle.
         Returns a list of dictionaries for fetched results.
+        Waits for a DB slot first (see utils/admission.py); raises AdmissionRejected when saturated.
+        """
+        async with db_limiter().slot():
+            return await self._execute_query(query, params, fetch)
+
+    async def fetch_result_set(self, query: str, params: tuple = None) -> ResultSet:
         """
+        Like execute_query(fetch=True), but returns a columnar ResultSet carrying the column
+        types; used for the workflow's generated SQL, whose results can be large.
+        """
+        async with db_limiter().slot():
+            return await self._execute_query(query, params, fetch=True, columnar=True)
+
+    async def _execute_query(self, query: str, params: tuple = None, fetch: bool = True, columnar: bool = False):
         conn = None
+        operation = "fetch" if fetch else "execute"
+        start = time.perf_counter()
         try:
             conn = await self.get_connection()
-            return await execute_query_async(conn, query, params, fetch)
+            DB_CONNECTIONS_OPEN.inc()
+            if columnar:
+                results = await fetch_result_set_async(conn, query, params)
+            else:
+                results = await execute_query_async(conn, query, params, fetch)
+            if results is not None:
+                DB_QUERY_ROWS.observe(len(results), operation=operation)
+            return results
         except Exception as e:
             print(f"Error in DatabaseConnector.execute_query: {e}")
             raise # Re-raise the exception after printing
         finally:
             if conn:
                 await conn.close()
+                DB_CONNECTIONS_OPEN.dec()
+            elapsed = time.perf_counter() - start
+            DB_QUERY_DURATION.observe(elapsed, operation=operation)
+            record_request_timing(f"db.{operation}", elapsed)
 
 # --- Test block for db_connector.py (OPTIONAL, but good for testing this module) ---
 if __name__ == "__main__":
@@ -0,0 +1,94 @@
+# src/database/result_set.py
+
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Postgres type OIDs the DataFrame conversion treats specially.
+NUMERIC_OID = 1700
+
+def _holds_decimals(type_oid: Optional[int], values: Sequence[Any]) -> bool:
+    if type_oid is not None:
+        return type_oid == NUMERIC_OID
+    # Type unknown (built from row dicts): look at the values.
+    return any(isinstance(value, Decimal) for value in values) and \
+        all(value is None or isinstance(value, Decimal) for value in values)
+
+class ResultSet:
+    """
+    A query result stored by column: names, Postgres type OIDs and names, and one value
+    list per column. It is built once from the fetched records, without a dict per row, and
+    passed through the workflow as `sql_results`. Row dicts are only built for the rows a
+    response returns, and the DataFrame used by the renderer and the chart agent is built
+    once and shared.
+    """
+    def __init__(self, columns: List[str], type_oids: List[Optional[int]], type_names: List[Optional[str]],
+                 data: List[Sequence[Any]]):
+        self.columns = columns
+        self.type_oids = type_oids
+        self.type_names = type_names
+        self.data = data
+        self.row_count = len(data[0]) if data else 0
+        self._dataframe: Optional[pd.DataFrame] = None
+
+    @classmethod
+    def from_records(cls, records: Sequence[Any], attributes: Sequence[Any]) -> "ResultSet":
+        """From asyncpg Records and the statement's attributes (column name and type)."""
+        names = [attribute.name for attribute in attributes]
+        # Like dict(record), a repeated column name keeps only its last occurrence.
+        keep = [index for index, name in enumerate(names) if name not in names[index + 1:]]
+        columns_by_index = list(zip(*records)) if records else [() for _ in names]
+        return cls(
+            [names[index] for index in keep],
+            [attributes[index].type.oid for index in keep],
+            [attributes[index].type.name for index in keep],
+            [columns_by_index[index] for index in keep],
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Dict[str, Any]]) -> "ResultSet":
+        """From row dicts (results produced outside the database connector); column types are unknown."""
+        columns = list(rows[0].keys()) if rows else []
+        return cls(columns, [None] * len(columns), [None] * len(columns),
+                   [tuple(row.get(column) for row in rows) for column in columns])
+
+    @classmethod
+    def empty(cls) -> "ResultSet":
+        return cls([], [], [], [])
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def __repr__(self) -> str:
+        return f"ResultSet({self.row_count} rows, columns={self.columns})"
+
+    def column(self, name: str) -> Sequence[Any]:
+        return self.data[self.columns.index(name)]
+
+    def rows(self) -> Iterator[Tuple[Any, ...]]:
+        """Row tuples, in column order."""
+        return zip(*self.data)
+
+    def slice(self, start: int = 0, stop: Optional[int] = None) -> "ResultSet":
+        return ResultSet(self.columns, self.type_oids, self.type_names, [values[start:stop] for values in self.data])
+
+    def to_records(self, start: int = 0, stop: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Rows start:stop as dicts, for the JSON `sql_results` list."""
+        columns = self.columns
+        return [dict(zip(columns, row)) for row in zip(*(values[start:stop] for values in self.data))]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        The result as a DataFrame, built on first use and then shared (treat it as read-only).
+        numeric columns become float64, so charts see them as numbers rather than Decimal objects.
+        """
+        if self._dataframe is None:
+            columns = {}
+            for name, type_oid, values in zip(self.columns, self.type_oids, self.data):
+                if _holds_decimals(type_oid, values):
+                    values = np.array([np.nan if value is None else float(value) for value in values], dtype=np.float64)
+                columns[name] = values
+            self._dataframe = pd.DataFrame(columns, columns=self.columns)
+        return self._dataframe
@@ -1,32 +1,52 @@
 import os
+import time
 import asyncio
 import pandas as pd
 from typing import TypedDict, Dict, Any, List, Optional
 from dotenv import load_dotenv
 import logging
-from fastapi import FastAPI, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
-from decimal import Decimal
 from fastapi.encoders import jsonable_encoder
 
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.background import BackgroundTask
 
 # LangChain / LangGraph imports
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-from langchain_google_vertexai import ChatVertexAI
 from langgraph.graph import StateGraph, END
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
+from langchain_core.messages import BaseMessage
 
 # Import custom modules
 from agents.primary_router import PrimaryRouterAgent
 from agents.router_agent import SQLRouterAgent
 from agents.sql_agent import SQLAgent
-from agents.mcp_agent import setup_agent_for_ui, invoke_agent_with_history, mcp_tools
+from agents.mcp_agent import setup_agent_for_ui, invoke_agent_with_history, shutdown_agent, mcp_tools, CRMAgentResult
 from agents.visualization_agent import VisualizationAgent
 from database.db_connector import DatabaseConnector
-from utils.schema_updater import update_schema_map_file, reload_schema_map_module
+from database.result_set import ResultSet
+from utils.schema_updater import update_schema_map_file
+from utils.schema_map_store import schema_map_store
+from utils.schema_watcher import SchemaChangeWatcher, SCHEMA_WATCH_ENABLED
+from utils.crm_health import crm_health_monitor, CRM_HEALTH_ROUTING
+from utils.session_store import SessionStore, build_prompt_history
+from utils.request_coalescer import RequestCoalescer, coalescing_key, QUERY_COALESCING_ENABLED
+from utils.admission import (
+    AdmissionRejected, query_limiter, chart_limiter, start_admission_tracking, record_admission_rejection
+)
+from utils.model_registry import get_chat_model
+from utils.gcp_auth import configure_gcp_credentials
+from utils.json_response import FastJSONResponse
+from utils.result_store import (
+    result_store, ResultNotFound, RESULT_HANDLES_ENABLED, RESULT_PAGE_SIZE, RESULT_MAX_PAGE_SIZE
+)
+from utils.export import export_registry, ResultExport, EXPORT_FORMATS
+from utils.metrics import (
+    REGISTRY, QUERY_DURATION, SQL_SCHEMA_WIDENED, SPECULATIVE_CALLS, HEDGED_RUNS, HEDGE_BRANCH_DURATION,
+    timed_node, start_request_timings, record_request_timing, monitor_event_loop_lag
+)
 
 # --- Setup Logging ---
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -35,41 +55,18 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config', '.env'))
 
 # --- Service Account Key Authentication Setup ---
-try:
-    service_account_key_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS_PATH", r"C:\Users\Admin\Downloads\geminimcp-464809-eee97d96077e.json")
-    
-    if not os.path.exists(service_account_key_path):
-        raise FileNotFoundError(f"Service account key file not found at: {service_account_key_path}")
-    
-    os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = service_account_key_path
-    logging.info(f"GOOGLE_APPLICATION_CREDENTIALS set to: {service_account_key_path}")
-
-except FileNotFoundError as e:
-    logging.error(f"Fatal Error: {e}")
-    logging.error("Please ensure the service account JSON key file exists at the specified path in your .env or script.")
-    raise
-except Exception as e:
-    logging.error(f"An unexpected error occurred during service account setup: {e}")
-    raise
-
-GCP_PROJECT_ID = os.getenv("GCP_PROJECT_ID", "geminimcp-464809")
-GOOGLE_LOCATION = os.getenv("GOOGLE_LOCATION", "us-central1")
+configure_gcp_credentials("Main")
 
 # --- Helper Function for Markdown Table Formatting ---
-def format_results_to_markdown_table(sql_results: List[Dict[str, Any]]) -> str:
-    """Converts a list of dictionaries (SQL results) into a Markdown table string."""
+def format_results_to_markdown_table(sql_results: ResultSet) -> str:
+    """Converts a columnar SQL result into a Markdown table string."""
     if not sql_results:
         return "No data found."
     
     try:
-        df = pd.DataFrame(sql_results)
-        
-        headers = " | ".join(df.columns)
-        separator = " | ".join(['---'] * len(df.columns))
-        rows = []
-        for _, row in df.iterrows():
-            row_values = [str(row[col]) for col in df.columns]
-            rows.append(" | ".join(row_values))
+        headers = " | ".join(sql_results.columns)
+        separator = " | ".join(['---'] * len(sql_results.columns))
+        rows = [" | ".join(str(value) for value in row) for row in sql_results.rows()]
             
         markdown_table = f"| {headers} |\n| {separator} |\n" + "\n".join([f"| {row} |" for row in rows])
         
@@ -96,20 +93,36 @@ app.add_middleware(
 class QueryRequest(BaseModel):
     query: str
     include_sql: Optional[bool] = False
+    # Return a per-stage latency breakdown (graph nodes, LLM calls, DB, tools) in `timings`
+    include_timings: Optional[bool] = False
     include_results: Optional[bool] = False
+    # Rows of sql_results returned inline (RESULT_PAGE_SIZE when unset); larger results also
+    # get a result_id for fetching further pages from /results/{result_id}.
+    results_page_size: Optional[int] = None
     include_visualization: Optional[bool] = True
     # ADDED: This field will hold the conversation history
     chat_history: Optional[List[Dict[str, str]]] = []
+    # When set, the server keeps the conversation history for this session and the client
+    # only needs to send the new query. chat_history is then used only to seed a new session.
+    session_id: Optional[str] = None
 
 class QueryResponse(BaseModel):
     response: str
     sql_query: Optional[str] = None
     sql_results: Optional[List[Dict[str, Any]]] = None
+    # Set when sql_results holds only the first page of a larger result
+    result_id: Optional[str] = None
+    total_rows: Optional[int] = None
+    # Set when the answer came from generated SQL; download it from /export/{export_id}
+    export_id: Optional[str] = None
     error: Optional[str] = None
     success: bool
     chart_image_base64: Optional[str] = None
     # ADDED: This field will return the updated history
+    # (only the new user/assistant turn when the request used a session_id)
     chat_history: List[Dict[str, str]]
+    session_id: Optional[str] = None
+    timings: Optional[Dict[str, float]] = None
 
 # --- Global Instances ---
 db_connector = DatabaseConnector()
@@ -117,14 +130,11 @@ primary_router = PrimaryRouterAgent()
 sql_router = SQLRouterAgent()
 sql_agent = SQLAgent(db_connector)
 visualization_agent = VisualizationAgent()
+# Identical questions (same effective history) arriving while one is being answered share its graph run
+query_coalescer = RequestCoalescer("query")
 
-# LLM for general responses and final answer generation
-final_response_llm = ChatVertexAI(
-    model_name="gemini-2.5-pro",
-    temperature=0.0,
-    project=GCP_PROJECT_ID,
-    location=GOOGLE_LOCATION
-)
+# Parser shared by the general, clarify, summary and final answer chains; each role's model
+# (and its tier) comes from the model registry.
 final_response_parser = StrOutputParser()
 
 final_response_prompt = ChatPromptTemplate.from_messages(
@@ -152,7 +162,7 @@ final_response_prompt = ChatPromptTemplate.from_messages(
         ("human", "Generate a natural language response based on the above context.")
     ]
 )
-final_response_chain = final_response_prompt | final_response_llm | final_response_parser
+final_response_chain = final_response_prompt | get_chat_model("final_response") | final_response_parser
 
 general_query_prompt = ChatPromptTemplate.from_messages(
     [
@@ -160,7 +170,7 @@ general_query_prompt = ChatPromptTemplate.from_messages(
         ("human", "{user_query}")
     ]
 )
-general_query_chain = general_query_prompt | final_response_llm | final_response_parser
+general_query_chain = general_query_prompt | get_chat_model("general_query") | final_response_parser
 
 clarify_prompt = ChatPromptTemplate.from_messages(
     [
@@ -177,35 +187,134 @@ clarify_prompt = ChatPromptTemplate.from_messages(
         ("human", "What is the clarifying question?")
     ]
 )
-clarify_chain = clarify_prompt | final_response_llm | final_response_parser
+clarify_chain = clarify_prompt | get_chat_model("clarify") | final_response_parser
+
+summarize_history_prompt = ChatPromptTemplate.from_messages(
+    [
+        ("system",
+         """
+         You maintain a running summary of a conversation between a user and a CRM / database assistant.
+         Update the existing summary with the new turns. Keep every fact a follow-up question might rely on
+         (record IDs, names, filters, figures and what was asked) and drop pleasantries.
+         Respond with the updated summary only, in at most 200 words.
+
+         Existing summary: {summary}
+         New turns:
+         {turns}
+         """
+        ),
+        ("human", "Write the updated summary.")
+    ]
+)
+summarize_history_chain = summarize_history_prompt | get_chat_model("summarize_history") | final_response_parser
+
+async def summarize_history(summary: str, turns: List[Dict[str, str]]) -> str:
+    """Folds older conversation turns into a session's rolling summary."""
+    formatted_turns = "\n".join(f"{turn.get('role')}: {turn.get('content')}" for turn in turns)
+    return await summarize_history_chain.ainvoke({"summary": summary or "(none)", "turns": formatted_turns})
+
+session_store = SessionStore(summarizer=summarize_history)
+REGISTRY.gauge(
+    "session_store_sessions", "Conversation sessions currently held in memory.",
+    callback=lambda: {(): len(session_store)}
+)
 
 # --- LangGraph State Definition ---
 class GraphState(TypedDict):
     user_query: str
     routing_decision: Dict[str, Any]
     sql_query: str
-    sql_results: List[Dict[str, Any]]
+    # Columnar result of the generated SQL (see database/result_set.py)
+    sql_results: ResultSet
     final_response: str
     error_message: str
     db_schema_df: pd.DataFrame
-    relevant_db_schema_df: pd.DataFrame
+    relevant_schema: Dict[str, Optional[List[str]]]  # table -> columns given to the SQL LLM (None = all)
+    schema_pruned: bool  # the SQL was generated from a column-pruned schema
+    schema_widened: bool  # SQL is being regenerated with the full schema after the pruned attempt failed
     # UPDATED: chat_history now stores LangChain's BaseMessage objects
     chat_history: List[BaseMessage]
     visualization_data: Optional[Dict[str, Any]]
+    speculative_sql_routing: Optional[Dict[str, Any]]  # SQL router output computed alongside primary routing
+    crm_result: Optional[Dict[str, Any]]  # CRMAgentResult.as_dict() of the CRM agent run, if any
+
+# --- Speculative SQL routing ---
+# Most questions end up on the SQL path, so the SQL router (and the schema snapshot it feeds)
+# can run while the primary router is still deciding; the result is dropped on other routes.
+SPECULATIVE_SQL_ROUTING = os.getenv("SPECULATIVE_SQL_ROUTING", "true").lower() in ("1", "true", "yes")
+
+# --- Hedged CRM / SQL execution ---
+# Opt-in: when the router picks the CRM agent with SQL_ROUTER_AGENT as fallback, run both at
+# once instead of starting the SQL path only after the CRM agent has failed.
+CRM_SQL_HEDGING = os.getenv("CRM_SQL_HEDGING", "false").lower() in ("1", "true", "yes")
+# Branch preference, highest first. A successful branch is used once every branch ranked
+# above it has failed, so the default only answers from SQL when the CRM agent could not.
+CRM_SQL_HEDGE_PRIORITY = [
+    branch.strip() for branch in os.getenv("CRM_SQL_HEDGE_PRIORITY", "crm,sql").split(",") if branch.strip()
+]
+
+def _hedges_crm_with_sql(routing_decision: Dict[str, Any]) -> bool:
+    return (CRM_SQL_HEDGING
+            and routing_decision.get("tool_name") == "CRM_AGENT"
+            and routing_decision.get("fallback_tool") == "SQL_ROUTER_AGENT")
+
+async def _speculative_sql_routing(user_query: str) -> Dict[str, Any]:
+    # Runs in its own task with its own rejection list: shedding speculative work must not
+    # fail the request. If the result is needed, a rejection makes sql_route_node route again.
+    rejections = start_admission_tracking()
+    sql_routing_decision, _ = await asyncio.gather(
+        sql_router.route_query(user_query),
+        sql_agent.load_schema_snapshot()
+    )
+    if rejections:
+        raise rejections[0]
+    return sql_routing_decision
+
+async def _discard_speculation(task: asyncio.Task):
+    """Cancels unused speculative work, counting it as cancelled or (if it already finished) wasted."""
+    if task.done():
+        SPECULATIVE_CALLS.inc(kind="sql_routing", outcome="wasted")
+        if not task.cancelled():
+            task.exception()  # retrieve it so a failure is not reported as unhandled
+        return
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    SPECULATIVE_CALLS.inc(kind="sql_routing", outcome="cancelled")
 
 # --- LangGraph Nodes ---
+@timed_node("primary_route_node")
 async def primary_route_node(state: GraphState) -> Dict[str, Any]:
     """Node for the high-level router to decide which sub-agent to use."""
     logging.info(f"NODE: primary_route_node - User Query: {state['user_query']}")
+    speculation = asyncio.create_task(_speculative_sql_routing(state['user_query'])) if SPECULATIVE_SQL_ROUTING else None
     try:
         # UPDATED: Pass chat_history to the router
         routing_decision = await primary_router.route_query(state['user_query'], chat_history=state['chat_history'])
         logging.info(f"NODE: primary_route_node - Routing Decision: {routing_decision}")
-        return {"routing_decision": routing_decision, "error_message": ""}
+        update = {"routing_decision": routing_decision, "error_message": ""}
+        if speculation is not None:
+            if routing_decision.get("tool_name") == "SQL_ROUTER_AGENT" or _hedges_crm_with_sql(routing_decision):
+                try:
+                    update["speculative_sql_routing"] = await speculation
+                    SPECULATIVE_CALLS.inc(kind="sql_routing", outcome="hit")
+                except Exception as e:
+                    # sql_route_node will route again without the speculative result
+                    logging.warning(f"NODE: primary_route_node - Speculative SQL routing failed: {e}")
+                    SPECULATIVE_CALLS.inc(kind="sql_routing", outcome="failed")
+            else:
+                await _discard_speculation(speculation)
+        return update
+    except asyncio.CancelledError:
+        if speculation is not None:
+            speculation.cancel()
+        raise
     except Exception as e:
+        if speculation is not None:
+            await _discard_speculation(speculation)
         logging.error(f"NODE: primary_route_node - Error routing query: {e}", exc_info=True)
         return {"error_message": f"An error occurred during query routing: {e}"}
 
+@timed_node("clarify_query_node")
 async def clarify_query_node(state: GraphState) -> Dict[str, Any]:
     """Node to handle clarification requests."""
     logging.info(f"NODE: clarify_query_node - Handling clarification request.")
@@ -222,11 +331,13 @@ async def clarify_query_node(state: GraphState) -> Dict[str, Any]:
         logging.error(f"NODE: clarify_query_node - Error generating clarifying question: {e}", exc_info=True)
         return {"final_response": "I'm sorry, your request requires more specific information. Could you please provide additional details?", "error_message": f"Error in clarification generation: {e}"}
 
+@timed_node("sql_route_node")
 async def sql_route_node(state: GraphState) -> Dict[str, Any]:
     """Node to use the specialized SQL Router to get relevant tables/columns."""
     logging.info(f"NODE: sql_route_node - Using specialized SQL Router.")
     try:
-        sql_routing_decision = await sql_router.route_query(state['user_query'])
+        # Reuse the decision computed speculatively during primary routing, if any
+        sql_routing_decision = state.get("speculative_sql_routing") or await sql_router.route_query(state['user_query'])
         # --- FIX: MERGE THE NEW ROUTING INFO, DON'T OVERWRITE ---
         existing_decision = state.get("routing_decision", {}).copy()
         existing_decision.update(sql_routing_decision)
@@ -236,6 +347,7 @@ async def sql_route_node(state: GraphState) -> Dict[str, Any]:
         logging.error(f"NODE: sql_route_node - Error from SQL Router: {e}", exc_info=True)
         return {"error_message": f"An error occurred in the SQL routing step: {e}"}
 
+@timed_node("generate_sql")
 async def generate_sql_node(state: GraphState) -> Dict[str, Any]:
     """Node to generate SQL query using the SQLAgent."""
     logging.info(f"NODE: generate_sql_node - Generating SQL...")
@@ -245,21 +357,23 @@ async def generate_sql_node(state: GraphState) -> Dict[str, Any]:
     relevant_columns = routing_decision.get('relevant_columns', [])
 
     try:
-        sql_query, relevant_schema_df = await sql_agent.generate_sql_query(
-            user_query, relevant_tables, relevant_columns
+        sql_query, relevant_schema, schema_pruned = await sql_agent.generate_sql_query(
+            user_query, relevant_tables, relevant_columns, widen_schema=state.get('schema_widened', False)
         )
         
         if "Error:" in sql_query:
             logging.error(f"NODE: generate_sql_node - SQL generation failed: {sql_query}")
-            return {"sql_query": "", "relevant_db_schema_df": pd.DataFrame(),
+            return {"sql_query": "", "relevant_schema": {}, "schema_pruned": False,
                      "error_message": sql_query.replace("Error: ", "")}
         
         logging.info(f"NODE: generate_sql_node - Generated SQL: {sql_query}")
-        return {"sql_query": sql_query, "relevant_db_schema_df": relevant_schema_df, "error_message": ""}
+        return {"sql_query": sql_query, "relevant_schema": relevant_schema, "schema_pruned": schema_pruned,
+                "error_message": ""}
     except Exception as e:
         logging.error(f"NODE: generate_sql_node - Error generating SQL: {e}", exc_info=True)
         return {"error_message": f"An error occurred during SQL generation: {e}"}
 
+@timed_node("execute_sql")
 async def execute_sql_node(state: GraphState) -> Dict[str, Any]:
     """Node to execute the generated SQL query using DatabaseConnector."""
     logging.info(f"NODE: execute_sql_node - Executing SQL...")
@@ -267,67 +381,84 @@ async def execute_sql_node(state: GraphState) -> Dict[str, Any]:
 
     if not sql_query:
         logging.warning("NODE: execute_sql_node - No SQL query provided for execution.")
-        return {"sql_results": [], "error_message": "No SQL query was generated to execute."}
+        return {"sql_results": ResultSet.empty(), "error_message": "No SQL query was generated to execute."}
 
     if any(sql_query.strip().upper().startswith(kw) for kw in ["DELETE", "UPDATE", "INSERT", "CREATE", "ALTER", "DROP", "TRUNCATE"]):
         logging.warning(f"NODE: execute_sql_node - Attempted execution of forbidden SQL: {sql_query}")
-        return {"sql_results": [], "error_message": "SQL query contains forbidden operations. Execution denied for safety."}
+        return {"sql_results": ResultSet.empty(), "error_message": "SQL query contains forbidden operations. Execution denied for safety."}
         
     try:
-        sql_results = await db_connector.execute_query(sql_query, fetch=True)
-        logging.info(f"NODE: execute_sql_node - SQL Results Count: {len(sql_results) if sql_results else 0}")
+        sql_results = await db_connector.fetch_result_set(sql_query)
+        logging.info(f"NODE: execute_sql_node - SQL Results Count: {len(sql_results)}")
         return {"sql_results": sql_results, "error_message": ""}
     except Exception as e:
         logging.error(f"NODE: execute_sql_node - Error executing SQL: {e}", exc_info=True)
-        return {"sql_results": [], "error_message": f"An error occurred during SQL execution: {e}"}
+        return {"sql_results": ResultSet.empty(), "error_message": f"An error occurred during SQL execution: {e}"}
 
+@timed_node("widen_schema")
+async def widen_schema_node(state: GraphState) -> Dict[str, Any]:
+    """Node to retry SQL generation with the full schema after SQL built from a pruned schema failed."""
+    logging.warning(f"NODE: widen_schema_node - SQL from pruned schema failed ({state.get('error_message')}); retrying with full schema context.")
+    SQL_SCHEMA_WIDENED.inc()
+    return {"schema_widened": True, "sql_query": "", "error_message": ""}
+
+@timed_node("call_crm_agent")
 async def call_crm_agent_node(state: GraphState) -> Dict[str, Any]:
-    """Node to invoke the CRM agent and check for failure messages."""
+    """Node to invoke the CRM agent and record its structured outcome."""
     logging.info(f"NODE: call_crm_agent_node - Calling CRM Agent with query: {state['user_query']}")
     try:
         crm_agent_app, _ = await setup_agent_for_ui()
-        final_response_content = await invoke_agent_with_history(
+        crm_result = await invoke_agent_with_history(
             agent_app_instance=crm_agent_app, 
             user_question=state['user_query'], 
-            chat_history=state.get('chat_history', [])
+            chat_history=state.get('chat_history', []),
+            # With a fallback, an answer given without any tool call should fall back too
+            require_tools=bool((state.get('routing_decision') or {}).get('fallback_tool'))
         )
         
-        # Check for generic failure messages from the CRM agent itself.
-        if "I am sorry" in final_response_content or "I couldn't" in final_response_content or "error" in final_response_content or "technical error" in final_response_content or "error occurred" in final_response_content:
-             # Return a failure message that can be used by the conditional edge
-             return {"error_message": final_response_content}
+        # The run's status (not the wording of the answer) decides whether it failed
+        if not crm_result.succeeded:
+            logging.warning(f"NODE: call_crm_agent_node - CRM agent did not answer: {crm_result}")
+            return {"crm_result": crm_result.as_dict(), "error_message": crm_result.final_text}
         
-        # If the response is not a known error message, it's a success
-        return {"final_response": final_response_content}
+        return {"crm_result": crm_result.as_dict(), "final_response": crm_result.final_text}
         
     except Exception as e:
         logging.error(f"NODE: call_crm_agent_node - Error calling CRM agent: {e}", exc_info=True)
         # Return the exception message to trigger the fallback
-        return {"error_message": f"An error occurred while using the CRM agent: {e}"}
+        error_message = f"An error occurred while using the CRM agent: {e}"
+        return {"crm_result": CRMAgentResult(CRMAgentResult.AGENT_ERROR, error_message).as_dict(),
+                "error_message": error_message}
     
+@timed_node("visualization_node")
 async def visualization_node(state: GraphState) -> Dict[str, Any]:
     """Node to generate visualizations if requested."""
     logging.info(f"NODE: visualization_node - Generating visualization...")
     
     # Get the data to visualize
-    data = state.get("sql_results", [])
+    data = state.get("sql_results")
     if not data:
         logging.info("NODE: visualization_node - No data available for visualization")
         return {"visualization_data": None}
     
     try:
-        visualization = await visualization_agent.generate_visualization(
-            state["user_query"], 
-            data
-        )
+        async with chart_limiter().slot():
+            visualization = await visualization_agent.generate_visualization(
+                state["user_query"], 
+                data
+            )
         if "error" in visualization:
             logging.warning(f"NODE: visualization_node - {visualization['error']}")
             return {"visualization_data": None}
         return {"visualization_data": visualization}
+    except AdmissionRejected as e:
+        logging.warning(f"NODE: visualization_node - Skipping the chart: {e}")
+        return {"visualization_data": None}
     except Exception as e:
         logging.error(f"NODE: visualization_node - Error generating visualization: {e}")
         return {"error_message": f"Visualization error: {e}", "visualization_data": None}
 
+@timed_node("generate_final_response")
 async def generate_final_response_node(state: GraphState) -> Dict[str, Any]:
     """Node to generate the final natural language response to the user."""
     logging.info(f"NODE: generate_final_response_node - Generating final response...")
@@ -361,17 +492,19 @@ async def generate_final_response_node(state: GraphState) -> Dict[str, Any]:
         logging.error(f"NODE: generate_final_response_node - Error generating final response: {e}")
         return {"final_response": "I apologize, but I encountered an internal error while trying to formulate a response.", "error_message": f"Error in final response generation: {e}", "visualization_data": None}
 
+@timed_node("general_response")
 async def general_query_response_node(state: GraphState) -> Dict[str, Any]:
     """Node to handle general (non-database) queries."""
     logging.info(f"NODE: general_query_response_node - Handling general query...")
     try:
         response = await general_query_chain.ainvoke({"user_query": state['user_query']})
         logging.info(f"NODE: general_query_response_node - General Response: {response}")
-        return {"final_response": response, "error_message": "", "sql_query": "", "sql_results": [], "visualization_data": None}
+        return {"final_response": response, "error_message": "", "sql_query": "", "sql_results": ResultSet.empty(), "visualization_data": None}
     except Exception as e:
         logging.error(f"NODE: general_query_response_node - Error handling general query: {e}", exc_info=True)
         return {"final_response": "I'm sorry, I couldn't process your general question due to an error.", "error_message": f"Error in general query response: {e}", "visualization_data": None}
 
+@timed_node("handle_error")
 async def handle_error_node(state: GraphState) -> Dict[str, Any]:
     """Node to consolidate and present errors."""
     logging.error(f"NODE: handle_error_node - Handling error: {state.get('error_message', 'Unknown error')}")
@@ -382,6 +515,7 @@ async def handle_error_node(state: GraphState) -> Dict[str, Any]:
     )
     return {"final_response": user_facing_error, "error_message": state.get('error_message'), "visualization_data": None}
 
+@timed_node("crm_fallback_node")
 async def crm_fallback_node(state: GraphState) -> Dict[str, Any]:
     """Node to set up the state for SQL fallback."""
     logging.warning("NODE: crm_fallback_node - CRM agent failed, re-routing to SQL path.")
@@ -393,9 +527,108 @@ async def crm_fallback_node(state: GraphState) -> Dict[str, Any]:
         "error_message": ""
     }
 
+async def _run_sql_path(state: GraphState) -> Dict[str, Any]:
+    """
+    The graph's SQL path (route, generate, execute, one widened retry) run in-process for
+    hedging. Returns the accumulated state update; an error_message in it means failure.
+    """
+    branch_state = dict(state)
+    update: Dict[str, Any] = {}
+
+    def apply(node_update: Dict[str, Any]):
+        update.update(node_update)
+        branch_state.update(node_update)
+
+    apply({"routing_decision": {"tool_name": "SQL_ROUTER_AGENT", "reasoning": "Hedged alongside the CRM agent."},
+           "error_message": ""})
+    apply(await sql_route_node(branch_state))
+    if sql_route_to_sql_generation(branch_state) == "handle_error":
+        return {**update, "error_message": branch_state.get("error_message") or "The SQL router found no relevant tables."}
+    while True:
+        apply(await generate_sql_node(branch_state))
+        if check_for_error(branch_state) == "handle_error":
+            return update
+        apply(await execute_sql_node(branch_state))
+        if after_sql_execution(branch_state) != "widen_schema":
+            return update
+        apply(await widen_schema_node(branch_state))
+
+# Branch name -> coroutine function producing that branch's state update.
+_HEDGE_BRANCHES = {
+    "crm": call_crm_agent_node,
+    "sql": _run_sql_path,
+}
+
+@timed_node("hedge_crm_sql")
+async def hedge_crm_sql_node(state: GraphState) -> Dict[str, Any]:
+    """
+    Runs the CRM agent and the SQL path concurrently and returns the update of the highest-
+    priority branch that succeeded, cancelling the rest. If both fail, the SQL path's error
+    is returned, as after a sequential fallback.
+    """
+    logging.info(f"NODE: hedge_crm_sql_node - Racing {' > '.join(CRM_SQL_HEDGE_PRIORITY)} for: {state['user_query']}")
+    priority = [branch for branch in CRM_SQL_HEDGE_PRIORITY if branch in _HEDGE_BRANCHES] or list(_HEDGE_BRANCHES)
+    durations: Dict[str, float] = {}
+    branch_rejections: Dict[str, List[AdmissionRejected]] = {}
+
+    async def run_branch(branch: str) -> Dict[str, Any]:
+        # Own rejection list: a branch shed while the other one answers must not fail the request
+        branch_rejections[branch] = start_admission_tracking()
+        start = time.perf_counter()
+        try:
+            return await _HEDGE_BRANCHES[branch](state)
+        except Exception as e:
+            logging.error(f"NODE: hedge_crm_sql_node - {branch} branch failed: {e}", exc_info=True)
+            return {"error_message": f"An error occurred in the {branch} branch: {e}"}
+        finally:
+            durations[branch] = time.perf_counter() - start
+
+    tasks = {branch: asyncio.create_task(run_branch(branch)) for branch in priority}
+    results: Dict[str, Dict[str, Any]] = {}
+    winner = None
+    try:
+        pending = set(tasks.values())
+        while pending and winner is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for branch, task in tasks.items():
+                if task in done:
+                    results[branch] = task.result()
+            # Walk the priority order: stop at the first branch still running or that succeeded
+            for branch in priority:
+                if branch not in results:
+                    break
+                if not results[branch].get("error_message"):
+                    winner = branch
+                    break
+    finally:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    for branch in priority:
+        if branch == winner:
+            outcome = "won"
+        elif branch not in results:
+            outcome = "cancelled"
+        else:
+            outcome = "failed" if results[branch].get("error_message") else "lost"
+        HEDGE_BRANCH_DURATION.observe(durations.get(branch, 0.0), branch=branch, outcome=outcome)
+        record_request_timing(f"hedge.{branch}", durations.get(branch, 0.0))
+    HEDGED_RUNS.inc(winner=winner or "none")
+    logging.info(f"NODE: hedge_crm_sql_node - Winner: {winner or 'none'} "
+                 f"({', '.join(f'{b}={durations.get(b, 0.0):.2f}s' for b in priority)})")
+
+    if winner is None:
+        for branch in priority:
+            for rejection in branch_rejections.get(branch, []):
+                record_admission_rejection(rejection)
+        return results.get("sql", results[priority[-1]])
+    return results[winner]
+
 # NEW NODE: This node is for the CONTINUE_CONVERSATION tool.
 # It simply passes the user query to the `general_response` node.
 # The primary router handles the logic of whether it's a follow-up.
+@timed_node("continue_conversation")
 async def continue_conversation_node(state: GraphState) -> Dict[str, Any]:
     """
     Node to handle the `CONTINUE_CONVERSATION` tool.
@@ -420,7 +653,7 @@ def primary_route_decision(state: GraphState) -> str:
     elif tool_name == "SQL_ROUTER_AGENT":
         return "sql_route_node"
     elif tool_name == "CRM_AGENT":
-        return "call_crm_agent"
+        return "hedge_crm_sql" if _hedges_crm_with_sql(routing_decision) else "call_crm_agent"
     elif tool_name == "CLARIFY_QUERY":
         return "clarify_query_node"
     elif tool_name == "GENERAL_QUERY":
@@ -446,20 +679,33 @@ def check_for_error(state: GraphState) -> str:
     return "continue"
 
 def crm_fallback_decision(state: GraphState) -> str:
-    """Decides whether to fallback to SQL based on the CRM agent's result."""
-    error = state.get("error_message")
+    """Decides whether to fallback to SQL based on the status of the CRM agent run."""
+    crm_result = state.get("crm_result") or {}
+    crm_failed = crm_result.get("status") != CRMAgentResult.SUCCESS
     routing_decision = state.get("routing_decision", {})
     fallback_tool = routing_decision.get("fallback_tool")
 
-    if error and fallback_tool == "SQL_ROUTER_AGENT":
+    if crm_failed and fallback_tool == "SQL_ROUTER_AGENT":
         return "crm_fallback_node"
     
-    if error:
+    if crm_failed:
         return "handle_error"
         
     # The CRM agent's happy path should check for visualization next.
     return "visualization_node"
 
+def after_hedge_crm_sql(state: GraphState) -> str:
+    """Continues from whichever hedged branch won, or handles the error if none did."""
+    if state.get("error_message"):
+        return "handle_error"
+    return check_for_visualization(state)
+
+def after_sql_execution(state: GraphState) -> str:
+    """Retries once with the full schema if SQL generated from a pruned schema failed, else continues."""
+    if state.get("error_message") and state.get("schema_pruned") and not state.get("schema_widened"):
+        return "widen_schema"
+    return check_for_visualization(state)
+
 def check_for_visualization(state: GraphState) -> str:
     """Checks if a secondary tool was requested."""
     routing_decision = state.get("routing_decision", {})
@@ -479,6 +725,7 @@ workflow.add_node("clarify_query_node", clarify_query_node)
 workflow.add_node("sql_route_node", sql_route_node)
 workflow.add_node("generate_sql", generate_sql_node)
 workflow.add_node("execute_sql", execute_sql_node)
+workflow.add_node("widen_schema", widen_schema_node)
 workflow.add_node("call_crm_agent", call_crm_agent_node)
 # NEW: Added the new node
 workflow.add_node("continue_conversation", continue_conversation_node) 
@@ -487,6 +734,7 @@ workflow.add_node("generate_final_response", generate_final_response_node)
 workflow.add_node("general_response", general_query_response_node)
 workflow.add_node("handle_error", handle_error_node)
 workflow.add_node("crm_fallback_node", crm_fallback_node)
+workflow.add_node("hedge_crm_sql", hedge_crm_sql_node)
 
 # Set the entry point
 workflow.set_entry_point("primary_route_node")
@@ -498,6 +746,7 @@ workflow.add_conditional_edges(
     {
         "sql_route_node": "sql_route_node",
         "call_crm_agent": "call_crm_agent",
+        "hedge_crm_sql": "hedge_crm_sql",
         "clarify_query_node": "clarify_query_node",
         "general_response": "general_response",
         "continue_conversation": "continue_conversation", # ADDED: New edge for the new node
@@ -529,12 +778,14 @@ workflow.add_conditional_edges(
 # UPDATED: We now check for visualization after data is fetched from SQL or CRM fallback
 workflow.add_conditional_edges(
     "execute_sql",
-    check_for_visualization,
+    after_sql_execution,
     {
+        "widen_schema": "widen_schema",
         "visualization": "visualization_node",
         "no_visualization": "generate_final_response"
     }
 )
+workflow.add_edge("widen_schema", "generate_sql")
 
 workflow.add_conditional_edges(
     "call_crm_agent",
@@ -548,6 +799,16 @@ workflow.add_conditional_edges(
 
 workflow.add_edge("crm_fallback_node", "sql_route_node")
 
+workflow.add_conditional_edges(
+    "hedge_crm_sql",
+    after_hedge_crm_sql,
+    {
+        "visualization": "visualization_node",
+        "no_visualization": "generate_final_response",
+        "handle_error": "handle_error"
+    }
+)
+
 # Remaining edges
 workflow.add_edge("visualization_node", "generate_final_response")
 workflow.add_edge("general_response", "generate_final_response")
@@ -558,27 +819,49 @@ workflow.add_edge("handle_error", END)
 text_to_sql_app = workflow.compile()
 
 # --- Initial Application Setup ---
+# Background task sampling event-loop lag for /metrics (started on startup).
+event_loop_lag_task = None
+# Listens for DDL notifications and refreshes the schema in place (started on startup).
+schema_watcher = None
+
+async def refresh_schema_after_ddl(table_names: Optional[List[str]]):
+    """
+    Applies a schema change: re-introspects the changed tables (or everything when
+    `table_names` is None) into the SQL agent's snapshot, which rebuilds the FK graph and
+    prompt fragments keyed by the new fingerprint, then syncs the router's schema map.
+    """
+    full_schema_df = await sql_agent.refresh_schema_tables(table_names)
+    if full_schema_df is None:
+        raise RuntimeError("schema re-introspection failed")
+    await schema_map_store.refresh(full_schema_df=full_schema_df)
+
 @app.on_event("startup")
 async def initial_app_setup():
     """Performs initial setup tasks."""
     logging.info("Starting initial application setup...")
-    global sql_router
+    global event_loop_lag_task, schema_watcher
+
+    if event_loop_lag_task is None:
+        event_loop_lag_task = asyncio.create_task(monitor_event_loop_lag())
     
-    # Setup for SQL agent
+    # Setup for SQL agent: the router's prompt follows every schema map swap
+    schema_map_store.subscribe(sql_router.set_schema_map)
     success = await update_schema_map_file(db_connector)
     if success:
-        logging.info("Schema map file updated successfully.")
+        logging.info("Schema map synced with the database.")
     else:
-        logging.error("Failed to update schema map file.")
-    
-    try:
-        reloaded_schema_map = reload_schema_map_module()
-        sql_router = SQLRouterAgent()
-        logging.info("SQLRouterAgent reloaded with updated SCHEMA_MAP.")
-    except Exception as e:
-        logging.error(f"Failed to reload Schema_map module: {e}", exc_info=True)
+        logging.error("Failed to sync the schema map with the database.")
+
+    # Pick up migrations while running instead of on the next restart
+    if SCHEMA_WATCH_ENABLED and schema_watcher is None:
+        schema_watcher = SchemaChangeWatcher(
+            db_connector, refresh_schema_after_ddl, on_listening=sql_agent.set_schema_change_feed
+        )
+        schema_watcher.start()
     
-    # Setup for the CRM agent
+    # Setup for the CRM agent; the router avoids it while the CRM API is failing
+    if CRM_HEALTH_ROUTING:
+        crm_health_monitor.start()
     try:
         await setup_agent_for_ui()
         logging.info("MCP CRM agent tools initialized.")
@@ -587,74 +870,146 @@ async def initial_app_setup():
         
     logging.info("Initial application setup complete.")
 
+@app.on_event("shutdown")
+async def app_shutdown():
+    """Stops background tasks started during setup."""
+    global event_loop_lag_task, schema_watcher
+    if event_loop_lag_task is not None:
+        event_loop_lag_task.cancel()
+        event_loop_lag_task = None
+    if schema_watcher is not None:
+        await schema_watcher.stop()
+        schema_watcher = None
+    await crm_health_monitor.stop()
+    await shutdown_agent()
+    await result_store.close()
+
 # --- API Endpoints ---
-@app.post("/query", response_model=QueryResponse)
+async def _record_turn(request: QueryRequest, session, assistant_content: str) -> List[Dict[str, str]]:
+    """
+    Records the new exchange and returns the history to send back: only the new turn
+    for session-based requests, otherwise the client's history plus the new turn.
+    """
+    new_turn = [
+        {"role": "user", "content": request.query},
+        {"role": "assistant", "content": assistant_content}
+    ]
+    if session is not None:
+        await session_store.append_turn(session, request.query, assistant_content)
+        return new_turn
+    return list(request.chat_history or []) + new_turn
+
+@app.post("/query", response_model=QueryResponse, response_class=FastJSONResponse)
 async def process_query(request: QueryRequest):
-    # Convert dict-based chat history from Pydantic model to LangChain's BaseMessage format
-    langchain_chat_history = []
-    for message in request.chat_history:
-        if message.get("role") == "user":
-            langchain_chat_history.append(HumanMessage(content=message.get("content")))
-        elif message.get("role") == "assistant":
-            langchain_chat_history.append(AIMessage(content=message.get("content")))
+    request_start = time.perf_counter()
+    request_timings = start_request_timings()
+    # Build the token-budgeted history for the agents, either from the server-side
+    # session or from the history the client sent with this request.
+    session = None
+    if request.session_id:
+        session = await session_store.get_or_create(request.session_id)
+        await session_store.seed_if_empty(session, request.chat_history)
+        langchain_chat_history = session_store.prompt_history(session)
+    else:
+        langchain_chat_history = build_prompt_history("", request.chat_history or [])
 
     initial_state: GraphState = {
         "user_query": request.query,
         "routing_decision": {},
         "sql_query": "",
-        "sql_results": [],
+        "sql_results": ResultSet.empty(),
         "final_response": "",
         "error_message": "",
         "db_schema_df": pd.DataFrame(),
-        "relevant_db_schema_df": pd.DataFrame(),
+        "relevant_schema": {},
+        "schema_pruned": False,
+        "schema_widened": False,
         # PASSING THE CONVERSATION HISTORY
         "chat_history": langchain_chat_history,
-        "visualization_data": None
+        "visualization_data": None,
+        "speculative_sql_routing": None,
+        "crm_result": None
     }
 
+    async def run_graph():
+        # Runs in its own task when coalesced, so it collects its own stage timings.
+        graph_timings = start_request_timings()
+        rejections = start_admission_tracking()
+        async with query_limiter().slot():
+            graph_final_state = await text_to_sql_app.ainvoke(initial_state)
+        if rejections:
+            # An LLM or DB stage was shed; the node's error message would only say it failed.
+            raise rejections[0]
+        return graph_final_state, graph_timings
+
     try:
-        final_state = await text_to_sql_app.ainvoke(initial_state)
+        if QUERY_COALESCING_ENABLED:
+            (final_state, graph_timings), _ = await query_coalescer.run(
+                coalescing_key(request.query, langchain_chat_history), run_graph
+            )
+        else:
+            final_state, graph_timings = await run_graph()
+        request_timings.update(graph_timings)
+        request_timings["total"] = round(time.perf_counter() - request_start, 6)
+        QUERY_DURATION.observe(
+            request_timings["total"],
+            route=final_state.get("routing_decision", {}).get("tool_name", "unknown"),
+            success=str(not bool(final_state.get("error_message"))).lower()
+        )
         
         chart_image_base64 = None
         if final_state.get("visualization_data") and "chart_image_base64" in final_state["visualization_data"]:
             chart_image_base64 = final_state["visualization_data"]["chart_image_base64"]
 
         # Append the new user query and the AI's final response to the history
-        updated_chat_history = langchain_chat_history + [
-            HumanMessage(content=request.query),
-            AIMessage(content=final_state.get("final_response", "No response generated."))
-        ]
-        
-        # Convert the LangChain history back to a dictionary format for JSON serialization
-        serializable_history = [
-            {"role": "user" if isinstance(msg, HumanMessage) else "assistant", "content": msg.content}
-            for msg in updated_chat_history
-        ]
-
-        response_data = jsonable_encoder({
+        final_response = final_state.get("final_response", "No response generated.")
+        serializable_history = await _record_turn(request, session, final_response)
+
+        result_set = final_state.get("sql_results") or ResultSet.empty()
+        sql_results = None
+        result_id = None
+        if request.include_results:
+            page_size = RESULT_PAGE_SIZE if request.results_page_size is None else request.results_page_size
+            page_size = max(0, min(page_size, RESULT_MAX_PAGE_SIZE))
+            if RESULT_HANDLES_ENABLED and len(result_set) > page_size:
+                # The full result stays server-side; the client pages through /results/{result_id}.
+                result_id = (await result_store.put(result_set)).result_id
+                sql_results = result_set.to_records(0, page_size)
+            else:
+                sql_results = result_set.to_records()
+        export_id = None
+        if final_state.get("sql_query") and not final_state.get("error_message"):
+            export_id = export_registry.register(final_state["sql_query"])
+
+        # Raw results (Decimal, datetime, UUID cells) are encoded in a single orjson pass.
+        return FastJSONResponse({
             "response": final_state.get("final_response", "No response generated."),
             "success": not bool(final_state.get("error_message")),
             "error": final_state.get("error_message"),
             "sql_query": final_state.get("sql_query") if request.include_sql else None,
-            "sql_results": final_state.get("sql_results", []) if request.include_results else None,
+            "sql_results": sql_results,
+            "result_id": result_id,
+            "total_rows": len(result_set) if request.include_results else None,
+            "export_id": export_id,
             "chart_image_base64": chart_image_base64 if request.include_visualization else None,
             # RETURNING THE UPDATED HISTORY
-            "chat_history": serializable_history
-        }, custom_encoder={Decimal: float})
+            "chat_history": serializable_history,
+            "session_id": request.session_id,
+            "timings": request_timings if request.include_timings else None
+        }, endpoint="query")
 
-        return JSONResponse(content=response_data)
+    except AdmissionRejected as e:
+        # Shed cleanly: nothing is recorded in the history so the client can simply retry.
+        raise HTTPException(
+            status_code=e.status_code,
+            detail={"error": f"The service is busy, please retry shortly ({e.resource} {e.reason})."},
+            headers={"Retry-After": str(e.retry_after)}
+        )
     
     except Exception as e:
         logging.error(f"Error processing query: {e}", exc_info=True)
         # On error, we still want to return a response with history for the front-end
-        updated_chat_history = langchain_chat_history + [
-            HumanMessage(content=request.query),
-            AIMessage(content="I'm sorry, an internal error occurred.")
-        ]
-        serializable_history = [
-            {"role": "user" if isinstance(msg, HumanMessage) else "assistant", "content": msg.content}
-            for msg in updated_chat_history
-        ]
+        serializable_history = await _record_turn(request, session, "I'm sorry, an internal error occurred.")
         
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -664,6 +1019,78 @@ async def process_query(request: QueryRequest):
             })
         )
 
+@app.get("/results/{result_id}", response_class=FastJSONResponse)
+async def get_result_page(
+    result_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(RESULT_PAGE_SIZE, ge=1, le=RESULT_MAX_PAGE_SIZE),
+    columns: Optional[str] = Query(None, description="Comma-separated columns to return, in order."),
+    sort: Optional[str] = Query(None, description="Comma-separated columns to sort by; prefix with '-' for descending.")
+):
+    """A page of a result returned by /query with a result_id, optionally with a column subset and sort order."""
+    try:
+        page = await result_store.page(
+            result_id, offset, limit,
+            columns=[column.strip() for column in columns.split(",") if column.strip()] if columns else None,
+            sort=[key.strip() for key in sort.split(",") if key.strip()] if sort else None
+        )
+    except ResultNotFound:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": "Unknown or expired result_id; run the query again."}
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={"error": str(e)})
+    return FastJSONResponse(page, endpoint="results")
+
+@app.get("/export/{export_id}")
+async def export_result(export_id: str, format: str = Query("csv", description="csv, parquet or arrow (Arrow IPC stream).")):
+    """
+    Re-runs the SQL behind an answer (the export_id /query returned) and streams its full
+    result as CSV, Parquet or Arrow IPC, chunk by chunk through a server-side cursor.
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": f"Unsupported export format '{format}'; use one of {sorted(EXPORT_FORMATS)}."}
+        )
+    sql_query = export_registry.get(export_id)
+    if sql_query is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": "Unknown or expired export_id; run the query again."}
+        )
+
+    export = ResultExport(sql_query, format, db_connector)
+    try:
+        await export.open()
+    except AdmissionRejected as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail={"error": f"Too many exports in progress, please retry shortly ({e.resource} {e.reason})."},
+            headers={"Retry-After": str(e.retry_after)}
+        )
+    except Exception as e:
+        logging.error(f"Error starting export {export_id}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": f"The query could not be re-run for export: {e}"}
+        )
+
+    media_type, extension = EXPORT_FORMATS[format]
+    return StreamingResponse(
+        export.stream(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="query-{export_id[:8]}.{extension}"'},
+        # Releases the connection and slot if the stream never started (client gone before the first chunk).
+        background=BackgroundTask(export.close)
+    )
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus text-format metrics: graph node latency, LLM tokens, DB, MCP tools, sessions."""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint for the API"""
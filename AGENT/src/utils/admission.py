@@ -0,0 +1,220 @@
+# src/utils/admission.py
+
+import os
+import time
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler
+
+from utils.metrics import REGISTRY, record_request_timing
+
+# Set up basic logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# --- Configuration ---
+# For every resource: <PREFIX>_MAX_CONCURRENCY (0 = unlimited), <PREFIX>_MAX_QUEUE (requests allowed
+# to wait for a slot) and <PREFIX>_QUEUE_TIMEOUT_SECONDS (how long one may wait before being shed).
+def _limit_settings(prefix: str, concurrency: int, queue: int, timeout: float) -> Dict[str, float]:
+    return {
+        "max_concurrency": int(os.getenv(f"{prefix}_MAX_CONCURRENCY", concurrency)),
+        "max_queue": int(os.getenv(f"{prefix}_MAX_QUEUE", queue)),
+        "queue_timeout": float(os.getenv(f"{prefix}_QUEUE_TIMEOUT_SECONDS", timeout)),
+    }
+
+# Whole /query requests (graph executions).
+QUERY_LIMITS = _limit_settings("QUERY", 32, 64, 10.0)
+# Concurrent calls per LLM model; per-model overrides as "model=limit,model=limit".
+LLM_LIMITS = _limit_settings("LLM", 8, 64, 30.0)
+LLM_MAX_CONCURRENCY_OVERRIDES = {
+    model.strip(): int(limit)
+    for model, _, limit in (item.partition("=") for item in os.getenv("LLM_MAX_CONCURRENCY_OVERRIDES", "").split(","))
+    if model.strip() and limit.strip()
+}
+# SQL executions (each opens its own connection, so this also caps DB connections).
+DB_LIMITS = _limit_settings("DB", 10, 100, 10.0)
+# Chart renders.
+CHART_LIMITS = _limit_settings("CHART", 2, 8, 5.0)
+# Result exports (each holds its own DB connection for the whole download, outside DB_LIMITS).
+EXPORT_LIMITS = _limit_settings("EXPORT", 4, 8, 5.0)
+# Retry-After sent with 429/503 responses.
+ADMISSION_RETRY_AFTER_SECONDS = int(os.getenv("ADMISSION_RETRY_AFTER_SECONDS", 5))
+
+# --- Metrics ---
+ADMISSION_QUEUE_TIME = REGISTRY.histogram(
+    "admission_queue_seconds", "Time spent waiting for a concurrency slot, by resource.", ("resource",))
+ADMISSION_REJECTED = REGISTRY.counter(
+    "admission_rejected_total", "Work shed by admission control, by resource and reason (queue_full / queue_timeout).",
+    ("resource", "reason"))
+
+class AdmissionRejected(Exception):
+    """Raised when a resource is saturated: its wait queue is full or the wait timed out."""
+    def __init__(self, resource: str, reason: str, retry_after: int = ADMISSION_RETRY_AFTER_SECONDS):
+        super().__init__(f"{resource} is saturated ({reason}); retry in {retry_after}s.")
+        self.resource = resource
+        self.reason = reason
+        self.retry_after = retry_after
+
+    @property
+    def status_code(self) -> int:
+        """429 when the queue was full on arrival, 503 when the wait for a slot timed out."""
+        return 429 if self.reason == "queue_full" else 503
+
+# --- Request-scoped rejection tracking ---
+# Graph nodes turn exceptions into error messages, so a stage that was shed is also noted here
+# (shared by reference with the tasks LangGraph spawns) for process_query to answer 429/503.
+_admission_rejections: ContextVar[Optional[List[AdmissionRejected]]] = ContextVar("admission_rejections", default=None)
+
+def start_admission_tracking() -> List[AdmissionRejected]:
+    """Starts collecting the current request's admission rejections and returns the list."""
+    rejections: List[AdmissionRejected] = []
+    _admission_rejections.set(rejections)
+    return rejections
+
+def record_admission_rejection(rejection: AdmissionRejected):
+    """Marks the current request as shed by `rejection`, if rejections are being tracked."""
+    rejections = _admission_rejections.get()
+    if rejections is not None:
+        rejections.append(rejection)
+
+class ConcurrencyLimiter:
+    """
+    A semaphore with a bounded wait queue. Callers beyond `max_queue` waiters are rejected
+    immediately; waiters that do not get a slot within `queue_timeout` are rejected too.
+    Queue time is recorded per resource in the histogram and the request timing breakdown.
+    With `sheds_request` set, a rejection also marks the current request as shed.
+    """
+    def __init__(self, resource: str, max_concurrency: int, max_queue: int, queue_timeout: float,
+                 sheds_request: bool = True):
+        self.resource = resource
+        self.sheds_request = sheds_request
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.in_use = 0
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency > 0 else None
+
+    def _reject(self, reason: str):
+        ADMISSION_REJECTED.inc(resource=self.resource, reason=reason)
+        rejection = AdmissionRejected(self.resource, reason)
+        if self.sheds_request:
+            record_admission_rejection(rejection)
+        logging.warning(f"Admission: shed work for '{self.resource}' ({reason}; {self.in_use} running, {self.waiting} waiting).")
+        raise rejection
+
+    async def acquire(self):
+        if self._semaphore is None:
+            self.in_use += 1
+            return
+        start = time.perf_counter()
+        if self._semaphore.locked() or self.waiting:
+            if self.waiting >= self.max_queue:
+                self._reject("queue_full")
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                self._reject("queue_timeout")
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+        self.in_use += 1
+        queued = time.perf_counter() - start
+        ADMISSION_QUEUE_TIME.observe(queued, resource=self.resource)
+        if queued > 0.001:
+            record_request_timing(f"queue.{self.resource}", queued)
+
+    def release(self):
+        self.in_use -= 1
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    @asynccontextmanager
+    async def slot(self):
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+# --- Limiters ---
+_limiters: Dict[str, ConcurrencyLimiter] = {}
+
+ADMISSION_IN_USE = REGISTRY.gauge(
+    "admission_in_use", "Concurrency slots in use, by resource.", ("resource",),
+    callback=lambda: {(limiter.resource,): float(limiter.in_use) for limiter in _limiters.values()})
+ADMISSION_WAITING = REGISTRY.gauge(
+    "admission_waiting", "Work waiting for a concurrency slot, by resource.", ("resource",),
+    callback=lambda: {(limiter.resource,): float(limiter.waiting) for limiter in _limiters.values()})
+
+def get_limiter(resource: str, limits: Dict[str, float], sheds_request: bool = True) -> ConcurrencyLimiter:
+    """Returns the process-wide limiter for `resource`, creating it on first use."""
+    limiter = _limiters.get(resource)
+    if limiter is None:
+        limiter = _limiters[resource] = ConcurrencyLimiter(resource, **limits, sheds_request=sheds_request)
+    return limiter
+
+def query_limiter() -> ConcurrencyLimiter:
+    return get_limiter("query", QUERY_LIMITS)
+
+def db_limiter() -> ConcurrencyLimiter:
+    return get_limiter("db", DB_LIMITS)
+
+def chart_limiter() -> ConcurrencyLimiter:
+    # A shed chart only drops the image; the answer is still returned.
+    return get_limiter("chart", CHART_LIMITS, sheds_request=False)
+
+def export_limiter() -> ConcurrencyLimiter:
+    return get_limiter("export", EXPORT_LIMITS)
+
+def llm_limiter(model_name: str) -> ConcurrencyLimiter:
+    limits = dict(LLM_LIMITS)
+    if model_name in LLM_MAX_CONCURRENCY_OVERRIDES:
+        limits["max_concurrency"] = LLM_MAX_CONCURRENCY_OVERRIDES[model_name]
+    return get_limiter(f"llm:{model_name}", limits)
+
+class LLMAdmissionCallbackHandler(AsyncCallbackHandler):
+    """
+    Holds a slot of the model's limiter for the duration of every LLM call it is attached to.
+    The slot is taken in the start callback (raise_error lets a rejection abort the call) and
+    returned on end or error. A cancelled call gets no error callback, so the slot is also
+    returned when the calling task finishes (run_inline keeps the callback in that task).
+    """
+    raise_error = True
+    run_inline = True
+
+    def __init__(self, model_name: str):
+        super().__init__()
+        self.model_name = model_name
+        self._held: Dict[UUID, ConcurrencyLimiter] = {}
+
+    async def _acquire(self, run_id: UUID):
+        limiter = llm_limiter(self.model_name)
+        await limiter.acquire()
+        self._held[run_id] = limiter
+        task = asyncio.current_task()
+        if task is not None:
+            task.add_done_callback(lambda _task: self._release(run_id))
+
+    def _release(self, run_id: UUID):
+        limiter = self._held.pop(run_id, None)
+        if limiter is not None:
+            limiter.release()
+
+    async def on_chat_model_start(self, serialized: Dict[str, Any], messages, *, run_id: UUID, **kwargs: Any):
+        await self._acquire(run_id)
+
+    async def on_llm_start(self, serialized: Dict[str, Any], prompts, *, run_id: UUID, **kwargs: Any):
+        await self._acquire(run_id)
+
+    async def on_llm_end(self, response, *, run_id: UUID, **kwargs: Any):
+        self._release(run_id)
+
+    async def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        self._release(run_id)
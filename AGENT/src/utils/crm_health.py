@@ -0,0 +1,98 @@
+# src/utils/crm_health.py
+
+import os
+import sys
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from utils.metrics import REGISTRY
+from utils.mcp_inprocess import MCP_TRANSPORT
+
+# Set up basic logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# --- Configuration ---
+# Route the primary router away from the CRM agent while the CRM API's circuit breakers are open.
+CRM_HEALTH_ROUTING = os.getenv("CRM_HEALTH_ROUTING", "true").lower() in ("1", "true", "yes")
+# Health route published by the CRM MCP server next to its /mcp endpoint.
+CRM_HEALTH_URL = os.getenv(
+    "CRM_HEALTH_URL",
+    os.getenv("MCP_CORE_PATH", "http://127.0.0.1:8001/mcp").rstrip("/").rsplit("/", 1)[0] + "/health/crm"
+)
+CRM_HEALTH_POLL_SECONDS = float(os.getenv("CRM_HEALTH_POLL_SECONDS", 5.0))
+CRM_HEALTH_TIMEOUT_SECONDS = float(os.getenv("CRM_HEALTH_TIMEOUT_SECONDS", 2.0))
+
+# --- Metrics ---
+CRM_ROUTED_TO_SQL = REGISTRY.counter(
+    "crm_unhealthy_reroutes_total", "CRM_AGENT routing decisions sent to SQL_ROUTER_AGENT because the CRM API was unhealthy.")
+
+class CRMHealthMonitor:
+    """
+    Tracks whether the CRM API is usable, from the circuit breakers of the CRM MCP server:
+    polled over HTTP, or read directly when the server runs in-process. An unreachable
+    MCP server counts as unhealthy; a server without the health route counts as healthy.
+    """
+    def __init__(self, url: str = CRM_HEALTH_URL, poll_seconds: float = CRM_HEALTH_POLL_SECONDS):
+        self.url = url
+        self.poll_seconds = poll_seconds
+        self.healthy = True
+        self.unhealthy_endpoints: List[str] = []
+        self._task: Optional[asyncio.Task] = None
+        self.healthy_gauge = REGISTRY.gauge(
+            "crm_api_healthy", "1 while the CRM API is considered healthy by the agent's router, else 0.",
+            callback=lambda: {(): float(self.is_healthy())})
+
+    def is_healthy(self) -> bool:
+        if MCP_TRANSPORT == "inprocess":
+            # The server's breakers live in this process; no need to wait for a poll.
+            snapshot = self._local_snapshot()
+            return snapshot is None or bool(snapshot.get("healthy", True))
+        return self.healthy
+
+    def start(self):
+        if self._task is None and MCP_TRANSPORT != "inprocess":
+            self._task = asyncio.create_task(self._poll_loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    @staticmethod
+    def _local_snapshot() -> Optional[Dict[str, Any]]:
+        resilience = sys.modules.get("crm_resilience")
+        return resilience.health_snapshot() if resilience is not None else None
+
+    def _apply(self, healthy: bool, unhealthy_endpoints: List[str]):
+        if healthy != self.healthy:
+            if healthy:
+                logging.info("CRMHealth: CRM API healthy again; CRM routing restored.")
+            else:
+                logging.warning(f"CRMHealth: CRM API unhealthy ({unhealthy_endpoints or 'MCP server unreachable'}); "
+                                "routing CRM questions to SQL.")
+        self.healthy = healthy
+        self.unhealthy_endpoints = unhealthy_endpoints
+
+    async def _poll_loop(self):
+        async with httpx.AsyncClient(timeout=CRM_HEALTH_TIMEOUT_SECONDS) as client:
+            while True:
+                try:
+                    response = await client.get(self.url)
+                    if response.status_code == 404:
+                        self._apply(True, [])  # older server without the health route
+                    else:
+                        response.raise_for_status()
+                        snapshot = response.json()
+                        self._apply(bool(snapshot.get("healthy", True)), snapshot.get("unhealthy_endpoints", []))
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logging.debug(f"CRMHealth: health poll failed: {e}")
+                    self._apply(False, [])
+                await asyncio.sleep(self.poll_seconds)
+
+crm_health_monitor = CRMHealthMonitor()
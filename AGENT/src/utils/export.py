@@ -0,0 +1,273 @@
+# src/utils/export.py
+
+import io
+import os
+import csv
+import time
+import asyncio
+import logging
+import secrets
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from utils.metrics import REGISTRY, DB_CONNECTIONS_OPEN
+from utils.admission import export_limiter, ConcurrencyLimiter
+
+# Set up basic logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# --- Configuration ---
+# Rows fetched from the server-side cursor per chunk (one CSV chunk, Parquet row group or Arrow batch).
+EXPORT_CHUNK_ROWS = int(os.getenv("EXPORT_CHUNK_ROWS", 5000))
+# How long an answer's SQL stays exportable after /query returned its export_id.
+EXPORT_TTL_SECONDS = float(os.getenv("EXPORT_TTL_SECONDS", 3600.0))
+# Exportable queries remembered at once; the oldest are forgotten beyond it.
+EXPORT_MAX_QUERIES = int(os.getenv("EXPORT_MAX_QUERIES", 10000))
+
+# format -> (media type, file extension)
+EXPORT_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+}
+
+# --- Metrics ---
+EXPORTS = REGISTRY.counter(
+    "exports_total", "Result exports by format and outcome (completed / cancelled / failed).", ("format", "status"))
+EXPORT_ROWS = REGISTRY.counter("export_rows_total", "Rows streamed by result exports, by format.", ("format",))
+EXPORT_BYTES = REGISTRY.counter("export_bytes_total", "Bytes streamed by result exports, by format.", ("format",))
+
+class ExportRegistry:
+    """
+    The validated SQL behind recent answers, under unguessable export ids. Only SQL the
+    workflow generated and executed is registered, so an export never runs client SQL.
+    """
+    def __init__(self, ttl_seconds: float = EXPORT_TTL_SECONDS, max_queries: int = EXPORT_MAX_QUERIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_queries = max_queries
+        self._queries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+    def register(self, sql_query: str) -> str:
+        export_id = secrets.token_urlsafe(16)
+        self._queries[export_id] = (sql_query, time.monotonic())
+        while len(self._queries) > self.max_queries:
+            self._queries.popitem(last=False)
+        return export_id
+
+    def get(self, export_id: str) -> Optional[str]:
+        entry = self._queries.get(export_id)
+        if entry is None:
+            return None
+        sql_query, registered_at = entry
+        if time.monotonic() - registered_at > self.ttl_seconds:
+            del self._queries[export_id]
+            return None
+        return sql_query
+
+# --- Column types ---
+# Postgres type name -> (Arrow type, converter for non-NULL values). numeric becomes float64, as
+# in the JSON responses; types not listed are exported as their text form.
+_ARROW_COLUMN_TYPES: Dict[str, Tuple[pa.DataType, Optional[Callable[[Any], Any]]]] = {
+    "bool": (pa.bool_(), None),
+    "int2": (pa.int16(), None),
+    "int4": (pa.int32(), None),
+    "int8": (pa.int64(), None),
+    "oid": (pa.int64(), None),
+    "float4": (pa.float32(), None),
+    "float8": (pa.float64(), None),
+    "numeric": (pa.float64(), float),
+    "money": (pa.string(), str),
+    "text": (pa.string(), None),
+    "varchar": (pa.string(), None),
+    "bpchar": (pa.string(), None),
+    "name": (pa.string(), None),
+    "json": (pa.string(), None),
+    "jsonb": (pa.string(), None),
+    "uuid": (pa.string(), str),
+    "date": (pa.date32(), None),
+    "time": (pa.time64("us"), None),
+    "timestamp": (pa.timestamp("us"), None),
+    "timestamptz": (pa.timestamp("us", tz="UTC"), None),
+    "interval": (pa.duration("us"), None),
+    "bytea": (pa.binary(), bytes),
+}
+
+def _arrow_column(type_name: str) -> Tuple[pa.DataType, Optional[Callable[[Any], Any]]]:
+    return _ARROW_COLUMN_TYPES.get(type_name, (pa.string(), str))
+
+# --- Encoders: each turns fetched records into the next bytes of the file ---
+class _ChunkSink:
+    """Write-only file object that hands back what the Arrow writers wrote since the last take()."""
+    def __init__(self):
+        self._parts: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._parts.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def take(self) -> bytes:
+        data, self._parts = b"".join(self._parts), []
+        return data
+
+class _CSVEncoder:
+    def __init__(self, columns: List[Tuple[str, str]]):
+        self.names = [name for name, _ in columns]
+        self._header_written = False
+
+    def encode(self, records: List[Any]) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if not self._header_written:
+            writer.writerow(self.names)
+            self._header_written = True
+        writer.writerows(tuple(record) for record in records)
+        return buffer.getvalue().encode("utf-8")
+
+    def finish(self) -> bytes:
+        # An empty result still gets its header row.
+        return self.encode([]) if not self._header_written else b""
+
+class _ArrowEncoder:
+    """Arrow IPC stream, or Parquet with one row group per fetched chunk."""
+    def __init__(self, columns: List[Tuple[str, str]], file_format: str):
+        self.arrow_columns = [_arrow_column(type_name) for _, type_name in columns]
+        self.schema = pa.schema([
+            pa.field(name, arrow_type) for (name, _), (arrow_type, _) in zip(columns, self.arrow_columns)
+        ])
+        self.sink = _ChunkSink()
+        if file_format == "parquet":
+            self.writer = pq.ParquetWriter(self.sink, self.schema)
+        else:
+            self.writer = pa.ipc.new_stream(self.sink, self.schema)
+
+    def _batch(self, records: List[Any]) -> pa.RecordBatch:
+        arrays = []
+        for index, (arrow_type, convert) in enumerate(self.arrow_columns):
+            values = [record[index] for record in records]
+            if convert is not None:
+                values = [None if value is None else convert(value) for value in values]
+            arrays.append(pa.array(values, type=arrow_type))
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+    def encode(self, records: List[Any]) -> bytes:
+        if records:
+            self.writer.write_batch(self._batch(records))
+        return self.sink.take()
+
+    def finish(self) -> bytes:
+        self.writer.close()
+        return self.sink.take()
+
+def _make_encoder(file_format: str, columns: List[Tuple[str, str]]):
+    return _CSVEncoder(columns) if file_format == "csv" else _ArrowEncoder(columns, file_format)
+
+class ResultExport:
+    """
+    Streams one query's result in `file_format` through a server-side cursor, EXPORT_CHUNK_ROWS
+    rows at a time, so memory stays bounded by one chunk however large the result. The query
+    runs in a read-only transaction on its own connection, under the export admission limit.
+    If the client disconnects, the stream is cancelled: the running fetch is cancelled on the
+    server and the connection dropped.
+
+    open() acquires the slot, connects and prepares the query (its errors can still become an
+    HTTP status); iterating streams the file; close() is idempotent and runs when the stream
+    ends, fails or is cancelled.
+    """
+    def __init__(self, sql_query: str, file_format: str, db_connector: Any,
+                 limiter: Optional[ConcurrencyLimiter] = None):
+        self.sql_query = sql_query
+        self.file_format = file_format
+        self.db_connector = db_connector
+        self.limiter = limiter or export_limiter()
+        self.columns: List[Tuple[str, str]] = []
+        self.rows = 0
+        self.bytes = 0
+        self._slot_held = False
+        self._conn = None
+        self._cursor = None
+        self._closed = False
+
+    async def open(self):
+        await self.limiter.acquire()
+        self._slot_held = True
+        try:
+            self._conn = await self.db_connector.get_connection()
+            DB_CONNECTIONS_OPEN.inc()
+            # Cursors live inside a transaction; read-only also rejects anything but queries.
+            await self._conn.transaction(readonly=True).start()
+            statement = await self._conn.prepare(self.sql_query)
+            self.columns = [(attribute.name, attribute.type.name) for attribute in statement.get_attributes()]
+            self._cursor = await statement.cursor()
+        except BaseException:
+            await self.close()
+            raise
+
+    async def close(self, graceful: bool = True):
+        if self._closed:
+            return
+        self._closed = True
+        if self._conn is not None:
+            if graceful:
+                try:
+                    await self._conn.close(timeout=5)
+                except Exception:
+                    self._conn.terminate()
+            else:
+                # Cancelled: awaiting here may be cancelled again, so drop the connection at once.
+                self._conn.terminate()
+            DB_CONNECTIONS_OPEN.dec()
+            self._conn = None
+        if self._slot_held:
+            self._slot_held = False
+            self.limiter.release()
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        outcome = "failed"
+        graceful = True
+        start = time.perf_counter()
+        try:
+            encoder = _make_encoder(self.file_format, self.columns)
+            while True:
+                records = await self._cursor.fetch(EXPORT_CHUNK_ROWS)
+                if not records:
+                    break
+                self.rows += len(records)
+                chunk = encoder.encode(records)
+                if chunk:
+                    self.bytes += len(chunk)
+                    yield chunk
+            chunk = encoder.finish()
+            self.bytes += len(chunk)
+            yield chunk
+            outcome = "completed"
+        except (asyncio.CancelledError, GeneratorExit):
+            outcome, graceful = "cancelled", False
+            raise
+        except Exception as e:
+            logging.error(f"Export: streaming {self.file_format} failed after {self.rows} rows: {e}", exc_info=True)
+            raise
+        finally:
+            await self.close(graceful)
+            EXPORTS.inc(format=self.file_format, status=outcome)
+            EXPORT_ROWS.inc(self.rows, format=self.file_format)
+            EXPORT_BYTES.inc(self.bytes, format=self.file_format)
+            logging.info(f"Export: {outcome} {self.file_format} export of {self.rows} rows, {self.bytes} bytes "
+                         f"in {time.perf_counter() - start:.2f}s.")
+
+export_registry = ExportRegistry()
@@ -0,0 +1,28 @@
+# src/utils/gcp_auth.py
+
+import os
+import logging
+
+# Default location of the Vertex AI service account key if GOOGLE_APPLICATION_CREDENTIALS_PATH is not set.
+DEFAULT_SERVICE_ACCOUNT_KEY_PATH = r"C:\Users\Admin\Downloads\geminimcp-464809-eee97d96077e.json"
+
+def configure_gcp_credentials(component: str):
+    """
+    Points GOOGLE_APPLICATION_CREDENTIALS at the service account key file.
+    Set SKIP_GCP_CREDENTIALS=1 to skip this entirely (offline benchmarks, fake LLMs).
+
+    Raises:
+        FileNotFoundError: If the key file does not exist.
+    """
+    if os.getenv("SKIP_GCP_CREDENTIALS", "").lower() in ("1", "true", "yes"):
+        logging.info(f"[{component} Setup] SKIP_GCP_CREDENTIALS is set; not configuring Google credentials.")
+        return
+
+    service_account_key_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS_PATH", DEFAULT_SERVICE_ACCOUNT_KEY_PATH)
+    if not os.path.exists(service_account_key_path):
+        logging.error(f"[{component} Fatal Error] Service account key file not found at: {service_account_key_path}")
+        logging.error("Please ensure the service account JSON key file exists at the specified path in your .env or script.")
+        raise FileNotFoundError(f"Service account key file not found at: {service_account_key_path}")
+
+    os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = service_account_key_path
+    logging.info(f"[{component} Setup] GOOGLE_APPLICATION_CREDENTIALS set to: {service_account_key_path}")
@@ -0,0 +1,86 @@
+# src/utils/json_response.py
+
+import time
+import base64
+import datetime
+from decimal import Decimal
+from typing import Any
+
+import orjson
+import numpy as np
+from fastapi.responses import JSONResponse
+
+from utils.metrics import REGISTRY
+from database.result_set import ResultSet
+
+# --- Metrics ---
+# Plain answers encode in well under a millisecond; include_results bodies run to megabytes.
+RESPONSE_SERIALIZE_DURATION = REGISTRY.histogram(
+    "response_serialize_seconds", "Time spent encoding JSON response bodies, by endpoint.", ("endpoint",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0))
+RESPONSE_BYTES = REGISTRY.histogram(
+    "response_bytes", "Size of encoded JSON response bodies, by endpoint.", ("endpoint",),
+    buckets=(1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000))
+
+# str/int/float/bool/None, dict, list, tuple, datetime/date/time, UUID, Enum and numpy arrays and
+# scalars are encoded natively by orjson; everything else goes through _encode_fallback.
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def _encode_fallback(value: Any) -> Any:
+    """
+    Types orjson does not know, encoded as jsonable_encoder(custom_encoder={Decimal: float})
+    did, so clients see the same JSON. Called once per such cell, not per row.
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, ResultSet):
+        # A columnar SQL result encodes as the usual list of row objects.
+        return value.to_records()
+    if value.__class__.__name__ in ("NaTType", "NAType"):
+        # pandas missing values (NaT is itself a datetime subclass)
+        return None
+    if isinstance(value, datetime.datetime):
+        # datetime subclasses such as pandas.Timestamp (orjson only encodes the exact type)
+        return value.isoformat()
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        raw = bytes(value)
+        try:
+            return raw.decode()
+        except UnicodeDecodeError:
+            # bytea columns holding binary data; jsonable_encoder would have failed the request
+            return base64.b64encode(raw).decode("ascii")
+    if isinstance(value, np.floating):
+        # numpy.longdouble (its .item() is still a numpy scalar)
+        return float(value)
+    if isinstance(value, np.generic):
+        # other numpy scalar types orjson does not encode natively (e.g. numpy.str_)
+        return value.item()
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    # Remaining driver types (ipaddress, asyncpg Range/Point, ...) as their text form.
+    return str(value)
+
+def dumps(content: Any) -> bytes:
+    """Encodes `content` as compact UTF-8 JSON in one pass. NaN and Infinity become null."""
+    return orjson.dumps(content, default=_encode_fallback, option=ORJSON_OPTIONS)
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse encoded with orjson: Decimal, datetime, UUID and numpy values are handled
+    during encoding, so handlers return their raw results instead of first walking them
+    with jsonable_encoder and then having the standard library encode the copy again.
+    """
+    def __init__(self, content: Any, endpoint: str = "other", **kwargs: Any):
+        self.endpoint = endpoint
+        super().__init__(content, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        start = time.perf_counter()
+        body = dumps(content)
+        RESPONSE_SERIALIZE_DURATION.observe(time.perf_counter() - start, endpoint=self.endpoint)
+        RESPONSE_BYTES.observe(len(body), endpoint=self.endpoint)
+        return body
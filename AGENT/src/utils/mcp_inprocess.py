@@ -0,0 +1,70 @@
+# src/utils/mcp_inprocess.py
+
+import os
+import sys
+import time
+import importlib
+import logging
+from typing import Any, List
+
+from dotenv import load_dotenv
+from langchain_core.tools import BaseTool, StructuredTool
+
+from utils.metrics import REGISTRY
+
+# Set up basic logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# --- Configuration ---
+# How the CRM agent reaches the CRM tools: "http" (the MCP server at MCP_CORE_PATH) or "inprocess"
+# (the FastMCP server module imported into this process; for deployments on the same host).
+MCP_TRANSPORT = os.getenv("MCP_TRANSPORT", "http").lower()
+# Directory containing crm_mcp_server.py (and its .env) for the in-process transport.
+MCP_SERVER_DIR = os.getenv(
+    "MCP_SERVER_DIR",
+    os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../MCP'))
+)
+MCP_SERVER_MODULE = os.getenv("MCP_SERVER_MODULE", "crm_mcp_server")
+
+# --- Metrics ---
+MCP_INPROCESS_TOOLS = REGISTRY.gauge(
+    "mcp_inprocess_tools", "CRM tools registered directly from the in-process FastMCP server.")
+
+def _import_server_module():
+    """Imports the FastMCP server module without starting its HTTP app (that only runs under __main__)."""
+    if MCP_SERVER_DIR not in sys.path:
+        sys.path.insert(0, MCP_SERVER_DIR)
+    # The server reads its settings (CRM API URL, data backend) from its own .env; ours take precedence.
+    load_dotenv(dotenv_path=os.path.join(MCP_SERVER_DIR, '.env'))
+    return importlib.import_module(MCP_SERVER_MODULE)
+
+def _make_tool(server: Any, name: str, description: str, input_schema: dict) -> BaseTool:
+    async def call_tool(**arguments: Any) -> Any:
+        # The tool manager validates the arguments against the tool's signature exactly as the
+        # HTTP server does, but hands back the Python result instead of serialised content
+        # (FastMCP.call_tool, the public method, returns the serialised content). _tool_manager
+        # is private to FastMCP, which is why AGENT/requirements.txt pins mcp to the server's version.
+        return await server._tool_manager.call_tool(name, arguments)
+
+    return StructuredTool(name=name, description=description, args_schema=input_schema, coroutine=call_tool)
+
+async def load_inprocess_tools() -> List[BaseTool]:
+    """
+    LangChain tools calling the FastMCP tool functions of MCP_SERVER_MODULE directly, with
+    the names, descriptions and input schemas the server publishes over MCP. Results are
+    the tools' Python values, so a call skips the HTTP hop and the JSON round trip.
+    """
+    start = time.perf_counter()
+    module = _import_server_module()
+    server = getattr(module, "fastmcp")
+    if not hasattr(getattr(server, "_tool_manager", None), "call_tool"):
+        raise RuntimeError("MCP in-process: this mcp version's FastMCP has no _tool_manager.call_tool; "
+                           "install the mcp version pinned in AGENT/requirements.txt or use MCP_TRANSPORT=http.")
+    tools = [
+        _make_tool(server, tool.name, tool.description or "", tool.inputSchema)
+        for tool in await server.list_tools()
+    ]
+    MCP_INPROCESS_TOOLS.set(len(tools))
+    logging.info(f"MCP in-process: registered {len(tools)} tools from {MCP_SERVER_MODULE} "
+                 f"({time.perf_counter() - start:.3f}s).")
+    return tools
@@ -0,0 +1,231 @@
+# src/utils/mcp_session.py
+
+import os
+import json
+import time
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import anyio
+import httpx
+from langchain_core.tools import BaseTool
+from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import load_mcp_tools
+from mcp import ClientSession, types as mcp_types
+from mcp.shared.exceptions import McpError
+
+from utils.metrics import REGISTRY, record_request_timing
+
+# Set up basic logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# --- Configuration ---
+# Keep one MCP session open and reuse it for every tool call (false = a new session per call).
+MCP_PERSISTENT_SESSION = os.getenv("MCP_PERSISTENT_SESSION", "true").lower() in ("1", "true", "yes")
+# How often the idle session is pinged, so a dead connection is replaced before a call needs it.
+MCP_SESSION_HEALTHCHECK_SECONDS = float(os.getenv("MCP_SESSION_HEALTHCHECK_SECONDS", 30.0))
+# How often the server's tool list is compared with the loaded tools (servers may not announce changes).
+MCP_TOOL_REFRESH_SECONDS = float(os.getenv("MCP_TOOL_REFRESH_SECONDS", 300.0))
+# Delay before reconnecting after the session failed to open or was lost.
+MCP_SESSION_RECONNECT_SECONDS = float(os.getenv("MCP_SESSION_RECONNECT_SECONDS", 2.0))
+# How long a tool call waits for a usable session before failing.
+MCP_SESSION_CONNECT_TIMEOUT_SECONDS = float(os.getenv("MCP_SESSION_CONNECT_TIMEOUT_SECONDS", 15.0))
+
+# --- Metrics ---
+MCP_SESSION_HANDSHAKE_DURATION = REGISTRY.histogram(
+    "mcp_session_handshake_seconds", "Time to open an MCP session (initialize handshake + tool list), by server.",
+    ("server",))
+MCP_SESSION_CONNECTS = REGISTRY.counter(
+    "mcp_session_connects_total", "MCP session (re)connect attempts, by server and outcome (ok / error).",
+    ("server", "status"))
+MCP_TOOLS_RELOADED = REGISTRY.counter(
+    "mcp_tools_reloaded_total", "Tool list reloads after the MCP server's tools changed, by server.", ("server",))
+MCP_CALL_PHASE_DURATION = REGISTRY.histogram(
+    "mcp_call_phase_seconds", "Per tool call: time waiting for a usable session (handshake) vs running the tool "
+    "(execution), by server.", ("server", "phase"))
+
+_managers: List["MCPSessionManager"] = []
+
+MCP_SESSION_UP = REGISTRY.gauge(
+    "mcp_session_up", "1 while the persistent MCP session is open, by server.", ("server",),
+    callback=lambda: {(manager.server_name,): float(manager.is_ready) for manager in _managers})
+
+def _is_transport_error(error: BaseException) -> bool:
+    """True for failures of the connection itself (worth a reconnect), not of the tool."""
+    if isinstance(error, McpError):
+        return error.error.code == mcp_types.CONNECTION_CLOSED
+    return isinstance(error, (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream,
+                              httpx.TransportError, ConnectionError))
+
+def _tools_signature(tools: List[mcp_types.Tool]) -> Tuple:
+    return tuple(sorted(
+        (tool.name, tool.description or "", json.dumps(tool.inputSchema, sort_keys=True, default=str))
+        for tool in tools
+    ))
+
+class MCPSessionManager:
+    """
+    Owns one long-lived MCP client session to `server_name` and the LangChain tools bound
+    to it, so tool calls skip the per-call initialize handshake. A background task opens
+    the session (the transport's context must be entered and exited in the same task),
+    pings it while idle, reloads the tools when the server's list changes (announced or
+    found by polling) and reconnects after failures. Calls hitting a dropped connection
+    are retried once on the new session; CRM tools are read-only, so this is safe.
+    """
+    def __init__(self, server_name: str, connection: Dict[str, Any],
+                 on_tools: Optional[Callable[[List[BaseTool]], None]] = None):
+        self.server_name = server_name
+        self.on_tools = on_tools
+        self.client = MultiServerMCPClient({
+            server_name: {**connection, "session_kwargs": {"message_handler": self._on_server_message}}
+        })
+        self.tools: List[BaseTool] = []
+        self._tools_by_name: Dict[str, BaseTool] = {}
+        self._signature: Tuple = ()
+        self._ready = asyncio.Event()
+        self._wakeup = asyncio.Event()
+        self._reconnect_requested = False
+        self._tools_changed = False
+        self._last_error: Optional[BaseException] = None
+        # Incremented per opened session, so a failure seen on an old session does not drop a new one.
+        self._generation = 0
+        self._task: Optional[asyncio.Task] = None
+        _managers.append(self)
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    async def start(self, timeout: float = MCP_SESSION_CONNECT_TIMEOUT_SECONDS) -> List[BaseTool]:
+        """Starts the session task and waits for the first tool list; raises if it cannot connect."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            raise ConnectionError(
+                f"MCP server '{self.server_name}' did not accept a session within {timeout}s: {self._last_error}"
+            )
+        return self.tools
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self in _managers:
+            _managers.remove(self)
+
+    def request_reconnect(self, generation: Optional[int] = None):
+        """Drops the current session (if it is still `generation`); the background task opens a new one."""
+        if generation is not None and generation != self._generation:
+            return
+        self._reconnect_requested = True
+        self._ready.clear()
+        self._wakeup.set()
+
+    # --- Tool calls ---
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """Runs `tool_name` on the shared session, reconnecting and retrying once if the connection was lost."""
+        for attempt in (1, 2):
+            wait_start = time.perf_counter()
+            if not self._ready.is_set():
+                try:
+                    await asyncio.wait_for(self._ready.wait(), MCP_SESSION_CONNECT_TIMEOUT_SECONDS)
+                except asyncio.TimeoutError:
+                    raise ConnectionError(f"No MCP session to '{self.server_name}' available: {self._last_error}")
+            waited = time.perf_counter() - wait_start
+            MCP_CALL_PHASE_DURATION.observe(waited, server=self.server_name, phase="handshake")
+            if waited > 0.001:
+                record_request_timing(f"mcp_handshake.{self.server_name}", waited)
+
+            tool = self._tools_by_name.get(tool_name)
+            generation = self._generation
+            if tool is None:
+                raise ValueError(f"Tool '{tool_name}' is not offered by MCP server '{self.server_name}'.")
+            call_start = time.perf_counter()
+            try:
+                return await tool.ainvoke(arguments)
+            except Exception as e:
+                if attempt == 2 or not _is_transport_error(e):
+                    raise
+                logging.warning(f"MCPSession[{self.server_name}]: connection lost during '{tool_name}' ({e!r}); reconnecting.")
+                self.request_reconnect(generation)
+            finally:
+                MCP_CALL_PHASE_DURATION.observe(
+                    time.perf_counter() - call_start, server=self.server_name, phase="execution")
+
+    # --- Session task ---
+    async def _on_server_message(self, message: Any):
+        if isinstance(message, mcp_types.ServerNotification) and \
+                isinstance(message.root, mcp_types.ToolListChangedNotification):
+            self._tools_changed = True
+            self._wakeup.set()
+
+    def _publish_tools(self, tools: List[BaseTool], signature: Tuple):
+        self.tools = tools
+        self._tools_by_name = {tool.name: tool for tool in tools}
+        self._signature = signature
+        if self.on_tools is not None:
+            self.on_tools(tools)
+
+    async def _load_tools(self, session: ClientSession):
+        # Tools are bound to the session they were loaded from, so every new session reloads them.
+        listed = await session.list_tools()
+        tools = await load_mcp_tools(session)
+        self._publish_tools(tools, _tools_signature(listed.tools))
+
+    async def _run(self):
+        while True:
+            start = time.perf_counter()
+            try:
+                async with self.client.session(self.server_name) as session:
+                    await self._load_tools(session)
+                    self._generation += 1
+                    MCP_SESSION_HANDSHAKE_DURATION.observe(time.perf_counter() - start, server=self.server_name)
+                    MCP_SESSION_CONNECTS.inc(server=self.server_name, status="ok")
+                    self._reconnect_requested = False
+                    self._ready.set()
+                    logging.info(f"MCPSession[{self.server_name}]: session open with {len(self.tools)} tools "
+                                 f"({time.perf_counter() - start:.3f}s).")
+                    await self._watch(session)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._last_error = e
+                MCP_SESSION_CONNECTS.inc(server=self.server_name, status="error")
+                logging.error(f"MCPSession[{self.server_name}]: session failed: {e!r}")
+            finally:
+                self._ready.clear()
+            if not self._reconnect_requested:
+                await asyncio.sleep(MCP_SESSION_RECONNECT_SECONDS)
+
+    async def _watch(self, session: ClientSession):
+        """Returns when the session should be replaced; keeps the tool list current meanwhile."""
+        next_tool_refresh = time.monotonic() + MCP_TOOL_REFRESH_SECONDS
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), MCP_SESSION_HEALTHCHECK_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if self._reconnect_requested:
+                return
+
+            try:
+                if self._tools_changed or time.monotonic() >= next_tool_refresh:
+                    self._tools_changed = False
+                    next_tool_refresh = time.monotonic() + MCP_TOOL_REFRESH_SECONDS
+                    listed = await asyncio.wait_for(session.list_tools(), MCP_SESSION_CONNECT_TIMEOUT_SECONDS)
+                    if _tools_signature(listed.tools) != self._signature:
+                        await self._load_tools(session)
+                        MCP_TOOLS_RELOADED.inc(server=self.server_name)
+                        logging.info(f"MCPSession[{self.server_name}]: tool list changed; loaded "
+                                     f"{[tool.name for tool in self.tools]}.")
+                else:
+                    await asyncio.wait_for(session.send_ping(), MCP_SESSION_CONNECT_TIMEOUT_SECONDS)
+            except Exception as e:
+                self._last_error = e
+                logging.warning(f"MCPSession[{self.server_name}]: health check failed ({e!r}); reconnecting.")
+                return
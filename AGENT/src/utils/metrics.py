@@ -0,0 +1,305 @@
+# src/utils/metrics.py
+
+import os
+import time
+import asyncio
+import functools
+import logging
+import threading
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, Any, List, Optional, Tuple, Callable
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+# Set up basic logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Default latency buckets (seconds), covering fast DB calls up to slow multi-step LLM chains.
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+ROW_COUNT_BUCKETS = (0, 1, 10, 100, 1000, 10000, 100000)
+EVENT_LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# How often (seconds) the event-loop lag probe wakes up.
+EVENT_LOOP_LAG_INTERVAL = float(os.getenv("EVENT_LOOP_LAG_INTERVAL", 0.25))
+
+def _escape_label_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(labelnames: Tuple[str, ...], labelvalues: Tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(labelnames, labelvalues)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+class _Metric:
+    """Base class for a labelled metric family rendered in Prometheus text format."""
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _label_key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"] + self._render_samples()
+
+    def _render_samples(self) -> List[str]:
+        raise NotImplementedError
+
+class Counter(_Metric):
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._label_key(labels), 0.0)
+
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_number(value)}" for key, value in items]
+
+class Gauge(_Metric):
+    """A gauge whose value is either set directly or read from a callback at render time."""
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 callback: Optional[Callable[[], Dict[Tuple[str, ...], float]]] = None):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._callback = callback
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._label_key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def _render_samples(self) -> List[str]:
+        if self._callback is not None:
+            try:
+                items = list(self._callback().items())
+            except Exception as e:
+                logging.warning(f"Metrics: gauge callback for '{self.name}' failed: {e}")
+                items = []
+        else:
+            with self._lock:
+                items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_number(value)}" for key, value in items]
+
+class Histogram(_Metric):
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label key -> [per-bucket counts (non-cumulative, last slot is +Inf), sum, count]
+        self._values: Dict[Tuple[str, ...], List[Any]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._label_key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                self._values[key] = state
+            state[0][bisect_left(self.buckets, value)] += 1
+            state[1] += value
+            state[2] += 1
+
+    def _render_samples(self) -> List[str]:
+        lines = []
+        with self._lock:
+            items = [(key, (list(state[0]), state[1], state[2])) for key, state in self._values.items()]
+        for key, (bucket_counts, total, count) in items:
+            cumulative = 0
+            for upper_bound, bucket_count in zip(self.buckets + (float("inf"),), bucket_counts):
+                cumulative += bucket_count
+                le = f'le="{_format_number(upper_bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_number(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {count}")
+        return lines
+
+class MetricsRegistry:
+    """Holds every metric family and renders them for the /metrics endpoint."""
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+              callback: Optional[Callable[[], Dict[Tuple[str, ...], float]]] = None) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames, callback))
+
+    def histogram(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+REGISTRY = MetricsRegistry()
+
+# --- Core metric families ---
+GRAPH_NODE_DURATION = REGISTRY.histogram(
+    "graph_node_duration_seconds", "Duration of each LangGraph node in the query workflow.", ("node",))
+QUERY_DURATION = REGISTRY.histogram(
+    "query_request_duration_seconds", "End-to-end duration of /query requests by primary route.", ("route", "success"))
+LLM_CALL_DURATION = REGISTRY.histogram(
+    "llm_call_duration_seconds", "Duration of LLM calls by agent.", ("agent",))
+LLM_TOKENS = REGISTRY.counter(
+    "llm_tokens_total", "LLM tokens consumed by agent and kind (prompt / completion).", ("agent", "kind"))
+DB_QUERY_DURATION = REGISTRY.histogram(
+    "db_query_duration_seconds", "Duration of database queries (including connection setup).", ("operation",))
+DB_QUERY_ROWS = REGISTRY.histogram(
+    "db_query_rows", "Rows returned by database queries.", ("operation",), buckets=ROW_COUNT_BUCKETS)
+DB_CONNECTIONS_OPENED = REGISTRY.counter(
+    "db_connections_opened_total", "Database connections opened by the agent service.")
+DB_CONNECTIONS_OPEN = REGISTRY.gauge(
+    "db_connections_open", "Database connections currently held open by query execution.")
+SQL_SCHEMA_WIDENED = REGISTRY.counter(
+    "sql_schema_widened_total", "SQL generations retried with the full schema after SQL from a pruned schema failed.")
+SCHEMA_CHANGE_EVENTS = REGISTRY.counter(
+    "schema_change_events_total", "Schema refreshes triggered by DDL notifications (scope: tables / full) and outcome.",
+    ("scope", "status"))
+SCHEMA_REFRESH_DURATION = REGISTRY.histogram(
+    "schema_refresh_duration_seconds", "Duration of schema refreshes triggered by DDL notifications.", ("scope",))
+SCHEMA_WATCHER_LISTENING = REGISTRY.gauge(
+    "schema_watcher_listening", "1 while the schema change watcher holds a LISTEN connection, else 0.")
+SPECULATIVE_CALLS = REGISTRY.counter(
+    "speculative_calls_total", "Work started speculatively, by kind and outcome "
+    "(hit = used, wasted = finished but unused, cancelled = stopped before finishing, failed = needed but errored).",
+    ("kind", "outcome"))
+HEDGED_RUNS = REGISTRY.counter(
+    "hedged_runs_total", "Hedged runs of the CRM agent and the SQL path, by winning branch (none = both failed).",
+    ("winner",))
+HEDGE_BRANCH_DURATION = REGISTRY.histogram(
+    "hedge_branch_duration_seconds", "Duration of each hedged branch, by branch and outcome "
+    "(won / lost = succeeded but outranked / failed / cancelled).", ("branch", "outcome"))
+CRM_AGENT_RUNS = REGISTRY.counter(
+    "crm_agent_runs_total", "CRM agent runs by outcome (success / no_data / tool_error / agent_error).", ("status",))
+MCP_TOOL_DURATION = REGISTRY.histogram(
+    "mcp_tool_duration_seconds", "Duration of MCP tool calls by tool and outcome.", ("tool", "status"))
+EVENT_LOOP_LAG = REGISTRY.histogram(
+    "event_loop_lag_seconds", "How late the event loop ran a periodic probe (blocking calls show up here).",
+    buckets=EVENT_LOOP_LAG_BUCKETS)
+EVENT_LOOP_LAG_LAST = REGISTRY.gauge(
+    "event_loop_lag_last_seconds", "Event-loop lag measured by the most recent probe.")
+
+async def monitor_event_loop_lag(interval: float = EVENT_LOOP_LAG_INTERVAL):
+    """
+    Runs forever, sleeping `interval` seconds at a time and recording how much later than
+    requested each wake-up happened. Start it as a background task on the serving loop.
+    """
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lag = max(0.0, time.perf_counter() - start - interval)
+        EVENT_LOOP_LAG.observe(lag)
+        EVENT_LOOP_LAG_LAST.set(lag)
+
+# --- Request-scoped timing breakdown ---
+# Holds the current /query request's {stage: seconds} breakdown. The dict is shared by
+# reference with the tasks LangGraph spawns, so node timings recorded there land here.
+_request_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("request_timings", default=None)
+
+def start_request_timings() -> Dict[str, float]:
+    """Starts a fresh timing breakdown for the current request and returns it."""
+    timings: Dict[str, float] = {}
+    _request_timings.set(timings)
+    return timings
+
+def record_request_timing(stage: str, seconds: float):
+    """Adds `seconds` to `stage` in the current request's breakdown, if one is active."""
+    timings = _request_timings.get()
+    if timings is not None:
+        timings[stage] = round(timings.get(stage, 0.0) + seconds, 6)
+
+def timed_node(node_name: str):
+    """Decorator for async LangGraph nodes: records a latency histogram and the request breakdown."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                GRAPH_NODE_DURATION.observe(elapsed, node=node_name)
+                record_request_timing(f"node.{node_name}", elapsed)
+        return wrapper
+    return decorator
+
+class LLMMetricsCallbackHandler(BaseCallbackHandler):
+    """LangChain callback recording latency and token usage of every LLM call for one agent."""
+    def __init__(self, agent_name: str):
+        super().__init__()
+        self.agent_name = agent_name
+        self._start_times: Dict[Any, float] = {}
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        self._start_times[run_id] = time.perf_counter()
+
+    def on_llm_start(self, serialized, prompts, *, run_id, **kwargs):
+        self._start_times[run_id] = time.perf_counter()
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        start = self._start_times.pop(run_id, None)
+        if start is not None:
+            elapsed = time.perf_counter() - start
+            LLM_CALL_DURATION.observe(elapsed, agent=self.agent_name)
+            record_request_timing(f"llm.{self.agent_name}", elapsed)
+
+        prompt_tokens, completion_tokens = 0, 0
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if usage:
+                    prompt_tokens += usage.get("input_tokens", 0)
+                    completion_tokens += usage.get("output_tokens", 0)
+        if prompt_tokens:
+            LLM_TOKENS.inc(prompt_tokens, agent=self.agent_name, kind="prompt")
+        if completion_tokens:
+            LLM_TOKENS.inc(completion_tokens, agent=self.agent_name, kind="completion")
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._start_times.pop(run_id, None)
@@ -0,0 +1,134 @@
+# src/utils/model_registry.py
+
+import os
+import logging
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+from langchain_google_vertexai import ChatVertexAI
+from langchain_core.exceptions import OutputParserException
+from langchain_core.prompts import ChatPromptTemplate
+
+from utils.metrics import REGISTRY, LLMMetricsCallbackHandler
+from utils.admission import LLMAdmissionCallbackHandler
+
+# Set up basic logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# --- Load Environment Variables ---
+load_dotenv(dotenv_path=os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../config/.env'))
+
+GCP_PROJECT_ID = os.getenv("GCP_PROJECT_ID", "geminimcp-464809")
+GOOGLE_LOCATION = os.getenv("GOOGLE_LOCATION", "us-central1")
+
+# --- Configuration ---
+# Model behind each tier.
+MODEL_TIERS = {
+    "fast": os.getenv("MODEL_TIER_FAST", "gemini-2.5-flash"),
+    "pro": os.getenv("MODEL_TIER_PRO", "gemini-2.5-pro"),
+}
+# Tier each role uses unless MODEL_ROLE_<ROLE> overrides it with a tier name or a model name
+# (e.g. MODEL_ROLE_SQL_ROUTER=pro or MODEL_ROLE_CLARIFY=gemini-2.0-flash).
+DEFAULT_ROLE_TIERS = {
+    "primary_router": "fast",
+    "sql_router": "fast",
+    "clarify": "fast",
+    "summarize_history": "fast",
+    "general_query": "fast",
+    "final_response": "fast",
+    "sql_agent": "pro",
+    "crm_agent": "pro",
+}
+# Tier a fast-tier role escalates to when its output fails parsing or confidence checks.
+ESCALATION_TIER = os.getenv("MODEL_ESCALATION_TIER", "pro")
+# Self-reported confidence below which a fast-tier routing decision is re-done on ESCALATION_TIER.
+MODEL_ESCALATION_MIN_CONFIDENCE = float(os.getenv("MODEL_ESCALATION_MIN_CONFIDENCE", 0.6))
+
+# --- Metrics ---
+LLM_ESCALATION_CHECKS = REGISTRY.counter(
+    "llm_escalation_checks_total", "Fast-tier outputs checked for escalation, by role.", ("role",))
+LLM_ESCALATIONS = REGISTRY.counter(
+    "llm_escalations_total", "Calls re-run on the escalation tier, by role and reason "
+    "(parse_error / invalid_output / low_confidence).", ("role", "reason"))
+
+def model_for_role(role: str) -> str:
+    """The model name configured for `role`."""
+    choice = os.getenv(f"MODEL_ROLE_{role.upper()}", DEFAULT_ROLE_TIERS.get(role, "pro"))
+    return MODEL_TIERS.get(choice, choice)
+
+def escalation_model_for_role(role: str) -> Optional[str]:
+    """The model `role` escalates to, or None if it already runs on that model."""
+    escalation_model = MODEL_TIERS.get(ESCALATION_TIER, ESCALATION_TIER)
+    return None if escalation_model == model_for_role(role) else escalation_model
+
+_models: Dict[Tuple[str, str, Tuple], ChatVertexAI] = {}
+
+def get_chat_model(role: str, model_name: Optional[str] = None, metrics_name: Optional[str] = None,
+                   **llm_kwargs: Any) -> ChatVertexAI:
+    """
+    Returns the ChatVertexAI for `role` (or an explicit `model_name`) with the shared project,
+    location, latency/token metrics and per-model admission control. Instances are reused.
+    """
+    model_name = model_name or model_for_role(role)
+    metrics_name = metrics_name or role
+    key = (metrics_name, model_name, tuple(sorted(llm_kwargs.items())))
+    model = _models.get(key)
+    if model is None:
+        options = {"temperature": 0.0, **llm_kwargs}
+        model = _models[key] = ChatVertexAI(
+            model_name=model_name,
+            project=GCP_PROJECT_ID,
+            location=GOOGLE_LOCATION,
+            callbacks=[LLMMetricsCallbackHandler(metrics_name), LLMAdmissionCallbackHandler(model_name)],
+            **options
+        )
+    return model
+
+# Returns None when the output is acceptable, otherwise the escalation reason.
+OutputCheck = Callable[[Any], Optional[str]]
+
+def confidence_check(value: Any) -> Optional[str]:
+    """'low_confidence' if a JSON decision reports a confidence below the threshold (missing = fine)."""
+    confidence = value.get("confidence") if isinstance(value, dict) else None
+    try:
+        if confidence is not None and float(confidence) < MODEL_ESCALATION_MIN_CONFIDENCE:
+            return "low_confidence"
+    except (TypeError, ValueError):
+        return "invalid_output"
+    return None
+
+class EscalatingChain:
+    """
+    prompt | model | parser on the role's model, re-run once on the escalation tier when the
+    output cannot be parsed or `check` rejects it. Roles already on the escalation tier run
+    the plain chain. Exceptions from the escalated call propagate to the caller.
+    """
+    def __init__(self, role: str, prompt: ChatPromptTemplate, parser: Any, check: Optional[OutputCheck] = None,
+                 model_name: Optional[str] = None, **llm_kwargs: Any):
+        self.role = role
+        self.check = check
+        self.chain = prompt | get_chat_model(role, model_name, **llm_kwargs) | parser
+        escalation_model = None if model_name else escalation_model_for_role(role)
+        self.escalation_chain = None
+        if escalation_model:
+            self.escalation_chain = prompt | get_chat_model(
+                role, escalation_model, metrics_name=f"{role}_escalated", **llm_kwargs
+            ) | parser
+
+    async def ainvoke(self, inputs: Dict[str, Any]) -> Any:
+        if self.escalation_chain is None:
+            return await self.chain.ainvoke(inputs)
+
+        LLM_ESCALATION_CHECKS.inc(role=self.role)
+        try:
+            result = await self.chain.ainvoke(inputs)
+            reason = self.check(result) if self.check else None
+        except OutputParserException as e:
+            logging.warning(f"EscalatingChain[{self.role}]: fast-tier output could not be parsed: {e}")
+            reason = "parse_error"
+        if reason is None:
+            return result
+
+        LLM_ESCALATIONS.inc(role=self.role, reason=reason)
+        logging.info(f"EscalatingChain[{self.role}]: escalating ({reason}).")
+        return await self.escalation_chain.ainvoke(inputs)
@@ -0,0 +1,88 @@
+# src/utils/request_coalescer.py
+
+import os
+import re
+import json
+import asyncio
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from langchain_core.messages import BaseMessage
+
+from utils.metrics import REGISTRY
+
+# Set up basic logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# --- Configuration ---
+QUERY_COALESCING_ENABLED = os.getenv("QUERY_COALESCING_ENABLED", "true").lower() in ("1", "true", "yes")
+
+def normalize_query_text(query: str) -> str:
+    """Case-, whitespace- and trailing-punctuation-insensitive form of a question."""
+    return re.sub(r"\s+", " ", (query or "").strip().lower()).rstrip(" ?!.")
+
+def coalescing_key(query: str, prompt_history: List[BaseMessage]) -> str:
+    """
+    Key under which identical in-flight requests share one execution: the normalized
+    question plus the history the agents will actually see (after summarisation/budgeting).
+    """
+    context = [(message.type, message.content) for message in prompt_history]
+    payload = json.dumps([normalize_query_text(query), context], ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class _InFlight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+class RequestCoalescer:
+    """
+    Single-flight execution: while a call for a key is running, further calls for the same
+    key await that call's result instead of starting their own. Nothing is kept once the
+    call finishes, so this is not a cache. The shared call runs in its own task; it is
+    cancelled only when every caller waiting on it has gone away.
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight: Dict[str, _InFlight] = {}
+        self.coalesced = REGISTRY.counter(
+            f"{name}_coalesced_total", "Requests that joined an identical in-flight execution instead of starting one.")
+        self.executions = REGISTRY.counter(
+            f"{name}_coalescer_executions_total", "Executions started by the request coalescer (one per distinct key).")
+        self.in_flight_gauge = REGISTRY.gauge(
+            f"{name}_coalescer_in_flight", "Distinct executions currently shared through the request coalescer.",
+            callback=lambda: {(): float(len(self._in_flight))})
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Returns (result, shared): the result of the in-flight execution for `key`, starting it
+        with `factory()` if there is none. `shared` is True when another request started it.
+        Exceptions from the execution are raised to every caller.
+        """
+        entry = self._in_flight.get(key)
+        shared = entry is not None
+        if entry is None:
+            entry = _InFlight(asyncio.create_task(factory()))
+            self._in_flight[key] = entry
+            entry.task.add_done_callback(lambda _task: self._forget(key, entry))
+            self.executions.inc()
+        else:
+            self.coalesced.inc()
+            logging.info(f"RequestCoalescer[{self.name}]: joined an in-flight execution ({entry.waiters} waiting).")
+
+        entry.waiters += 1
+        try:
+            return await asyncio.shield(entry.task), shared
+        except asyncio.CancelledError:
+            if entry.waiters == 1 and not entry.task.done():
+                entry.task.cancel()
+            raise
+        finally:
+            entry.waiters -= 1
+
+    def _forget(self, key: str, entry: _InFlight):
+        if self._in_flight.get(key) is entry:
+            del self._in_flight[key]
@@ -0,0 +1,271 @@
+# src/utils/result_store.py
+
+import os
+import time
+import shutil
+import asyncio
+import logging
+import secrets
+import tempfile
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+import orjson
+
+from utils.metrics import REGISTRY
+from utils.json_response import dumps
+from database.result_set import ResultSet
+
+# Set up basic logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# --- Configuration ---
+# Return large SQL results as a first page plus a result id (false = inline every row in /query).
+RESULT_HANDLES_ENABLED = os.getenv("RESULT_HANDLES_ENABLED", "true").lower() in ("1", "true", "yes")
+# Rows returned inline by /query; results with more rows get a result id for /results/{id}.
+RESULT_PAGE_SIZE = int(os.getenv("RESULT_PAGE_SIZE", 100))
+# Largest page /results/{id} serves in one response.
+RESULT_MAX_PAGE_SIZE = int(os.getenv("RESULT_MAX_PAGE_SIZE", 5000))
+# A result is dropped this long after it was last read.
+RESULT_TTL_SECONDS = float(os.getenv("RESULT_TTL_SECONDS", 900.0))
+# JSON-encoded bytes of results kept in memory; least recently used results beyond it are spilled to disk.
+RESULT_MEMORY_BUDGET_BYTES = int(os.getenv("RESULT_MEMORY_BUDGET_BYTES", 256 * 1024 * 1024))
+# Bytes of spilled results kept on disk; the least recently used are dropped beyond it.
+RESULT_DISK_BUDGET_BYTES = int(os.getenv("RESULT_DISK_BUDGET_BYTES", 2 * 1024 * 1024 * 1024))
+# Parent directory for spill files (the system temp directory when unset). Each process uses its own subdirectory.
+RESULT_SPILL_DIR = os.getenv("RESULT_SPILL_DIR") or None
+
+# --- Metrics ---
+RESULT_STORE_EVENTS = REGISTRY.counter(
+    "result_store_events_total", "Result store events (stored / spilled / reloaded / expired / evicted / miss).",
+    ("event",))
+
+class ResultNotFound(KeyError):
+    """The result id is unknown, or its result expired or was evicted."""
+
+class StoredResult:
+    """One query result: its column arrays in memory, or the spill file they were written to."""
+    def __init__(self, result_id: str, columns: List[str], data: List[List[Any]], total_rows: int,
+                 size_bytes: int):
+        self.result_id = result_id
+        self.columns = columns
+        self.data: Optional[List[List[Any]]] = data
+        self.total_rows = total_rows
+        self.size_bytes = size_bytes
+        self.spill_path: Optional[str] = None
+        self.last_access = time.monotonic()
+
+    @property
+    def in_memory(self) -> bool:
+        return self.data is not None
+
+    def expires_in(self, ttl_seconds: float) -> float:
+        return max(0.0, self.last_access + ttl_seconds - time.monotonic())
+
+def _sort_key(values: List[Any]):
+    # Orders row indexes by one column's values. NULLs compare greater than any value, as in
+    # Postgres (last ascending, first descending); numbers and strings mixed in one column are
+    # grouped by type instead of raising.
+    def key(index: int) -> Tuple:
+        value = values[index]
+        if value is None:
+            return (1, False, 0)
+        return (0, isinstance(value, str), value)
+    return key
+
+class ResultStore:
+    """
+    Short-lived server-side store for SQL results, keyed by an unguessable result id.
+    Results are kept by column in their JSON form (Decimal as float, datetimes as ISO
+    strings), so a page reads the same whether served from memory or from a spill file,
+    and row dicts are only built for the rows of the page served. Results live
+    in an LRU within `memory_budget_bytes`; older ones are written to disk and read back
+    on access, and results unread for `ttl_seconds` are deleted.
+    """
+    def __init__(self, memory_budget_bytes: int = RESULT_MEMORY_BUDGET_BYTES,
+                 disk_budget_bytes: int = RESULT_DISK_BUDGET_BYTES,
+                 ttl_seconds: float = RESULT_TTL_SECONDS,
+                 spill_dir: Optional[str] = RESULT_SPILL_DIR):
+        self.memory_budget_bytes = memory_budget_bytes
+        self.disk_budget_bytes = disk_budget_bytes
+        self.ttl_seconds = ttl_seconds
+        self.spill_parent = spill_dir
+        self._spill_dir: Optional[str] = None
+        self._results: "OrderedDict[str, StoredResult]" = OrderedDict()
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+        self._lock = asyncio.Lock()
+        self.stored_gauge = REGISTRY.gauge(
+            "result_store_bytes", "JSON-encoded bytes of stored results, by tier (memory / disk).", ("tier",),
+            callback=lambda: {("memory",): float(self.memory_bytes), ("disk",): float(self.disk_bytes)})
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    # --- Spill files (blocking calls, run in a worker thread) ---
+    def _spill_path(self, result_id: str) -> str:
+        if self._spill_dir is None:
+            if self.spill_parent:
+                os.makedirs(self.spill_parent, exist_ok=True)
+            self._spill_dir = tempfile.mkdtemp(prefix="agent-results-", dir=self.spill_parent)
+        return os.path.join(self._spill_dir, f"{result_id}.json")
+
+    @staticmethod
+    def _write_file(path: str, body: bytes):
+        with open(path, "wb") as f:
+            f.write(body)
+
+    @staticmethod
+    def _read_file(path: str) -> List[List[Any]]:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+
+    @staticmethod
+    def _remove_file(path: Optional[str]):
+        if path:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    # --- Bookkeeping (call with the lock held) ---
+    def _drop(self, entry: StoredResult, event: str) -> Optional[str]:
+        """Forgets `entry`; returns its spill file for the caller to delete outside the lock."""
+        self._results.pop(entry.result_id, None)
+        if entry.in_memory:
+            self.memory_bytes -= entry.size_bytes
+        if entry.spill_path:
+            self.disk_bytes -= entry.size_bytes
+        RESULT_STORE_EVENTS.inc(event=event)
+        return entry.spill_path
+
+    def _expire(self) -> List[str]:
+        expired = [entry for entry in self._results.values() if entry.expires_in(self.ttl_seconds) == 0.0]
+        return [path for path in (self._drop(entry, "expired") for entry in expired) if path]
+
+    def _select_spills(self, keep: str) -> List[StoredResult]:
+        """In-memory results (oldest first, never `keep`) to move to disk to get within the memory budget."""
+        excess = self.memory_bytes - self.memory_budget_bytes
+        victims = []
+        for entry in self._results.values():
+            if excess <= 0:
+                break
+            if entry.in_memory and entry.result_id != keep:
+                victims.append(entry)
+                excess -= entry.size_bytes
+        return victims
+
+    async def _enforce_budgets(self, keep: str):
+        victims = self._select_spills(keep)
+        for entry in victims:
+            # Spilled results are immutable, so a file written earlier is still valid.
+            if entry.spill_path is None:
+                path = self._spill_path(entry.result_id)
+                await asyncio.to_thread(self._write_file, path, dumps(entry.data))
+                entry.spill_path = path
+                self.disk_bytes += entry.size_bytes
+            entry.data = None
+            self.memory_bytes -= entry.size_bytes
+            RESULT_STORE_EVENTS.inc(event="spilled")
+
+        stale_files = []
+        for entry in list(self._results.values()):
+            if self.disk_bytes <= self.disk_budget_bytes:
+                break
+            if not entry.in_memory and entry.result_id != keep:
+                stale_files.append(self._drop(entry, "evicted"))
+        for path in stale_files:
+            await asyncio.to_thread(self._remove_file, path)
+
+    # --- Public API ---
+    async def put(self, result: ResultSet) -> StoredResult:
+        """Stores `result` and returns the entry holding its new result id."""
+        body = dumps(result.data)
+        entry = StoredResult(secrets.token_urlsafe(16), list(result.columns), orjson.loads(body), len(result),
+                             len(body))
+        async with self._lock:
+            stale_files = self._expire()
+            self._results[entry.result_id] = entry
+            self.memory_bytes += entry.size_bytes
+            RESULT_STORE_EVENTS.inc(event="stored")
+            await self._enforce_budgets(keep=entry.result_id)
+        for path in stale_files:
+            await asyncio.to_thread(self._remove_file, path)
+        return entry
+
+    async def get(self, result_id: str) -> Tuple[StoredResult, List[List[Any]]]:
+        """The entry for `result_id` and its column arrays (read back from disk if spilled); raises ResultNotFound."""
+        async with self._lock:
+            stale_files = self._expire()
+            entry = self._results.get(result_id)
+            data = None
+            if entry is None:
+                RESULT_STORE_EVENTS.inc(event="miss")
+            else:
+                entry.last_access = time.monotonic()
+                self._results.move_to_end(result_id)
+                if not entry.in_memory:
+                    entry.data = await asyncio.to_thread(self._read_file, entry.spill_path)
+                    self.memory_bytes += entry.size_bytes
+                    RESULT_STORE_EVENTS.inc(event="reloaded")
+                    await self._enforce_budgets(keep=result_id)
+                # Held by the caller even if a later put() spills the entry again.
+                data = entry.data
+        for path in stale_files:
+            await asyncio.to_thread(self._remove_file, path)
+        if entry is None:
+            raise ResultNotFound(result_id)
+        return entry, data
+
+    async def page(self, result_id: str, offset: int = 0, limit: int = RESULT_PAGE_SIZE,
+                   columns: Optional[List[str]] = None, sort: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        One page of a stored result. `columns` selects and orders the returned columns;
+        `sort` lists columns to order by, each prefixed with '-' for descending.
+        Unknown columns raise ValueError; an unknown or expired id raises ResultNotFound.
+        """
+        entry, data = await self.get(result_id)
+        selected = columns or entry.columns
+        unknown = [column for column in selected + [key.lstrip("-") for key in sort or []]
+                   if column not in entry.columns]
+        if unknown:
+            raise ValueError(f"Unknown column(s) {unknown}; the result has {entry.columns}.")
+        selected_data = [data[entry.columns.index(column)] for column in selected]
+
+        if sort:
+            order = list(range(entry.total_rows))
+            # Stable sorts from the last key to the first give a multi-column order.
+            for key in reversed(sort):
+                try:
+                    order.sort(key=_sort_key(data[entry.columns.index(key.lstrip("-"))]), reverse=key.startswith("-"))
+                except TypeError:
+                    raise ValueError(f"Column '{key.lstrip('-')}' holds values that cannot be ordered.")
+            page_rows = [
+                {column: values[index] for column, values in zip(selected, selected_data)}
+                for index in order[offset:offset + limit]
+            ]
+        else:
+            page_rows = [
+                dict(zip(selected, row))
+                for row in zip(*(values[offset:offset + limit] for values in selected_data))
+            ]
+        return {
+            "result_id": entry.result_id,
+            "total_rows": entry.total_rows,
+            "columns": selected,
+            "offset": offset,
+            "limit": limit,
+            "rows": page_rows,
+            "expires_in_seconds": round(entry.expires_in(self.ttl_seconds), 1),
+        }
+
+    async def close(self):
+        """Drops every result and deletes this process's spill directory."""
+        async with self._lock:
+            self._results.clear()
+            self.memory_bytes = self.disk_bytes = 0
+            spill_dir, self._spill_dir = self._spill_dir, None
+        if spill_dir:
+            await asyncio.to_thread(shutil.rmtree, spill_dir, True)
+
+result_store = ResultStore()
@@ -0,0 +1,343 @@
+# src/utils/schema_graph.py
+
+import re
+import logging
+import threading
+from collections import deque
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from utils.tokens import estimate_tokens
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Columns of the schema DataFrame (see database/Schema_full.py) that define a snapshot.
+SNAPSHOT_COLUMNS = ['TABLE_NAME', 'COLUMN_NAME', 'DATA_TYPE', 'COLUMN_KEY', 'REFERENCED_TABLE_NAME', 'REFERENCED_COLUMN_NAME']
+
+class ForeignKeyEdge:
+    """One FK relationship: from_table.from_column REFERENCES to_table.to_column."""
+    __slots__ = ("from_table", "from_column", "to_table", "to_column")
+
+    def __init__(self, from_table: str, from_column: str, to_table: str, to_column: str):
+        self.from_table = from_table
+        self.from_column = from_column
+        self.to_table = to_table
+        self.to_column = to_column
+
+    def __repr__(self) -> str:
+        return f"{self.from_table}.{self.from_column} -> {self.to_table}.{self.to_column}"
+
+# Minimum similarity for a column-name part to count as a fuzzy match of a question word.
+FUZZY_MATCH_THRESHOLD = 0.85
+
+def _stem(word: str) -> str:
+    """Very light singularisation so 'leads'/'lead' and 'statuses'/'status' match."""
+    if len(word) > 4 and word.endswith("es") and word[:-2].endswith(("s", "x", "ch", "sh")):
+        return word[:-2]
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+def question_terms(question: str) -> Set[str]:
+    """Lower-cased, lightly stemmed words of the question used to score column names."""
+    return {_stem(word) for word in re.findall(r"[a-z0-9]+", question.lower()) if len(word) > 1}
+
+def column_name_score(column_name: str, terms: Set[str]) -> float:
+    """Share of a column name's parts (split on '_') that match a question word, exactly or fuzzily."""
+    parts = [_stem(part) for part in column_name.lower().split("_") if part]
+    if not parts or not terms:
+        return 0.0
+    score = 0.0
+    for part in parts:
+        if part in terms:
+            score += 1.0
+            continue
+        best = max(SequenceMatcher(None, part, term).ratio() for term in terms)
+        if best >= FUZZY_MATCH_THRESHOLD:
+            score += best * 0.8
+    return score / len(parts)
+
+def parse_router_columns(relevant_columns: List[str]) -> List[Tuple[Optional[str], str]]:
+    """Router column hints ('table.column', 'column' or 'column name') as (TABLE or None, COLUMN)."""
+    parsed = []
+    for hint in relevant_columns or []:
+        hint = str(hint).strip().upper()
+        if not hint:
+            continue
+        table, _, column = hint.rpartition(".")
+        parsed.append((table or None, re.sub(r"\s+", "_", column)))
+    return parsed
+
+# A schema selection maps table name -> the columns to include (None = all columns).
+SchemaSelection = Dict[str, Optional[List[str]]]
+
+class SchemaGraph:
+    """
+    Index over one schema snapshot (the DataFrame from fetch_full_schema_dataframe):
+    per-table column rows for O(1) lookup, an undirected FK adjacency graph used to
+    find the tables needed to join a set of selected tables, and the prompt text for
+    every table precomputed so formatting a prompt is plain string concatenation.
+    """
+    def __init__(self, full_schema_df: pd.DataFrame, fingerprint: Optional[int] = None):
+        self.fingerprint = fingerprint if fingerprint is not None else schema_fingerprint(full_schema_df)
+        self.columns_by_table: Dict[str, pd.DataFrame] = {}
+        self.primary_keys: Dict[str, List[str]] = {}
+        # table -> neighbour table -> FK edges between the two (either direction)
+        self.adjacency: Dict[str, Dict[str, List[ForeignKeyEdge]]] = {}
+        # --- Precomputed prompt fragments ---
+        # table -> column name -> "COLUMN (data_type, KEY)", in column-name order
+        self.column_details: Dict[str, Dict[str, str]] = {}
+        # table -> the full "Table: ...\nColumns: ..." block
+        self.table_headers: Dict[str, str] = {}
+        # table -> [(from_column, referenced_table, "  FOREIGN KEY (...) REFERENCES ...")]
+        self.relationship_lines: Dict[str, List[Tuple[str, str, str]]] = {}
+
+        if full_schema_df.empty:
+            return
+
+        for table_name, table_df in full_schema_df.groupby('TABLE_NAME', sort=False):
+            table_df = table_df.drop_duplicates().reset_index(drop=True)
+            self.columns_by_table[table_name] = table_df
+            self.primary_keys[table_name] = table_df.loc[table_df['COLUMN_KEY'] == 'PRI', 'COLUMN_NAME'].unique().tolist()
+            self.adjacency.setdefault(table_name, {})
+            self._build_fragments(table_name, table_df)
+
+        fk_rows = full_schema_df[full_schema_df['REFERENCED_TABLE_NAME'].fillna('') != '']
+        fk_rows = fk_rows.drop_duplicates(subset=['TABLE_NAME', 'COLUMN_NAME', 'REFERENCED_TABLE_NAME', 'REFERENCED_COLUMN_NAME'])
+        for from_table, from_column, to_table, to_column in fk_rows[
+            ['TABLE_NAME', 'COLUMN_NAME', 'REFERENCED_TABLE_NAME', 'REFERENCED_COLUMN_NAME']
+        ].itertuples(index=False):
+            if from_table == to_table or to_table not in self.columns_by_table:
+                continue
+            edge = ForeignKeyEdge(from_table, from_column, to_table, to_column)
+            self.adjacency[from_table].setdefault(to_table, []).append(edge)
+            self.adjacency[to_table].setdefault(from_table, []).append(edge)
+
+        edge_count = sum(len(edges) for neighbours in self.adjacency.values() for edges in neighbours.values()) // 2
+        logging.info(f"SchemaGraph: indexed {len(self.columns_by_table)} tables and {edge_count} FK relationships.")
+
+    def _build_fragments(self, table_name: str, table_df: pd.DataFrame):
+        """Precomputes the Table/Columns/Relationships text for one table."""
+        details: Dict[str, str] = {}
+        for column_name, data_type, column_key in table_df.sort_values('COLUMN_NAME')[
+            ['COLUMN_NAME', 'DATA_TYPE', 'COLUMN_KEY']
+        ].itertuples(index=False):
+            if column_name not in details:
+                details[column_name] = f"{column_name} ({data_type}, {column_key})" if column_key else f"{column_name} ({data_type})"
+        self.column_details[table_name] = details
+        self.table_headers[table_name] = f"Table: {table_name}\nColumns: {', '.join(details.values())}"
+
+        fk_rows = table_df[(table_df['COLUMN_KEY'] == 'MUL') & (table_df['REFERENCED_TABLE_NAME'].fillna('') != '')
+                           & (table_df['REFERENCED_COLUMN_NAME'].fillna('') != '')]
+        fk_rows = fk_rows.drop_duplicates(subset=['COLUMN_NAME', 'REFERENCED_TABLE_NAME', 'REFERENCED_COLUMN_NAME'])
+        self.relationship_lines[table_name] = [
+            (column_name, referenced_table,
+             f"  FOREIGN KEY ({column_name}) REFERENCES {referenced_table}({referenced_column})")
+            for column_name, referenced_table, referenced_column in fk_rows[
+                ['COLUMN_NAME', 'REFERENCED_TABLE_NAME', 'REFERENCED_COLUMN_NAME']
+            ].itertuples(index=False)
+        ]
+
+    def has_table(self, table_name: str) -> bool:
+        return table_name in self.columns_by_table
+
+    def _nearest_from(self, sources: Set[str], targets: Set[str]) -> Optional[List[str]]:
+        """Multi-source BFS: shortest table path from any of `sources` to the closest of `targets`."""
+        parents: Dict[str, Optional[str]] = {source: None for source in sources}
+        queue = deque(sorted(sources))
+        while queue:
+            table = queue.popleft()
+            if table in targets:
+                path = [table]
+                while parents[path[-1]] is not None:
+                    path.append(parents[path[-1]])
+                return list(reversed(path))
+            for neighbour in sorted(self.adjacency.get(table, {})):
+                if neighbour not in parents:
+                    parents[neighbour] = table
+                    queue.append(neighbour)
+        return None
+
+    def connecting_subgraph(self, tables: List[str]) -> Tuple[Set[str], List[ForeignKeyEdge]]:
+        """
+        Approximate minimal (Steiner-tree style) set of tables connecting `tables` through FKs.
+        Grows a tree from the first table, repeatedly attaching the nearest remaining selected
+        table along its shortest path. Tables with no FK path to the tree are kept on their own.
+
+        Returns:
+            (tables in the subgraph, FK edges used to join them)
+        """
+        terminals = [table for table in dict.fromkeys(tables) if self.has_table(table)]
+        if not terminals:
+            return set(), []
+
+        tree: Set[str] = set()
+        join_edges: List[ForeignKeyEdge] = []
+        remaining = set(terminals)
+        while remaining:
+            if not tree:
+                start = next(table for table in terminals if table in remaining)
+                tree.add(start)
+                remaining.discard(start)
+                continue
+            path = self._nearest_from(tree, remaining)
+            if path is None:
+                # The rest are unreachable from the current tree; start a new component.
+                start = next(table for table in terminals if table in remaining)
+                tree.add(start)
+                remaining.discard(start)
+                continue
+            for left, right in zip(path, path[1:]):
+                join_edges.extend(self.adjacency[left][right])
+            tree.update(path)
+            remaining.difference_update(path)
+        return tree, join_edges
+
+    def select_schema(self, tables: List[str]) -> SchemaSelection:
+        """
+        Selection for a query over `tables`: every column of the selected tables that exist,
+        plus the bridging tables on the FK join paths between them with only their PKs and
+        join columns.
+        """
+        selected_tables = [table for table in dict.fromkeys(tables) if self.has_table(table)]
+        if not selected_tables:
+            return {}
+        tables_in_scope, join_edges = self.connecting_subgraph(selected_tables)
+
+        join_columns_by_table: Dict[str, Set[str]] = {}
+        for edge in join_edges:
+            join_columns_by_table.setdefault(edge.from_table, set()).add(edge.from_column)
+            join_columns_by_table.setdefault(edge.to_table, set()).add(edge.to_column)
+
+        selection: SchemaSelection = {table: None for table in selected_tables}
+        for table in sorted(tables_in_scope - set(selected_tables)):
+            needed_columns = join_columns_by_table.get(table, set()) | set(self.primary_keys.get(table, []))
+            selection[table] = [column for column in self.column_details[table] if column in needed_columns]
+        return selection
+
+    def format_schema(self, selection: SchemaSelection) -> str:
+        """
+        Builds the schema context for the SQL prompt from the cached fragments. Tables whose
+        selection is a column list get a Columns line (and relationships) for those columns only.
+        Relationships are limited to tables in the selection, i.e. the usable join paths.
+        """
+        blocks = []
+        for table_name in sorted(selection):
+            if table_name not in self.table_headers:
+                continue
+            columns = selection[table_name]
+            if columns is None:
+                block = [self.table_headers[table_name]]
+            else:
+                details = self.column_details[table_name]
+                wanted = set(columns)
+                block = [f"Table: {table_name}",
+                         f"Columns: {', '.join(detail for column, detail in details.items() if column in wanted)}"]
+
+            fk_lines = [
+                line for column_name, referenced_table, line in self.relationship_lines[table_name]
+                if referenced_table in selection and (columns is None or column_name in columns)
+            ]
+            if fk_lines:
+                block.append("Relationships (from this table):")
+                block.extend(fk_lines)
+            blocks.append("\n".join(block))
+        return "\n\n".join(blocks)
+
+    def prune_selection(self, selection: SchemaSelection, question: str, relevant_columns: List[str],
+                        token_budget: int, min_columns_per_table: int = 0) -> SchemaSelection:
+        """
+        Narrows every full table in `selection` to the columns the query is likely to need:
+        - always: PKs, FK columns joining tables in the selection, and the router's columns;
+        - then, per table, the best-scoring columns until it has `min_columns_per_table`;
+        - then the remaining columns that match the question by name, best first, while the
+          formatted schema stays within `token_budget` (estimated tokens).
+        Tables that already carry a column list (e.g. bridging tables) are left unchanged.
+        """
+        terms = question_terms(question)
+        router_columns = parse_router_columns(relevant_columns)
+        pruned: SchemaSelection = {}
+        candidates: List[Tuple[float, str, str]] = []
+
+        for table_name, columns in selection.items():
+            if columns is not None or table_name not in self.column_details:
+                pruned[table_name] = columns
+                continue
+            required = set(self.primary_keys.get(table_name, []))
+            for neighbour, edges in self.adjacency.get(table_name, {}).items():
+                if neighbour in selection:
+                    for edge in edges:
+                        required.add(edge.from_column if edge.from_table == table_name else edge.to_column)
+            required.update(column for table, column in router_columns if table in (None, table_name))
+
+            details = self.column_details[table_name]
+            pruned[table_name] = [column for column in details if column in required]
+            table_candidates = sorted(
+                ((column_name_score(column, terms), table_name, column) for column in details if column not in required),
+                key=lambda candidate: -candidate[0]
+            )
+            # Keep a minimum of context per table even when few names match the question.
+            shortfall = max(0, min_columns_per_table - len(pruned[table_name]))
+            pruned[table_name].extend(column for _, _, column in table_candidates[:shortfall])
+            candidates.extend(candidate for candidate in table_candidates[shortfall:] if candidate[0] > 0)
+
+        used_tokens = estimate_tokens(self.format_schema(pruned))
+        for _, table_name, column in sorted(candidates, key=lambda candidate: -candidate[0]):
+            cost = estimate_tokens(self.column_details[table_name][column] + ", ")
+            if used_tokens + cost > token_budget:
+                continue
+            pruned[table_name].append(column)
+            used_tokens += cost
+
+        # Restore schema column order within each table.
+        return {
+            table_name: columns if columns is None else [c for c in self.column_details.get(table_name, {}) if c in set(columns)]
+            for table_name, columns in pruned.items()
+        }
+
+    def referencing_tables(self, table_names: Set[str]) -> Set[str]:
+        """Tables with a foreign key into any of `table_names` (their FK rows depend on those tables)."""
+        return {
+            edge.from_table
+            for table_name in table_names
+            for edges in self.adjacency.get(table_name, {}).values()
+            for edge in edges if edge.to_table == table_name
+        }
+
+def schema_fingerprint(full_schema_df: pd.DataFrame) -> int:
+    """Cheap content hash of a schema DataFrame, used to detect a new snapshot."""
+    if full_schema_df.empty:
+        return 0
+    columns = [column for column in SNAPSHOT_COLUMNS if column in full_schema_df.columns]
+    return int(pd.util.hash_pandas_object(full_schema_df[columns], index=False).sum())
+
+def merge_schema_tables(full_schema_df: pd.DataFrame, table_names: Set[str], tables_df: pd.DataFrame,
+                        live_table_names: Optional[Set[str]] = None) -> pd.DataFrame:
+    """
+    Returns a new snapshot with the rows of `table_names` replaced by the freshly introspected
+    `tables_df` (tables missing from it were dropped). If `live_table_names` is given, tables
+    no longer in the database (e.g. renamed) are dropped as well. Rows stay ordered by table.
+    """
+    keep = ~full_schema_df['TABLE_NAME'].isin(table_names)
+    if live_table_names is not None:
+        keep &= full_schema_df['TABLE_NAME'].isin(live_table_names)
+    frames = [full_schema_df[keep]]
+    if not tables_df.empty:
+        frames.append(tables_df)
+    merged = pd.concat(frames, ignore_index=True)
+    return merged.sort_values('TABLE_NAME', key=lambda names: names.str.lower(), kind='stable').reset_index(drop=True)
+
+# --- Snapshot cache ---
+_cached_graph: Optional[SchemaGraph] = None
+_cache_lock = threading.Lock()
+
+def get_schema_graph(full_schema_df: pd.DataFrame) -> SchemaGraph:
+    """Returns the SchemaGraph for this snapshot, rebuilding it only when the schema has changed."""
+    global _cached_graph
+    fingerprint = schema_fingerprint(full_schema_df)
+    with _cache_lock:
+        if _cached_graph is None or _cached_graph.fingerprint != fingerprint:
+            _cached_graph = SchemaGraph(full_schema_df, fingerprint)
+        return _cached_graph
@@ -0,0 +1,218 @@
+# src/utils/schema_map_store.py
+
+import os
+import ast
+import json
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Callable
+
+import pandas as pd
+
+from database.db_connector import DatabaseConnector
+from database.Schema_full import fetch_full_schema_dataframe
+
+# Set up basic logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# --- Configuration ---
+# Version of the on-disk format below; bump it when the layout changes.
+SCHEMA_MAP_FORMAT_VERSION = 1
+SCHEMA_MAP_JSON_PATH = os.getenv(
+    "SCHEMA_MAP_JSON_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '../database/schema_map.json')
+)
+# The generated Python module used before the JSON store; read once to migrate curated data.
+LEGACY_SCHEMA_MAP_PY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../database/Schema_map.py')
+
+# Signature of change listeners: called with the new map after every swap.
+SchemaMapListener = Callable[[Dict[str, Any]], None]
+
+def load_legacy_schema_map(path: str = LEGACY_SCHEMA_MAP_PY_PATH) -> Dict[str, Any]:
+    """
+    Parses SCHEMA_MAP out of the old generated Schema_map.py without importing it.
+    Accepts both 'SCHEMA_MAP = {' and the 'SCHEMA_MAP = \\' + newline form the old writer produced.
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    marker = content.find("SCHEMA_MAP =")
+    if marker == -1:
+        logging.warning(f"SchemaMapStore: no SCHEMA_MAP assignment found in {path}.")
+        return {}
+    literal = content[marker + len("SCHEMA_MAP ="):].lstrip().lstrip("\\").strip()
+    try:
+        return ast.literal_eval(literal)
+    except (ValueError, SyntaxError) as e:
+        logging.error(f"SchemaMapStore: could not parse legacy SCHEMA_MAP in {path}: {e}")
+        return {}
+
+def live_tables_from_schema_df(full_schema_df: pd.DataFrame) -> Dict[str, List[str]]:
+    """Table name -> column names (catalog order, de-duplicated) from the full schema DataFrame."""
+    if full_schema_df.empty:
+        return {}
+    return {
+        table_name: table_df['COLUMN_NAME'].drop_duplicates().tolist()
+        for table_name, table_df in full_schema_df.groupby('TABLE_NAME', sort=False)
+    }
+
+class SchemaMapDiff:
+    """Table-level difference between the stored map and the live catalog."""
+    def __init__(self, added: Dict[str, List[str]], removed: List[str], changed: Dict[str, List[str]]):
+        self.added = added        # new table -> columns
+        self.removed = removed    # tables no longer in the catalog
+        self.changed = changed    # table -> new column list
+
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    def __repr__(self) -> str:
+        return (f"SchemaMapDiff(added={sorted(self.added)}, removed={sorted(self.removed)}, "
+                f"changed={sorted(self.changed)})")
+
+class SchemaMapStore:
+    """
+    The SQL router's schema map (conceptual key -> {"table", "columns", "synonyms", ...}),
+    persisted as versioned JSON. Refreshes diff the map against the live catalog table by
+    table and apply only the changes; curated fields (synonyms, status options, special
+    cases without a "table") are never touched. Each refresh builds a new dict and swaps
+    it in with a single assignment, so readers always see a complete map and published
+    maps are never mutated.
+    """
+    def __init__(self, path: str = SCHEMA_MAP_JSON_PATH, legacy_path: str = LEGACY_SCHEMA_MAP_PY_PATH):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.revision = 0
+        self._current: Dict[str, Any] = {}
+        self._loaded = False
+        self._listeners: List[SchemaMapListener] = []
+        self._refresh_lock = asyncio.Lock()
+
+    @property
+    def current(self) -> Dict[str, Any]:
+        """The current map. Treat it as read-only; it is replaced, never modified, on refresh."""
+        if not self._loaded:
+            self.load()
+        return self._current
+
+    def subscribe(self, listener: SchemaMapListener):
+        """Registers a callback invoked with the new map after every swap (once per listener)."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    # --- Persistence ---
+    def load(self) -> Dict[str, Any]:
+        """Loads the JSON store, migrating from the legacy Schema_map.py the first time."""
+        schema_map: Dict[str, Any] = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    payload = json.load(f)
+                if payload.get("format_version") != SCHEMA_MAP_FORMAT_VERSION:
+                    logging.error(f"SchemaMapStore: unsupported format_version {payload.get('format_version')} in {self.path}.")
+                else:
+                    schema_map = payload.get("schema_map", {})
+                    self.revision = payload.get("revision", 0)
+            except (OSError, ValueError) as e:
+                logging.error(f"SchemaMapStore: failed to read {self.path}: {e}")
+        if not schema_map:
+            schema_map = load_legacy_schema_map(self.legacy_path)
+            if schema_map:
+                logging.info(f"SchemaMapStore: migrated {len(schema_map)} entries from {self.legacy_path}.")
+        self._current = schema_map
+        self._loaded = True
+        return schema_map
+
+    def _write(self, schema_map: Dict[str, Any]):
+        """Writes the store atomically (temp file + rename)."""
+        payload = {
+            "format_version": SCHEMA_MAP_FORMAT_VERSION,
+            "revision": self.revision,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "schema_map": schema_map,
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    # --- Diff / apply ---
+    def diff(self, live_tables: Dict[str, List[str]]) -> SchemaMapDiff:
+        """Compares the stored table entries with the live catalog."""
+        stored_tables: Dict[str, List[str]] = {}
+        for value in self.current.values():
+            if isinstance(value, dict) and isinstance(value.get("table"), str):
+                stored_tables.setdefault(value["table"], value.get("columns", []))
+        added = {table: columns for table, columns in live_tables.items() if table not in stored_tables}
+        removed = [table for table in stored_tables if table not in live_tables]
+        changed = {
+            table: live_tables[table] for table, columns in stored_tables.items()
+            if table in live_tables and list(columns) != live_tables[table]
+        }
+        return SchemaMapDiff(added, removed, changed)
+
+    def apply_diff(self, diff: SchemaMapDiff) -> Dict[str, Any]:
+        """Returns a new map with `diff` applied; untouched entries are shared with the current map."""
+        updated_schema_map: Dict[str, Any] = {}
+        removed = set(diff.removed)
+        for key, value in self.current.items():
+            table_name = value.get("table") if isinstance(value, dict) else None
+            if not isinstance(table_name, str):
+                # Special cases like 'revenue' and 'location' have no single table; keep as-is.
+                updated_schema_map[key] = value
+            elif table_name in removed:
+                logging.warning(f"SchemaMapStore: table '{table_name}' (conceptual key '{key}') no longer exists. Removing entry.")
+            elif table_name in diff.changed:
+                updated_entry = dict(value)  # keeps synonyms and other curated fields
+                updated_entry["columns"] = diff.changed[table_name]
+                updated_schema_map[key] = updated_entry
+            else:
+                updated_schema_map[key] = value
+        for table_name, columns in diff.added.items():
+            logging.info(f"SchemaMapStore: new table '{table_name}' found in database. Adding a basic entry.")
+            updated_schema_map[table_name] = {"table": table_name, "columns": columns, "synonyms": []}
+        return updated_schema_map
+
+    def swap(self, schema_map: Dict[str, Any]):
+        """Publishes `schema_map` as the current map and notifies listeners."""
+        self._current = schema_map
+        self._loaded = True
+        for listener in list(self._listeners):
+            try:
+                listener(schema_map)
+            except Exception as e:
+                logging.error(f"SchemaMapStore: listener {listener} failed: {e}", exc_info=True)
+
+    async def refresh(self, db_connector: Optional[DatabaseConnector] = None,
+                      full_schema_df: Optional[pd.DataFrame] = None) -> SchemaMapDiff:
+        """
+        Syncs the map with the live catalog (from `full_schema_df` if given, else fetched with
+        `db_connector`). Writes and swaps only if something changed. An empty catalog (e.g. the
+        database is unreachable) leaves the map untouched.
+        """
+        async with self._refresh_lock:
+            if full_schema_df is None:
+                full_schema_df = await fetch_full_schema_dataframe(db_connector)
+            live_tables = live_tables_from_schema_df(full_schema_df)
+            if not live_tables:
+                logging.warning("SchemaMapStore: live schema is empty; keeping the current schema map.")
+                return SchemaMapDiff({}, [], {})
+
+            diff = self.diff(live_tables)
+            if diff.is_empty():
+                logging.info("SchemaMapStore: schema map is up to date with the database.")
+                if not os.path.exists(self.path):
+                    await asyncio.to_thread(self._write, self.current)
+                return diff
+
+            updated_schema_map = self.apply_diff(diff)
+            self.revision += 1
+            await asyncio.to_thread(self._write, updated_schema_map)
+            self.swap(updated_schema_map)
+            logging.info(f"SchemaMapStore: applied {diff} (revision {self.revision}).")
+            return diff
+
+schema_map_store = SchemaMapStore()
@@ -0,0 +1,212 @@
+# src/utils/schema_watcher.py
+
+import os
+import json
+import time
+import asyncio
+import logging
+from typing import List, Optional, Callable, Awaitable, Set
+
+import asyncpg
+
+from database.db_connector import DatabaseConnector
+from utils.metrics import SCHEMA_CHANGE_EVENTS, SCHEMA_REFRESH_DURATION, SCHEMA_WATCHER_LISTENING
+
+# Set up basic logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# --- Configuration ---
+SCHEMA_WATCH_ENABLED = os.getenv("SCHEMA_WATCH_ENABLED", "true").lower() in ("1", "true", "yes")
+# NOTIFY channel the DDL event trigger publishes on.
+SCHEMA_WATCH_CHANNEL = os.getenv("SCHEMA_WATCH_CHANNEL", "agent_schema_changed")
+# Notifications arriving within this window are refreshed together (a migration runs many statements).
+SCHEMA_WATCH_DEBOUNCE_SECONDS = float(os.getenv("SCHEMA_WATCH_DEBOUNCE_SECONDS", 1.0))
+# Delay before reconnecting after the LISTEN connection is lost.
+SCHEMA_WATCH_RECONNECT_SECONDS = float(os.getenv("SCHEMA_WATCH_RECONNECT_SECONDS", 5.0))
+# How often the idle LISTEN connection is pinged, so a silently dropped connection is noticed.
+SCHEMA_WATCH_KEEPALIVE_SECONDS = float(os.getenv("SCHEMA_WATCH_KEEPALIVE_SECONDS", 60.0))
+# Try to (re)create the event trigger on connect. Event triggers need a superuser; without one
+# the watcher still listens, and a DBA can apply SCHEMA_CHANGE_TRIGGER_SQL once by hand.
+SCHEMA_WATCH_INSTALL_TRIGGER = os.getenv("SCHEMA_WATCH_INSTALL_TRIGGER", "true").lower() in ("1", "true", "yes")
+
+# NOTIFY payloads are limited to 8000 bytes; beyond this the trigger asks for a full refresh.
+_MAX_PAYLOAD_BYTES = 7900
+
+# --- Event trigger ---
+# Publishes {"tag": <command tag>, "tables": [<table names>]} for DDL touching tables, views,
+# columns or constraints in the public schema, or {"tables": null} when the list does not fit.
+SCHEMA_CHANGE_TRIGGER_SQL = f"""
+CREATE OR REPLACE FUNCTION agent_notify_schema_change() RETURNS event_trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    obj record;
+    changed text[] := ARRAY[]::text[];
+    payload text;
+BEGIN
+    IF TG_EVENT = 'sql_drop' THEN
+        FOR obj IN SELECT * FROM pg_event_trigger_dropped_objects() LOOP
+            IF obj.object_type IN ('table', 'view', 'foreign table') AND obj.schema_name = 'public' THEN
+                changed := changed || obj.object_name;
+            ELSIF obj.object_type IN ('table column', 'table constraint') AND obj.address_names[1] = 'public' THEN
+                changed := changed || obj.address_names[2];
+            END IF;
+        END LOOP;
+    ELSE
+        FOR obj IN SELECT * FROM pg_event_trigger_ddl_commands() LOOP
+            IF obj.object_type IN ('table', 'view', 'foreign table', 'table column', 'table constraint')
+               AND obj.schema_name = 'public' AND obj.classid = 'pg_class'::regclass THEN
+                changed := changed || (SELECT relname::text FROM pg_class WHERE oid = obj.objid);
+            ELSIF obj.object_type = 'table constraint' AND obj.schema_name = 'public' THEN
+                changed := changed || (SELECT c.relname::text FROM pg_constraint k
+                                       JOIN pg_class c ON c.oid = k.conrelid WHERE k.oid = obj.objid);
+            END IF;
+        END LOOP;
+    END IF;
+
+    changed := ARRAY(SELECT DISTINCT name FROM unnest(changed) AS name WHERE name IS NOT NULL);
+    IF cardinality(changed) = 0 THEN
+        RETURN;
+    END IF;
+    payload := json_build_object('tag', TG_TAG, 'tables', changed)::text;
+    IF octet_length(payload) > {_MAX_PAYLOAD_BYTES} THEN
+        payload := json_build_object('tag', TG_TAG, 'tables', NULL)::text;
+    END IF;
+    PERFORM pg_notify('{SCHEMA_WATCH_CHANNEL}', payload);
+END;
+$$;
+
+DROP EVENT TRIGGER IF EXISTS agent_schema_change_ddl;
+CREATE EVENT TRIGGER agent_schema_change_ddl ON ddl_command_end
+    EXECUTE FUNCTION agent_notify_schema_change();
+
+DROP EVENT TRIGGER IF EXISTS agent_schema_change_drop;
+CREATE EVENT TRIGGER agent_schema_change_drop ON sql_drop
+    EXECUTE FUNCTION agent_notify_schema_change();
+"""
+
+# Called with the changed table names, or None when the whole schema must be re-read.
+SchemaChangeHandler = Callable[[Optional[List[str]]], Awaitable[None]]
+
+def parse_schema_change_payload(payload: str) -> Optional[List[str]]:
+    """Table names from a notification payload; None (full refresh) if it is missing or unreadable."""
+    try:
+        tables = json.loads(payload).get("tables")
+    except (ValueError, AttributeError):
+        logging.warning(f"SchemaWatcher: unreadable notification payload {payload!r}; refreshing the full schema.")
+        return None
+    if not isinstance(tables, list):
+        return None
+    return [str(name) for name in tables if name]
+
+class SchemaChangeWatcher:
+    """
+    Keeps one dedicated connection LISTENing on SCHEMA_WATCH_CHANNEL and hands the tables
+    named by DDL notifications to `on_change`, coalescing bursts within the debounce window.
+    After the connection drops, notifications may have been missed, so the first refresh
+    after reconnecting covers the whole schema.
+    """
+    def __init__(self, db_connector: DatabaseConnector, on_change: SchemaChangeHandler,
+                 on_listening: Optional[Callable[[bool], None]] = None,
+                 debounce_seconds: float = SCHEMA_WATCH_DEBOUNCE_SECONDS):
+        self.db_connector = db_connector
+        self.on_change = on_change
+        self.on_listening = on_listening
+        self.channel = SCHEMA_WATCH_CHANNEL
+        self.debounce_seconds = debounce_seconds
+        # Each item is a list of table names, or None for "refresh everything".
+        self._pending: asyncio.Queue = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+        self._trigger_checked = False
+
+    def start(self):
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._listen_loop()), asyncio.create_task(self._dispatch_loop())]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._set_listening(False)
+
+    def _set_listening(self, listening: bool):
+        SCHEMA_WATCHER_LISTENING.set(1 if listening else 0)
+        if self.on_listening is not None:
+            self.on_listening(listening)
+
+    # --- LISTEN connection ---
+    def _on_notification(self, connection, pid, channel, payload):
+        self._pending.put_nowait(parse_schema_change_payload(payload))
+
+    async def _install_trigger(self, conn: asyncpg.Connection):
+        if self._trigger_checked or not SCHEMA_WATCH_INSTALL_TRIGGER:
+            return
+        self._trigger_checked = True
+        try:
+            await conn.execute(SCHEMA_CHANGE_TRIGGER_SQL)
+            logging.info(f"SchemaWatcher: DDL event trigger installed (channel '{self.channel}').")
+        except asyncpg.InsufficientPrivilegeError:
+            logging.warning("SchemaWatcher: not allowed to create the DDL event trigger (superuser required). "
+                            "Listening anyway; apply SCHEMA_CHANGE_TRIGGER_SQL as a superuser to enable it.")
+        except Exception as e:
+            logging.error(f"SchemaWatcher: failed to install the DDL event trigger: {e}")
+
+    async def _listen_loop(self):
+        connected_before = False
+        while True:
+            conn = None
+            try:
+                conn = await self.db_connector.get_connection()
+                await self._install_trigger(conn)
+                lost = asyncio.get_running_loop().create_future()
+                conn.add_termination_listener(lambda _conn: lost.done() or lost.set_result(None))
+                await conn.add_listener(self.channel, self._on_notification)
+                self._set_listening(True)
+                logging.info(f"SchemaWatcher: listening for schema changes on '{self.channel}'.")
+                if connected_before:
+                    # Changes made while disconnected were not notified.
+                    self._pending.put_nowait(None)
+                connected_before = True
+                while not lost.done():
+                    try:
+                        await asyncio.wait_for(asyncio.shield(lost), SCHEMA_WATCH_KEEPALIVE_SECONDS)
+                    except asyncio.TimeoutError:
+                        await conn.execute("SELECT 1")
+                logging.warning("SchemaWatcher: LISTEN connection lost.")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error(f"SchemaWatcher: LISTEN connection failed: {e}")
+            finally:
+                self._set_listening(False)
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+            await asyncio.sleep(SCHEMA_WATCH_RECONNECT_SECONDS)
+
+    # --- Refresh dispatch ---
+    async def _dispatch_loop(self):
+        while True:
+            item = await self._pending.get()
+            full_refresh = item is None
+            tables: Set[str] = set(item or [])
+            # Collect the rest of the burst before refreshing once.
+            deadline = time.monotonic() + self.debounce_seconds
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    item = await asyncio.wait_for(self._pending.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                full_refresh = full_refresh or item is None
+                tables.update(item or [])
+
+            scope = "full" if full_refresh else "tables"
+            start = time.perf_counter()
+            try:
+                await self.on_change(None if full_refresh else sorted(tables))
+                SCHEMA_CHANGE_EVENTS.inc(scope=scope, status="ok")
+                logging.info(f"SchemaWatcher: schema refreshed ({'full' if full_refresh else sorted(tables)}).")
+            except Exception as e:
+                SCHEMA_CHANGE_EVENTS.inc(scope=scope, status="error")
+                logging.error(f"SchemaWatcher: schema refresh failed: {e}", exc_info=True)
+            finally:
+                SCHEMA_REFRESH_DURATION.observe(time.perf_counter() - start, scope=scope)
@@ -0,0 +1,207 @@
+# src/utils/session_store.py
+
+import os
+import json
+import time
+import asyncio
+import sqlite3
+import logging
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Callable, Awaitable
+
+from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
+
+from utils.tokens import estimate_tokens
+
+# Set up basic logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# --- Configuration ---
+# Number of sessions kept in memory before the least recently used one is evicted.
+SESSION_MAX_IN_MEMORY = int(os.getenv("SESSION_MAX_IN_MEMORY", 1000))
+# Approximate token budget for the conversation history included in a prompt.
+SESSION_HISTORY_TOKEN_BUDGET = int(os.getenv("SESSION_HISTORY_TOKEN_BUDGET", 2000))
+# Optional SQLite file for persisting sessions beyond the in-memory LRU (disabled when unset).
+SESSION_SQLITE_PATH = os.getenv("SESSION_SQLITE_PATH")
+
+# Signature of the summariser: (previous_summary, turns_to_fold_in) -> new_summary
+Summarizer = Callable[[str, List[Dict[str, str]]], Awaitable[str]]
+
+def split_history_by_budget(turns: List[Dict[str, str]], token_budget: int) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
+    """
+    Splits turns into (older, recent) where `recent` is the longest tail of the
+    conversation that fits within `token_budget`.
+    """
+    used = 0
+    split_index = len(turns)
+    for index in range(len(turns) - 1, -1, -1):
+        used += estimate_tokens(turns[index].get("content", ""))
+        if used > token_budget:
+            break
+        split_index = index
+    return turns[:split_index], turns[split_index:]
+
+def history_to_messages(turns: List[Dict[str, str]]) -> List[BaseMessage]:
+    """Converts dict-based chat history ({"role", "content"}) to LangChain's BaseMessage format."""
+    messages: List[BaseMessage] = []
+    for message in turns:
+        if message.get("role") == "user":
+            messages.append(HumanMessage(content=message.get("content")))
+        elif message.get("role") == "assistant":
+            messages.append(AIMessage(content=message.get("content")))
+    return messages
+
+def build_prompt_history(summary: str, turns: List[Dict[str, str]],
+                         token_budget: int = SESSION_HISTORY_TOKEN_BUDGET) -> List[BaseMessage]:
+    """
+    Builds the history passed to the agents: the rolling summary (if any) followed
+    by as many of the most recent turns as fit in the remaining token budget.
+    """
+    remaining_budget = token_budget - (estimate_tokens(summary) if summary else 0)
+    _, recent_turns = split_history_by_budget(turns, max(remaining_budget, 0))
+
+    messages: List[BaseMessage] = []
+    if summary:
+        messages.append(SystemMessage(content=f"Summary of the earlier conversation: {summary}"))
+    messages.extend(history_to_messages(recent_turns))
+    return messages
+
+class ConversationSession:
+    """A conversation's rolling summary plus the turns not yet folded into it."""
+    def __init__(self, session_id: str, summary: str = "", turns: Optional[List[Dict[str, str]]] = None):
+        self.session_id = session_id
+        self.summary = summary
+        self.turns: List[Dict[str, str]] = turns or []
+        self.lock = asyncio.Lock()
+        self.compacting = False
+
+    def to_json(self) -> str:
+        return json.dumps({"summary": self.summary, "turns": self.turns})
+
+    @classmethod
+    def from_json(cls, session_id: str, data: str) -> "ConversationSession":
+        payload = json.loads(data)
+        return cls(session_id, payload.get("summary", ""), payload.get("turns", []))
+
+class SessionStore:
+    """
+    Server-side conversation sessions keyed by session id.
+    Sessions live in an in-memory LRU; if `sqlite_path` is set they are also
+    written to SQLite so evicted or pre-restart sessions can be reloaded.
+    Once a session's turns exceed the token budget, the older turns are folded
+    into a rolling summary in the background using `summarizer`.
+    """
+    def __init__(self, max_sessions: int = SESSION_MAX_IN_MEMORY,
+                 token_budget: int = SESSION_HISTORY_TOKEN_BUDGET,
+                 sqlite_path: Optional[str] = SESSION_SQLITE_PATH,
+                 summarizer: Optional[Summarizer] = None):
+        self.max_sessions = max_sessions
+        self.token_budget = token_budget
+        self.sqlite_path = sqlite_path
+        self.summarizer = summarizer
+        self._sessions: "OrderedDict[str, ConversationSession]" = OrderedDict()
+        # Strong references to running summarisation tasks so they are not garbage collected.
+        self._background_tasks = set()
+        if self.sqlite_path:
+            self._init_sqlite()
+
+    def __len__(self) -> int:
+        """Number of sessions currently held in memory."""
+        return len(self._sessions)
+
+    # --- SQLite tier (blocking calls, run in a worker thread) ---
+    def _init_sqlite(self):
+        with sqlite3.connect(self.sqlite_path) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS chat_sessions ("
+                "session_id TEXT PRIMARY KEY, data TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+        logging.info(f"SessionStore: persisting sessions to SQLite at {self.sqlite_path}")
+
+    def _load_from_sqlite(self, session_id: str) -> Optional[str]:
+        with sqlite3.connect(self.sqlite_path) as conn:
+            row = conn.execute("SELECT data FROM chat_sessions WHERE session_id = ?", (session_id,)).fetchone()
+        return row[0] if row else None
+
+    def _save_to_sqlite(self, session_id: str, data: str):
+        with sqlite3.connect(self.sqlite_path) as conn:
+            conn.execute(
+                "INSERT INTO chat_sessions (session_id, data, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(session_id) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at",
+                (session_id, data, time.time())
+            )
+
+    async def _persist(self, session: ConversationSession):
+        if self.sqlite_path:
+            await asyncio.to_thread(self._save_to_sqlite, session.session_id, session.to_json())
+
+    # --- Public API ---
+    async def get_or_create(self, session_id: str) -> ConversationSession:
+        """Returns the session for `session_id`, loading it from SQLite or creating it if needed."""
+        session = self._sessions.get(session_id)
+        if session is not None:
+            self._sessions.move_to_end(session_id)
+            return session
+
+        data = await asyncio.to_thread(self._load_from_sqlite, session_id) if self.sqlite_path else None
+        # Another request may have loaded the same session while we were reading from disk.
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = ConversationSession.from_json(session_id, data) if data else ConversationSession(session_id)
+            self._sessions[session_id] = session
+            while len(self._sessions) > self.max_sessions:
+                evicted_id, _ = self._sessions.popitem(last=False)
+                logging.debug(f"SessionStore: evicted session '{evicted_id}' from memory.")
+        self._sessions.move_to_end(session_id)
+        return session
+
+    def prompt_history(self, session: ConversationSession) -> List[BaseMessage]:
+        """The token-budgeted history (summary + recent turns) to pass to the agents."""
+        return build_prompt_history(session.summary, session.turns, self.token_budget)
+
+    async def seed_if_empty(self, session: ConversationSession, turns: List[Dict[str, str]]):
+        """Starts a new session from the history the client sent; a session with history keeps its own."""
+        if not turns:
+            return
+        async with session.lock:
+            if not session.turns and not session.summary:
+                session.turns = list(turns)
+
+    async def append_turn(self, session: ConversationSession, user_content: str, assistant_content: str):
+        """Records a user/assistant exchange and schedules summarisation if the history is over budget."""
+        async with session.lock:
+            session.turns.extend([
+                {"role": "user", "content": user_content},
+                {"role": "assistant", "content": assistant_content},
+            ])
+            await self._persist(session)
+
+        total_tokens = sum(estimate_tokens(turn.get("content", "")) for turn in session.turns)
+        if self.summarizer and total_tokens > self.token_budget and not session.compacting:
+            session.compacting = True
+            task = asyncio.create_task(self._compact(session))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+    async def _compact(self, session: ConversationSession):
+        """Folds the older turns into the rolling summary, keeping recent turns within half the budget."""
+        try:
+            async with session.lock:
+                older_turns, _ = split_history_by_budget(session.turns, self.token_budget // 2)
+                if not older_turns:
+                    return
+                previous_summary = session.summary
+                turns_to_fold = len(older_turns)
+
+            # Summarise outside the lock so new turns can still be appended meanwhile.
+            new_summary = await self.summarizer(previous_summary, older_turns)
+
+            async with session.lock:
+                session.summary = new_summary
+                session.turns = session.turns[turns_to_fold:]
+                await self._persist(session)
+            logging.info(f"SessionStore: folded {turns_to_fold} turns of session '{session.session_id}' into its summary.")
+        except Exception as e:
+            logging.error(f"SessionStore: failed to summarise session '{session.session_id}': {e}", exc_info=True)
+        finally:
+            session.compacting = False
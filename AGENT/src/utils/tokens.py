@@ -0,0 +1,5 @@
+# src/utils/tokens.py
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token), good enough for budgeting prompts."""
+    return max(1, len(text or "") // 4)
@@ -0,0 +1,51 @@
+# tests/test_crm_agent_status.py
+"""
+Status mapping of CRM agent runs: how tool observations are classified and which
+CRMAgentResult status a run that ended with a final answer gets.
+
+Usage (from AGENT):
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+# No LLM is called here, so importing the agent module needs no service account key.
+os.environ.setdefault("SKIP_GCP_CREDENTIALS", "1")
+
+from agents.mcp_agent import CRMAgentResult, _classify_observation
+
+def status_of(observations, require_tools=False):
+    return CRMAgentResult.status_for([_classify_observation(o) for o in observations], require_tools)
+
+def test_no_tools_is_success_unless_tools_are_required():
+    assert status_of([]) == CRMAgentResult.SUCCESS
+    assert status_of([], require_tools=True) == CRMAgentResult.NO_DATA
+
+def test_all_empty_observations_are_no_data():
+    observations = ["None", "null", "", "[]", "{}", '{"results": {}, "errors": {}}']
+    assert [_classify_observation(o) for o in observations] == ["empty"] * len(observations)
+    assert status_of(observations) == CRMAgentResult.NO_DATA
+
+def test_all_error_observations_are_tool_error():
+    observations = ["{'error': 'Lead not found'}", '{"results": {}, "errors": {"42": "Lead not found"}}']
+    assert [_classify_observation(o) for o in observations] == ["error", "error"]
+    assert status_of(observations) == CRMAgentResult.TOOL_ERROR
+    assert status_of(["None"] + observations) == CRMAgentResult.TOOL_ERROR
+
+def test_partial_batch_results_count_as_data():
+    observation = "{'results': {'7': {'leadName': 'Acme'}}, 'errors': {'42': 'Lead not found'}}"
+    assert _classify_observation(observation) == "data"
+    assert status_of(["{'error': 'timeout'}", observation]) == CRMAgentResult.SUCCESS
+
+def test_batch_observation_as_a_dict():
+    assert _classify_observation({"results": {}, "errors": {"1": "boom"}}) == "error"
+    assert _classify_observation({"results": {"1": {}}, "errors": {}}) == "data"
+
+def test_plain_text_and_records_are_data():
+    assert _classify_observation("Lead 7 is assigned to Priya.") == "data"
+    assert _classify_observation('[{"id": 7}]') == "data"
+    assert _classify_observation('{"error": null, "id": 7}') == "data"
@@ -0,0 +1,139 @@
+-- Keyset-paginated variant of the lead grid for the CRM MCP server's list_sales_leads tool.
+-- Same filters as fn_get_sales_leads (zones, customer names, territories, statuses, scores,
+-- lead types) but pages with a (date_created, id) cursor instead of OFFSET, and only counts
+-- when asked to, using the planner's row estimate instead of a separate COUNT(*).
+-- date_created is nullable: leads without one sort as '-infinity', i.e. after all dated leads,
+-- and the same expression is used for the order, the keyset comparison and the index.
+-- Filters match case-insensitively; callers pass lower-cased filter values.
+
+-- Indexes backing the keyset scan and the most common filters
+CREATE INDEX IF NOT EXISTS idx_sales_lead_active_created_id
+    ON sales_lead((COALESCE(date_created, '-infinity'::TIMESTAMP)) DESC, id DESC) WHERE isactive = true;
+CREATE INDEX IF NOT EXISTS idx_sales_lead_lower_status ON sales_lead(LOWER(status)) WHERE isactive = true;
+CREATE INDEX IF NOT EXISTS idx_sales_lead_lower_score ON sales_lead(LOWER(score)) WHERE isactive = true;
+CREATE INDEX IF NOT EXISTS idx_sales_lead_lower_lead_type ON sales_lead(LOWER(lead_type)) WHERE isactive = true;
+CREATE INDEX IF NOT EXISTS idx_sales_lead_lower_area ON sales_lead(LOWER(area)) WHERE isactive = true;
+CREATE INDEX IF NOT EXISTS idx_sales_lead_lower_territory ON sales_lead(LOWER(territory)) WHERE isactive = true;
+
+DROP FUNCTION IF EXISTS fn_get_sales_leads_keyset;
+
+CREATE OR REPLACE FUNCTION fn_get_sales_leads_keyset(
+    p_zones TEXT[] DEFAULT NULL,
+    p_customer_names TEXT[] DEFAULT NULL,
+    p_territories TEXT[] DEFAULT NULL,
+    p_statuses TEXT[] DEFAULT NULL,
+    p_scores TEXT[] DEFAULT NULL,
+    p_lead_types TEXT[] DEFAULT NULL,
+    p_after_date_created TIMESTAMP DEFAULT NULL,
+    p_after_id INTEGER DEFAULT NULL,
+    p_page_size INTEGER DEFAULT 20,
+    p_include_count BOOLEAN DEFAULT FALSE
+)
+RETURNS TABLE (
+    approximate_total BIGINT,
+    id INTEGER,
+    lead_id VARCHAR,
+    customer_name VARCHAR,
+    lead_source VARCHAR,
+    status VARCHAR,
+    score VARCHAR,
+    lead_type VARCHAR,
+    qualification_status VARCHAR,
+    contact_name VARCHAR,
+    contact_mobile_no VARCHAR,
+    email VARCHAR,
+    territory VARCHAR,
+    area VARCHAR,
+    city VARCHAR,
+    district VARCHAR,
+    state VARCHAR,
+    date_created TIMESTAMP,
+    date_updated TIMESTAMP
+)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_where_clause TEXT := 'WHERE sl.isactive = true';
+    v_page_size INTEGER;
+    v_plan JSON;
+    v_approximate_total BIGINT := NULL;
+BEGIN
+    -- Default 20, max 100 plus the one look-ahead row callers fetch to know whether more pages follow
+    v_page_size := LEAST(GREATEST(COALESCE(p_page_size, 20), 1), 101);
+
+    -- Add filter conditions
+    IF p_zones IS NOT NULL AND array_length(p_zones, 1) > 0 THEN
+        v_where_clause := v_where_clause || ' AND LOWER(sl.area) = ANY($1)';
+    END IF;
+
+    IF p_customer_names IS NOT NULL AND array_length(p_customer_names, 1) > 0 THEN
+        v_where_clause := v_where_clause || ' AND LOWER(sl.customer_name) = ANY($2)';
+    END IF;
+
+    IF p_territories IS NOT NULL AND array_length(p_territories, 1) > 0 THEN
+        v_where_clause := v_where_clause || ' AND LOWER(sl.territory) = ANY($3)';
+    END IF;
+
+    IF p_statuses IS NOT NULL AND array_length(p_statuses, 1) > 0 THEN
+        v_where_clause := v_where_clause || ' AND LOWER(sl.status) = ANY($4)';
+    END IF;
+
+    IF p_scores IS NOT NULL AND array_length(p_scores, 1) > 0 THEN
+        v_where_clause := v_where_clause || ' AND LOWER(sl.score) = ANY($5)';
+    END IF;
+
+    IF p_lead_types IS NOT NULL AND array_length(p_lead_types, 1) > 0 THEN
+        v_where_clause := v_where_clause || ' AND LOWER(sl.lead_type) = ANY($6)';
+    END IF;
+
+    -- Approximate total from the planner's row estimate for the filtered scan (no COUNT(*))
+    IF p_include_count THEN
+        EXECUTE 'EXPLAIN (FORMAT JSON) SELECT 1 FROM sales_lead sl ' || v_where_clause
+        INTO v_plan
+        USING p_zones, p_customer_names, p_territories, p_statuses, p_scores, p_lead_types;
+        v_approximate_total := (v_plan -> 0 -> 'Plan' ->> 'Plan Rows')::BIGINT;
+    END IF;
+
+    -- Keyset condition: rows strictly after the last row of the previous page
+    -- (a NULL p_after_date_created with an id means that row had no date_created)
+    IF p_after_id IS NOT NULL THEN
+        v_where_clause := v_where_clause || ' AND (COALESCE(sl.date_created, ''-infinity''::TIMESTAMP), sl.id)'
+            || ' < (COALESCE($7, ''-infinity''::TIMESTAMP), $8)';
+    END IF;
+
+    RETURN QUERY EXECUTE
+    'SELECT
+        $9::BIGINT,
+        sl.id::INTEGER,
+        CAST(sl.lead_id AS VARCHAR),
+        CAST(sl.customer_name AS VARCHAR),
+        CAST(sl.lead_source AS VARCHAR),
+        CAST(sl.status AS VARCHAR),
+        CAST(sl.score AS VARCHAR),
+        CAST(sl.lead_type AS VARCHAR),
+        CAST(sl.qualification_status AS VARCHAR),
+        CAST(sl.contact_name AS VARCHAR),
+        CAST(sl.contact_mobile_no AS VARCHAR),
+        CAST(sl.email AS VARCHAR),
+        CAST(sl.territory AS VARCHAR),
+        CAST(sl.area AS VARCHAR),
+        CAST(sl.city AS VARCHAR),
+        CAST(sl.district AS VARCHAR),
+        CAST(sl.state AS VARCHAR),
+        CAST(sl.date_created AS TIMESTAMP),
+        CAST(sl.date_updated AS TIMESTAMP)
+    FROM sales_lead sl ' || v_where_clause || '
+    ORDER BY COALESCE(sl.date_created, ''-infinity''::TIMESTAMP) DESC, sl.id DESC
+    LIMIT ' || v_page_size
+    USING p_zones, p_customer_names, p_territories, p_statuses, p_scores, p_lead_types,
+          p_after_date_created, p_after_id, v_approximate_total;
+END;
+$$;
+
+-- Example usage (first page, then the next page from the last row's date_created and id):
+SELECT * FROM fn_get_sales_leads_keyset(
+    p_zones => ARRAY['south'],
+    p_scores => ARRAY['hot'],
+    p_page_size => 20,
+    p_include_count => true
+);
@@ -0,0 +1,160 @@
+import os
+import asyncio
+import re
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Dict, Any, Optional, List
+
+import asyncpg
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# --- Configuration ---
+# Direct database access for read-only CRM tools. These settings mirror the
+# ones used by the AGENT's db_connector so both services can share one .env.
+DB_HOST = os.getenv("DB_HOST", "localhost")
+DB_PORT = os.getenv("DB_PORT", "5432")
+DB_NAME = os.getenv("DB_NAME", "latestdb")
+DB_USER = os.getenv("DB_USER", "postgres")
+DB_PASSWORD = os.getenv("DB_PASSWORD", "Mvlabs")
+CRM_DB_POOL_MIN_SIZE = int(os.getenv("CRM_DB_POOL_MIN_SIZE", 1))
+CRM_DB_POOL_MAX_SIZE = int(os.getenv("CRM_DB_POOL_MAX_SIZE", 10))
+
+DATABASE_URL = (
+    f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+)
+
+# Column names whose C# property name cannot be derived from snake_case alone.
+# ERP.API serializes model properties in camelCase, e.g. IsActive -> "isActive".
+_CAMEL_CASE_OVERRIDES = {
+    "isactive": "isActive",
+    "inactive": "inActive",
+}
+
+_pool: Optional[asyncpg.Pool] = None
+_pool_lock = asyncio.Lock()
+
+async def get_pool() -> asyncpg.Pool:
+    """Returns the shared connection pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        async with _pool_lock:
+            if _pool is None:
+                print(f"[CRM DB Backend] Creating asyncpg pool for {DB_HOST}:{DB_PORT}/{DB_NAME}")
+                _pool = await asyncpg.create_pool(
+                    DATABASE_URL,
+                    min_size=CRM_DB_POOL_MIN_SIZE,
+                    max_size=CRM_DB_POOL_MAX_SIZE,
+                )
+    return _pool
+
+async def close_pool():
+    """Closes the shared connection pool, if it was created."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+def _to_camel_case(column_name: str) -> str:
+    """Converts a snake_case column name to the camelCase key ERP.API would emit."""
+    lowered = column_name.lower()
+    if lowered in _CAMEL_CASE_OVERRIDES:
+        return _CAMEL_CASE_OVERRIDES[lowered]
+    return re.sub(r"_([a-z0-9])", lambda m: m.group(1).upper(), lowered)
+
+def _to_json_value(value: Any) -> Any:
+    """Converts asyncpg values to the JSON-friendly form ERP.API returns."""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+def _record_to_camel_dict(record: asyncpg.Record) -> Dict[str, Any]:
+    return {_to_camel_case(key): _to_json_value(value) for key, value in record.items()}
+
+# --- Queries ---
+# Each query is the same one ERP.API runs for the corresponding endpoint, so the
+# direct path returns the same data as the HTTP path.
+
+async def fetch_leads_by_ids(lead_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """Equivalent of GET /api/SalesLead/{id} for each ID. Missing IDs are absent from the result."""
+    pool = await get_pool()
+    rows = await pool.fetch("SELECT * FROM sales_lead WHERE id = ANY($1::int[])", lead_ids)
+    return {row["id"]: _record_to_camel_dict(row) for row in rows}
+
+async def fetch_lead_by_id(lead_id: int) -> Optional[Dict[str, Any]]:
+    """Equivalent of GET /api/SalesLead/{id}. Returns None when the lead does not exist."""
+    leads = await fetch_leads_by_ids([lead_id])
+    return leads.get(lead_id)
+
+async def fetch_opportunities_by_opportunity_ids(opportunity_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Equivalent of GET /api/SalesOpportunity/{opportunityId} for each ID. Missing IDs are absent from the result."""
+    pool = await get_pool()
+    rows = await pool.fetch(
+        "SELECT * FROM sales_opportunities WHERE opportunity_id = ANY($1::text[]) AND isactive = true",
+        opportunity_ids,
+    )
+    return {row["opportunity_id"]: _record_to_camel_dict(row) for row in rows}
+
+async def fetch_opportunity_by_opportunity_id(opportunity_id: str) -> Optional[Dict[str, Any]]:
+    """Equivalent of GET /api/SalesOpportunity/{opportunityId}. Returns None when not found."""
+    opportunities = await fetch_opportunities_by_opportunity_ids([opportunity_id])
+    return opportunities.get(opportunity_id)
+
+async def fetch_opportunity_card_counts() -> List[Dict[str, Any]]:
+    """Equivalent of GET /api/SalesOpportunity/cards (sp_get_opportunity_cards_count)."""
+    pool = await get_pool()
+    rows = await pool.fetch("SELECT * FROM sp_get_opportunity_cards_count()")
+    return [_record_to_camel_dict(row) for row in rows]
+
+async def fetch_sales_leads_page(
+    zones: Optional[List[str]] = None,
+    customer_names: Optional[List[str]] = None,
+    territories: Optional[List[str]] = None,
+    statuses: Optional[List[str]] = None,
+    scores: Optional[List[str]] = None,
+    lead_types: Optional[List[str]] = None,
+    after_date_created: Optional[datetime] = None,
+    after_id: Optional[int] = None,
+    page_size: int = 20,
+    include_count: bool = False,
+) -> Dict[str, Any]:
+    """
+    One page of the filtered lead grid from fn_get_sales_leads_keyset (Backend_Api/sql/leadGridKeyset.sql).
+    Filters match case-insensitively. Pass the last row's date_created/id to get the next page
+    (date_created may be None: leads without a date come last).
+
+    Returns:
+    {"leads": [...camelCase rows...], "approximateTotal": int or None,
+     "last": (date_created, id) of the final row, or None if the page is empty,
+     "hasMore": whether another page follows}
+    """
+    def _lowered(values: Optional[List[str]]) -> Optional[List[str]]:
+        return [value.lower() for value in values] if values else None
+
+    pool = await get_pool()
+    rows = await pool.fetch(
+        "SELECT * FROM fn_get_sales_leads_keyset($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)",
+        _lowered(zones), _lowered(customer_names), _lowered(territories),
+        _lowered(statuses), _lowered(scores), _lowered(lead_types),
+        # One row beyond the page tells whether another page follows.
+        after_date_created, after_id, page_size + 1, include_count,
+    )
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if rows:
+        approximate_total = rows[0]["approximate_total"]
+    else:
+        approximate_total = 0 if include_count else None
+
+    leads = []
+    for row in rows:
+        lead = _record_to_camel_dict(row)
+        lead.pop("approximateTotal", None)
+        leads.append(lead)
+
+    last = (rows[-1]["date_created"], rows[-1]["id"]) if rows else None
+    return {"leads": leads, "approximateTotal": approximate_total, "last": last, "hasMore": has_more}
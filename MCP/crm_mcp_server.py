@@ -1,21 +1,51 @@
 import os
 import uvicorn
 import aiohttp
+import asyncio
 import json
+from datetime import datetime
 from fastapi import HTTPException, status
+from starlette.requests import Request
+from starlette.responses import JSONResponse
 from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from dotenv import load_dotenv
 
 # Import FastMCP and tool decorator
 from mcp.server.fastmcp import FastMCP
 
+import crm_db_backend
+import crm_resilience
+
 # Load environment variables
 load_dotenv()
 
 # --- Configuration ---
 CRM_API_BASE_URL = "http://localhost:5104"
 CRM_MCP_SERVER_PORT = int(os.getenv("CRM_MCP_SERVER_PORT", 8001))
+# Maximum number of concurrent CRM API requests issued by a single batch tool call.
+CRM_BATCH_CONCURRENCY = int(os.getenv("CRM_BATCH_CONCURRENCY", 5))
+# Upper bound on the number of IDs accepted by a single batch tool call.
+CRM_BATCH_MAX_IDS = int(os.getenv("CRM_BATCH_MAX_IDS", 50))
+
+# Data backend for read-only tools: "http" (via ERP.API) or "db" (direct asyncpg).
+# CRM_DATA_BACKEND sets the default; CRM_TOOL_BACKENDS overrides it per tool,
+# e.g. "get_lead_info=db,get_sales_opportunity_card_counts=db".
+CRM_DATA_BACKEND = os.getenv("CRM_DATA_BACKEND", "http").lower()
+CRM_TOOL_BACKENDS = {
+    tool_name.strip(): backend.strip().lower()
+    for tool_name, _, backend in (
+        entry.partition("=") for entry in os.getenv("CRM_TOOL_BACKENDS", "").split(",") if "=" in entry
+    )
+}
+# Tools that have a direct database implementation in crm_db_backend.
+DB_BACKEND_TOOLS = {
+    "get_lead_info",
+    "get_leads_info_batch",
+    "get_sales_opportunity_by_id",
+    "get_sales_opportunities_by_ids",
+    "get_sales_opportunity_card_counts",
+}
 
 if not CRM_API_BASE_URL:
     raise ValueError("CRM_API_BASE_URL environment variable not set for CRM MCP Server. "
@@ -29,28 +59,65 @@ fastmcp = FastMCP(
 )
 
 # --- Helper for Making Internal API Calls ---
-async def _call_crm_api(method: str, url: str, json_data: Optional[Dict] = None) -> Any:
+async def _send_crm_request(method: str, url: str, json_data: Optional[Dict], session: aiohttp.ClientSession,
+                            timeout: aiohttp.ClientTimeout) -> Any:
+    if method.upper() == "GET":
+        async with session.get(url, params=json_data, timeout=timeout) as response:
+            response.raise_for_status() # Raises an exception for 4xx/5xx responses
+            return await response.json()
+    elif method.upper() == "PUT":
+        async with session.put(url, json=json_data, timeout=timeout) as response:
+            response.raise_for_status()
+            return await response.json()
+    elif method.upper() == "POST":
+        async with session.post(url, json=json_data, timeout=timeout) as response:
+            response.raise_for_status()
+            return await response.json()
+    else:
+        raise ValueError(f"Unsupported HTTP method: {method}")
+
+async def _call_crm_api(method: str, url: str, json_data: Optional[Dict] = None,
+                        session: Optional[aiohttp.ClientSession] = None, tool: Optional[str] = None) -> Any:
     """
     Generic helper to make asynchronous HTTP calls to the CRM API.
+    If a `session` is supplied it is reused (batch tools share one session
+    across all of their requests); otherwise a short-lived session is opened.
+    Each request is bounded by the calling `tool`'s timeout. GETs that time out, cannot
+    connect or get a retryable status are retried with jittered backoff, and an endpoint
+    whose circuit breaker is open fails fast with a 503 instead of being called.
     """
-    async with aiohttp.ClientSession() as session:
+    if session is None:
+        async with aiohttp.ClientSession() as own_session:
+            return await _call_crm_api(method, url, json_data, session=own_session, tool=tool)
+
+    endpoint = crm_resilience.endpoint_key(method, url)
+    breaker = crm_resilience.breaker_for(endpoint)
+    timeout_seconds = crm_resilience.timeout_for(tool)
+    timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+    attempts = 1 + (crm_resilience.CRM_API_GET_RETRIES if method.upper() == "GET" else 0)
+
+    for attempt in range(attempts):
+        if not breaker.allow_request():
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"The CRM API endpoint {endpoint} is currently failing; not calling it for another "
+                       f"{breaker.retry_in():.0f}s."
+            )
+        can_retry = attempt < attempts - 1
         try:
-            if method.upper() == "GET":
-                async with session.get(url, params=json_data) as response:
-                    response.raise_for_status() # Raises an exception for 4xx/5xx responses
-                    return await response.json()
-            elif method.upper() == "PUT":
-                async with session.put(url, json=json_data) as response:
-                    response.raise_for_status()
-                    return await response.json()
-            elif method.upper() == "POST":
-                async with session.post(url, json=json_data) as response:
-                    response.raise_for_status()
-                    return await response.json()
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+            result = await _send_crm_request(method, url, json_data, session, timeout)
+            breaker.record_success()
+            return result
         except aiohttp.ClientResponseError as e:
-            response_text = await e.response.text() if e.response else "N/A"
+            if e.status >= 500 or e.status == 429:
+                breaker.record_failure()
+            else:
+                breaker.record_success() # The API is up; the request itself was rejected
+            if can_retry and e.status in crm_resilience.RETRYABLE_STATUSES:
+                print(f"[CRM MCP Server] {method} {url} returned {e.status}; retrying (attempt {attempt + 2}/{attempts}).")
+                await asyncio.sleep(crm_resilience.retry_delay(attempt))
+                continue
+            response_text = e.message
             print(f"[CRM MCP Server] Error calling CRM API: {method} {url} - Status: {e.status}, Message: {e.message}, Response: {response_text}")
             if e.status == 404:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Resource not found in CRM API at {url}. (Details: {response_text})")
@@ -58,7 +125,23 @@ async def _call_crm_api(method: str, url: str, json_data: Optional[Dict] = None)
                 status_code=e.status,
                 detail=f"CRM API Error: {e.message}. Context: {e.request_info.url}. Response: {response_text}"
             )
+        except asyncio.TimeoutError:
+            breaker.record_failure()
+            if can_retry:
+                print(f"[CRM MCP Server] {method} {url} timed out after {timeout_seconds}s; retrying (attempt {attempt + 2}/{attempts}).")
+                await asyncio.sleep(crm_resilience.retry_delay(attempt))
+                continue
+            print(f"[CRM MCP Server] CRM API timed out: {method} {url} after {timeout_seconds}s")
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail=f"The CRM API at {url} did not respond within {timeout_seconds}s."
+            )
         except aiohttp.ClientConnectionError as e:
+            breaker.record_failure()
+            if can_retry:
+                print(f"[CRM MCP Server] Connection error to CRM API: {url} - {e}; retrying (attempt {attempt + 2}/{attempts}).")
+                await asyncio.sleep(crm_resilience.retry_delay(attempt))
+                continue
             print(f"[CRM MCP Server] Connection error to CRM API: {url} - {e}")
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -71,6 +154,15 @@ async def _call_crm_api(method: str, url: str, json_data: Optional[Dict] = None)
                 detail=f"An unexpected error occurred: {str(e)}"
             )
 
+def _uses_db_backend(tool_name: str) -> bool:
+    """True if `tool_name` should read straight from Postgres instead of calling ERP.API."""
+    backend = CRM_TOOL_BACKENDS.get(tool_name, CRM_DATA_BACKEND)
+    return backend == "db" and tool_name in DB_BACKEND_TOOLS
+
+def _db_not_found(resource: str) -> HTTPException:
+    """The 404 error the HTTP path would have raised for a missing record."""
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{resource} not found in CRM database.")
+
 # --- Input Model for the get_lead_info tool ---
 class GetLeadInfoInput(BaseModel):
     id: int = Field(..., description="The unique integer primary key ID of the lead.")
@@ -92,9 +184,16 @@ async def get_lead_info(input: GetLeadInfoInput) -> Dict[str, Any]:
     A dictionary containing the lead's comprehensive details in camelCase format.
     """
     lead_db_id = input.id
+    if _uses_db_backend("get_lead_info"):
+        print(f"[CRM MCP Server Tool] Reading lead {lead_db_id} directly from the database")
+        lead_data = await crm_db_backend.fetch_lead_by_id(lead_db_id)
+        if lead_data is None:
+            raise _db_not_found(f"Lead with ID {lead_db_id}")
+        return lead_data
+
     api_url = f"{CRM_API_BASE_URL}/api/SalesLead/{lead_db_id}"
     print(f"[CRM MCP Server Tool] Calling CRM API (GET): {api_url} for DB ID {lead_db_id}")
-    lead_data = await _call_crm_api("GET", api_url)
+    lead_data = await _call_crm_api("GET", api_url, tool="get_lead_info")
     return lead_data
 
 # --- Input Model for get_sales_lead_quotations_with_items tool ---
@@ -121,7 +220,7 @@ async def get_sales_lead_quotations_with_items(input: GetSalesLeadQuotationsWith
     api_url = f"{CRM_API_BASE_URL}/api/SalesLead/{lead_human_id}/quotations-with-items"
     print(f"[CRM MCP Server Tool] Calling CRM API (GET): {api_url} for Lead ID {lead_human_id}")
     
-    quotations_data = await _call_crm_api("GET", api_url)
+    quotations_data = await _call_crm_api("GET", api_url, tool="get_sales_lead_quotations_with_items")
     
     return quotations_data
 
@@ -171,10 +270,14 @@ async def get_sales_opportunity_card_counts(input: GetSalesOpportunityCardCounts
       }
     ]
     """
+    if _uses_db_backend("get_sales_opportunity_card_counts"):
+        print("[CRM MCP Server Tool] Reading opportunity card counts directly from the database")
+        return await crm_db_backend.fetch_opportunity_card_counts()
+
     api_url = f"{CRM_API_BASE_URL}/api/SalesOpportunity/cards"
     print(f"[CRM MCP Server Tool] Calling CRM API (GET): {api_url}")
     
-    card_counts_data = await _call_crm_api("GET", api_url)
+    card_counts_data = await _call_crm_api("GET", api_url, tool="get_sales_opportunity_card_counts")
     
     return card_counts_data
 
@@ -207,7 +310,7 @@ async def get_active_opportunities_with_items(input: GetActiveOpportunitiesWithI
     api_url = f"{CRM_API_BASE_URL}/api/SalesOpportunity/with-items"
     print(f"[CRM MCP Server Tool] Calling CRM API (GET): {api_url}")
     
-    opportunities_data = await _call_crm_api("GET", api_url)
+    opportunities_data = await _call_crm_api("GET", api_url, tool="get_active_opportunities_with_items")
     
     return opportunities_data
 
@@ -255,7 +358,7 @@ async def get_opportunity_by_id_with_items(input: GetOpportunityByIdWithItemsInp
     print(f"[CRM MCP Server Tool] Calling CRM API (GET): {api_url} for Opportunity ID {input.id_or_opportunity_id}")
 
     try:
-        opportunity_data = await _call_crm_api("GET", api_url)
+        opportunity_data = await _call_crm_api("GET", api_url, tool="get_opportunity_by_id_with_items")
         return opportunity_data
     except HTTPException as e:
         if e.status_code == status.HTTP_404_NOT_FOUND:
@@ -263,8 +366,6 @@ async def get_opportunity_by_id_with_items(input: GetOpportunityByIdWithItemsInp
             return None
         raise # Re-raise other HTTP exceptions
 
-@fastmcp.tool()
-
 class GetSalesOpportunityInput(BaseModel):
     """Input for retrieving a sales opportunity by its ID."""
     opportunityId: str = Field(
@@ -272,6 +373,7 @@ class GetSalesOpportunityInput(BaseModel):
         description="The unique string identifier of the sales opportunity (e.g., 'OPP00001')."
     )
 
+@fastmcp.tool()
 async def get_sales_opportunity_by_id(input: GetSalesOpportunityInput) -> Dict[str, Any]:
     """
     Retrieves comprehensive details for a specific sales opportunity from the CRM system
@@ -294,18 +396,226 @@ async def get_sales_opportunity_by_id(input: GetSalesOpportunityInput) -> Dict[s
     print(f"[CRM MCP Server Tool] Calling CRM API (GET): {api_url} for Opportunity ID {opportunity_id}")
     
     try:
-        result = await _call_crm_api("GET", api_url)
+        if _uses_db_backend("get_sales_opportunity_by_id"):
+            result = await crm_db_backend.fetch_opportunity_by_opportunity_id(opportunity_id)
+            if result is None:
+                raise _db_not_found(f"Opportunity with ID {opportunity_id}")
+            return result
+        result = await _call_crm_api("GET", api_url, tool="get_sales_opportunity_by_id")
         return result
     except Exception as e:
         print(f"Error calling CRM API for opportunity {opportunity_id}: {e}")
         return {"error": str(e)}
 
 
+# --- Filtered lead listing (keyset-paginated lead grid) ---
+# Always served from the database: fn_get_sales_leads_keyset has no ERP.API endpoint.
+class ListSalesLeadsInput(BaseModel):
+    zones: Optional[List[str]] = Field(None, description="Zone / area names to filter by (e.g., ['South']).")
+    territories: Optional[List[str]] = Field(None, description="Territory names to filter by.")
+    statuses: Optional[List[str]] = Field(None, description="Lead statuses to filter by (e.g., ['Open', 'Qualified']).")
+    scores: Optional[List[str]] = Field(None, description="Lead scores to filter by (e.g., ['Hot', 'Warm']).")
+    lead_types: Optional[List[str]] = Field(None, description="Lead types to filter by.")
+    customer_names: Optional[List[str]] = Field(None, description="Exact customer names to filter by.")
+    page_size: int = Field(20, ge=1, le=100, description="Number of leads to return (1-100).")
+    cursor: Optional[str] = Field(None, description="The 'nextCursor' value from a previous call, to fetch the following page.")
+    include_approximate_count: bool = Field(False, description="Also return an approximate total number of matching leads.")
+
+def _encode_lead_cursor(last: Any) -> Optional[str]:
+    """
+    Encodes the (date_created, id) of the last row of a page as an opaque cursor string.
+    A lead without date_created gets an empty date part.
+    """
+    if last is None:
+        return None
+    date_created, lead_id = last
+    return f"{date_created.isoformat() if date_created is not None else ''}|{lead_id}"
+
+def _decode_lead_cursor(cursor: Optional[str]):
+    if not cursor:
+        return None, None
+    try:
+        date_created, lead_id = cursor.rsplit("|", 1)
+        return (datetime.fromisoformat(date_created) if date_created else None), int(lead_id)
+    except ValueError:
+        raise ValueError(f"Invalid cursor '{cursor}'. Pass the 'nextCursor' value returned by a previous call.")
+
+@fastmcp.tool()
+async def list_sales_leads(input: ListSalesLeadsInput) -> Dict[str, Any]:
+    """
+    Lists active sales leads matching optional filters on zone, territory, status, score, lead type
+    and customer name, newest first, one page at a time.
+    Use this tool for list-style lead questions instead of a database query.
+    Example questions: 'Show open leads in zone South with a hot score', 'List warm leads in the North territory',
+    'How many qualified leads do we have?' (set include_approximate_count).
+
+    Parameters:
+    - zones, territories, statuses, scores, lead_types, customer_names (List[str], optional): Filter values.
+      Values within one filter are OR-ed, different filters are AND-ed. Matching is case-insensitive.
+    - page_size (int, optional): Number of leads per page (default 20, max 100).
+    - cursor (str, optional): 'nextCursor' from the previous page.
+    - include_approximate_count (bool, optional): Return an approximate total of matching leads.
+
+    Returns:
+    A dictionary with 'leads' (list of leads in camelCase format), 'nextCursor' (null when there are
+    no more pages) and 'approximateTotal' (null unless requested).
+    """
+    after_date_created, after_id = _decode_lead_cursor(input.cursor)
+    print(f"[CRM MCP Server Tool] Listing leads with filters {input.model_dump(exclude={'cursor'}, exclude_none=True)}")
+
+    page = await crm_db_backend.fetch_sales_leads_page(
+        zones=input.zones,
+        customer_names=input.customer_names,
+        territories=input.territories,
+        statuses=input.statuses,
+        scores=input.scores,
+        lead_types=input.lead_types,
+        after_date_created=after_date_created,
+        after_id=after_id,
+        page_size=input.page_size,
+        include_count=input.include_approximate_count,
+    )
+    return {
+        "leads": page["leads"],
+        "nextCursor": _encode_lead_cursor(page["last"]) if page["hasMore"] else None,
+        "approximateTotal": page["approximateTotal"],
+    }
+
+# --- Batch lookup tools ---
+# These fan a list of IDs out to the single-record CRM endpoints concurrently,
+# bounded by CRM_BATCH_CONCURRENCY, so a question about several records costs
+# one tool call (and one ReAct iteration) instead of one per record.
+def _unique_batch_ids(ids: List[Any]) -> List[Any]:
+    """Drops duplicate IDs (preserving order) and enforces CRM_BATCH_MAX_IDS."""
+    unique_ids = list(dict.fromkeys(ids))
+    if len(unique_ids) > CRM_BATCH_MAX_IDS:
+        raise ValueError(f"Too many IDs in one batch ({len(unique_ids)}). The maximum is {CRM_BATCH_MAX_IDS}.")
+    return unique_ids
+
+async def _fetch_many(ids: List[Any], build_url: Callable[[Any], str], tool: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Fetches every ID through `build_url` with at most CRM_BATCH_CONCURRENCY requests
+    in flight, sharing one HTTP session. A failing ID never fails the whole batch.
+
+    Returns:
+    {"results": {id: data, ...}, "errors": {id: message, ...}}, keyed by the ID as a string.
+    """
+    unique_ids = _unique_batch_ids(ids)
+
+    semaphore = asyncio.Semaphore(CRM_BATCH_CONCURRENCY)
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+
+    async with aiohttp.ClientSession() as session:
+        async def fetch_one(record_id: Any):
+            key = str(record_id)
+            async with semaphore:
+                try:
+                    results[key] = await _call_crm_api("GET", build_url(record_id), session=session, tool=tool)
+                except HTTPException as e:
+                    errors[key] = f"{e.status_code}: {e.detail}"
+                except Exception as e:
+                    errors[key] = str(e)
+
+        await asyncio.gather(*(fetch_one(record_id) for record_id in unique_ids))
+
+    print(f"[CRM MCP Server] Batch fetch finished: {len(results)} succeeded, {len(errors)} failed.")
+    return {"results": results, "errors": errors}
+
+def _keyed_db_results(ids: List[Any], found: Dict[Any, Dict[str, Any]], resource: str) -> Dict[str, Any]:
+    """Shapes a direct-database batch lookup like _fetch_many, reporting missing IDs as 404 errors."""
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for record_id in _unique_batch_ids(ids):
+        if record_id in found:
+            results[str(record_id)] = found[record_id]
+        else:
+            not_found = _db_not_found(f"{resource} {record_id}")
+            errors[str(record_id)] = f"{not_found.status_code}: {not_found.detail}"
+    return {"results": results, "errors": errors}
+
+class GetLeadsInfoBatchInput(BaseModel):
+    ids: List[int] = Field(..., description="The unique integer primary key IDs of the leads (e.g., [12, 15, 31]).")
+
+@fastmcp.tool()
+async def get_leads_info_batch(input: GetLeadsInfoBatchInput) -> Dict[str, Any]:
+    """
+    Retrieves general contact, status, and high-level details for SEVERAL sales leads in one call.
+    Use this tool instead of calling get_lead_info repeatedly whenever the user asks about more than one lead.
+    Example questions: 'Compare leads 12, 15 and 31', 'Show me the status of leads 4 and 9.'
+
+    Parameters:
+    - ids (List[int]): The unique integer primary key identifiers of the leads.
+
+    Returns:
+    A dictionary with 'results' (lead ID -> lead details in camelCase format) and
+    'errors' (lead ID -> error message for any lead that could not be retrieved).
+    """
+    print(f"[CRM MCP Server Tool] Batch lead lookup for IDs {input.ids}")
+    if _uses_db_backend("get_leads_info_batch"):
+        found = await crm_db_backend.fetch_leads_by_ids(_unique_batch_ids(input.ids))
+        return _keyed_db_results(input.ids, found, "Lead with ID")
+    return await _fetch_many(input.ids, lambda lead_id: f"{CRM_API_BASE_URL}/api/SalesLead/{lead_id}", tool="get_leads_info_batch")
+
+class GetSalesOpportunitiesBatchInput(BaseModel):
+    opportunityIds: List[str] = Field(..., description="The unique string identifiers of the sales opportunities (e.g., ['OPP00001', 'OPP00007']).")
+
+@fastmcp.tool()
+async def get_sales_opportunities_by_ids(input: GetSalesOpportunitiesBatchInput) -> Dict[str, Any]:
+    """
+    Retrieves general information, status, and high-level details for SEVERAL sales opportunities in one call.
+    Use this tool instead of calling get_sales_opportunity_by_id repeatedly whenever the user asks about more than one opportunity.
+    Example questions: 'What is the status of OPP00001 and OPP00004?', 'Compare opportunities OPP00002, OPP00003.'
+
+    Parameters:
+    - opportunityIds (List[str]): The unique string identifiers of the sales opportunities.
+
+    Returns:
+    A dictionary with 'results' (opportunity ID -> opportunity details in camelCase format) and
+    'errors' (opportunity ID -> error message for any opportunity that could not be retrieved).
+    """
+    print(f"[CRM MCP Server Tool] Batch opportunity lookup for IDs {input.opportunityIds}")
+    if _uses_db_backend("get_sales_opportunities_by_ids"):
+        found = await crm_db_backend.fetch_opportunities_by_opportunity_ids(_unique_batch_ids(input.opportunityIds))
+        return _keyed_db_results(input.opportunityIds, found, "Opportunity with ID")
+    return await _fetch_many(input.opportunityIds, lambda opportunity_id: f"{CRM_API_BASE_URL}/api/SalesOpportunity/{opportunity_id}", tool="get_sales_opportunities_by_ids")
+
+class GetOpportunitiesByIdsWithItemsInput(BaseModel):
+    ids_or_opportunity_ids: List[str] = Field(..., description="Integer primary key IDs (e.g., '123') and/or human-readable Opportunity IDs (e.g., 'OP001') of the sales opportunities.")
+
+@fastmcp.tool()
+async def get_opportunities_by_ids_with_items(input: GetOpportunitiesByIdsWithItemsInput) -> Dict[str, Any]:
+    """
+    Retrieves SEVERAL sales opportunities along with their associated product items in one call.
+    Use this tool instead of calling get_opportunity_by_id_with_items repeatedly whenever the user
+    asks for the items or products of more than one opportunity.
+    Example questions: 'What products are in opportunities OP005 and OP009?', 'Show items for opportunities 12, 14 and 20.'
+
+    Parameters:
+    - ids_or_opportunity_ids (List[str]): Identifiers of the sales opportunities. Each can be either
+                                          the integer primary key ID or the human-readable Opportunity ID.
+
+    Returns:
+    A dictionary with 'results' (identifier -> opportunity details and product items in camelCase format) and
+    'errors' (identifier -> error message for any opportunity that could not be retrieved or was not found).
+    """
+    print(f"[CRM MCP Server Tool] Batch opportunity-with-items lookup for IDs {input.ids_or_opportunity_ids}")
+    return await _fetch_many(input.ids_or_opportunity_ids, lambda identifier: f"{CRM_API_BASE_URL}/api/SalesOpportunity/with-items/{identifier}", tool="get_opportunities_by_ids_with_items")
+
+
+# --- CRM API health ---
+# Not an MCP tool (the LLM should not see it): a plain HTTP route next to /mcp that the
+# agent polls so its router can prefer the SQL path while CRM endpoints are failing.
+@fastmcp.custom_route("/health/crm", methods=["GET"])
+async def crm_api_health(request: Request) -> JSONResponse:
+    return JSONResponse(crm_resilience.health_snapshot())
 
 if __name__ == "__main__":
     print(f"[CRM MCP Server] Starting CRM MCP Server on http://localhost:5104")
     print(f"[CRM MCP Server] MCP Context: 'sales'")
-    print(f"[CRM MCP Server] Exposed Tools: get_lead_info, get_sales_lead_quotations_with_items, get_sales_opportunity_card_counts, get_active_opportunities_with_items, get_opportunity_by_id_with_items")
+    print(f"[CRM MCP Server] Default data backend: '{CRM_DATA_BACKEND}', per-tool overrides: {CRM_TOOL_BACKENDS or 'none'}")
+    print(f"[CRM MCP Server] Exposed Tools: get_lead_info, get_sales_lead_quotations_with_items, get_sales_opportunity_card_counts, get_active_opportunities_with_items, get_opportunity_by_id_with_items, "
+          f"get_sales_opportunity_by_id, get_leads_info_batch, get_sales_opportunities_by_ids, get_opportunities_by_ids_with_items, list_sales_leads")
 
     # This runs the FastMCP application
     uvicorn.run(fastmcp.streamable_http_app, host="localhost", port=CRM_MCP_SERVER_PORT)
\ No newline at end of file
@@ -0,0 +1,135 @@
+import os
+import re
+import time
+import random
+from typing import Dict, Any, Optional
+from urllib.parse import urlsplit
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# --- Configuration ---
+# Timeout (seconds) for one CRM API request. CRM_TOOL_TIMEOUTS overrides it per tool,
+# e.g. "get_active_opportunities_with_items=30,get_lead_info=5".
+CRM_API_TIMEOUT_SECONDS = float(os.getenv("CRM_API_TIMEOUT_SECONDS", 10.0))
+CRM_TOOL_TIMEOUTS = {
+    tool_name.strip(): float(seconds)
+    for tool_name, _, seconds in (
+        entry.partition("=") for entry in os.getenv("CRM_TOOL_TIMEOUTS", "").split(",") if "=" in entry
+    )
+}
+# Extra attempts for GET requests that timed out, could not connect or got a retryable status.
+# Other methods are never retried (they may not be idempotent).
+CRM_API_GET_RETRIES = int(os.getenv("CRM_API_GET_RETRIES", 2))
+# Retry n waits a random time in [0, min(MAX, BASE * 2**n)] ("full jitter").
+CRM_API_RETRY_BASE_SECONDS = float(os.getenv("CRM_API_RETRY_BASE_SECONDS", 0.2))
+CRM_API_RETRY_MAX_SECONDS = float(os.getenv("CRM_API_RETRY_MAX_SECONDS", 2.0))
+# Consecutive failures (timeouts, connection errors, 5xx) that open an endpoint's circuit.
+CRM_BREAKER_FAILURE_THRESHOLD = int(os.getenv("CRM_BREAKER_FAILURE_THRESHOLD", 5))
+# How long an open circuit fails fast before letting one trial request through.
+CRM_BREAKER_RESET_SECONDS = float(os.getenv("CRM_BREAKER_RESET_SECONDS", 30.0))
+
+# Statuses worth retrying: the request was not (fully) processed, or the API asked us to back off.
+RETRYABLE_STATUSES = {429, 502, 503, 504}
+
+# Path segments that identify a record rather than a resource (IDs like 123, LD00049, OPP00001).
+_ID_SEGMENT = re.compile(r"^(?=.*\d)[A-Za-z]{0,5}\d+$|^[0-9a-fA-F-]{32,36}$")
+
+def timeout_for(tool_name: Optional[str]) -> float:
+    """The per-request timeout for `tool_name` (the default when it has no override)."""
+    return CRM_TOOL_TIMEOUTS.get(tool_name or "", CRM_API_TIMEOUT_SECONDS)
+
+def retry_delay(retry_number: int) -> float:
+    """Jittered exponential backoff before retry `retry_number` (0-based)."""
+    return random.uniform(0, min(CRM_API_RETRY_MAX_SECONDS, CRM_API_RETRY_BASE_SECONDS * (2 ** retry_number)))
+
+def endpoint_key(method: str, url: str) -> str:
+    """Groups requests by endpoint: 'GET /api/SalesLead/{id}' for every lead ID."""
+    segments = ["{id}" if _ID_SEGMENT.match(segment) else segment for segment in urlsplit(url).path.split("/")]
+    return f"{method.upper()} {'/'.join(segments)}"
+
+class CircuitBreaker:
+    """
+    Per-endpoint breaker. Closed: requests flow and consecutive failures are counted.
+    Open (after CRM_BREAKER_FAILURE_THRESHOLD failures): requests fail fast for
+    CRM_BREAKER_RESET_SECONDS. Half-open: one trial request is let through; its success
+    closes the circuit, its failure opens it again.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, endpoint: str, failure_threshold: int = CRM_BREAKER_FAILURE_THRESHOLD,
+                 reset_seconds: float = CRM_BREAKER_RESET_SECONDS):
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        # When the half-open trial request started (None = no trial running). A trial that never
+        # reports back (e.g. its caller was cancelled) stops blocking others after reset_seconds.
+        self._trial_started: Optional[float] = None
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit lets a trial request through."""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.opened_at + self.reset_seconds - time.monotonic())
+
+    def allow_request(self) -> bool:
+        now = time.monotonic()
+        if self.state == self.OPEN and self.retry_in() == 0.0:
+            self.state = self.HALF_OPEN
+            self._trial_started = None
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.HALF_OPEN and (
+                self._trial_started is None or now - self._trial_started >= self.reset_seconds):
+            self._trial_started = now
+            return True
+        return False
+
+    def record_success(self):
+        if self.state != self.CLOSED:
+            print(f"[CRM MCP Server] Circuit for {self.endpoint} closed again.")
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._trial_started = None
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        self._trial_started = None
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                print(f"[CRM MCP Server] Circuit for {self.endpoint} opened after "
+                      f"{self.consecutive_failures} consecutive failures.")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_in_seconds": round(self.retry_in(), 1),
+        }
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+def breaker_for(endpoint: str) -> CircuitBreaker:
+    """Returns the process-wide breaker for `endpoint`, creating it on first use."""
+    breaker = _breakers.get(endpoint)
+    if breaker is None:
+        breaker = _breakers[endpoint] = CircuitBreaker(endpoint)
+    return breaker
+
+def health_snapshot() -> Dict[str, Any]:
+    """
+    CRM API health as seen by the breakers: healthy unless some endpoint's circuit is open
+    or half-open. Served at /health/crm so the agent's router can avoid the CRM path.
+    """
+    endpoints = {endpoint: breaker.snapshot() for endpoint, breaker in _breakers.items()}
+    unhealthy = sorted(endpoint for endpoint, state in endpoints.items() if state["state"] != CircuitBreaker.CLOSED)
+    return {"healthy": not unhealthy, "unhealthy_endpoints": unhealthy, "endpoints": endpoints}
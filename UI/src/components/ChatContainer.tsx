@@ -19,6 +19,8 @@ const ChatContainer: React.FC = () => {
     },
   ]);
   const [isLoading, setIsLoading] = useState<boolean>(false);
+  // The backend keeps the conversation history for this session, so only the new query is sent.
+  const sessionIdRef = useRef<string>(uuidv4());
   const messagesEndRef = useRef<HTMLDivElement>(null);
 
   const scrollToBottom = () => {
@@ -46,6 +48,7 @@ const ChatContainer: React.FC = () => {
         },
         body: JSON.stringify({
           query: text,
+          session_id: sessionIdRef.current,
           include_sql: true,
           include_results: true,
         }),